@@ -0,0 +1,51 @@
+"""
+공용 pytest 픽스처.
+
+session_factory 는 기본적으로 테스트마다 임시 SQLite 파일을 쓴다. TEST_DATABASE_URL 로 PostgreSQL 등
+실제 DB를 지정할 수 있지만, 시작·종료 때 전체 테이블을 지우므로 이름에 "test" 가 들어간 전용 DB만 허용한다.
+"""
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+
+import app.domains.task.models  # noqa: F401  users 관계 대상 테이블 등록
+import app.infrastructure.chain.models  # noqa: F401
+
+
+def _test_database_url(tmp_path) -> str:
+    url = os.getenv("TEST_DATABASE_URL")
+    if not url:
+        return f"sqlite:///{tmp_path / 'test.db'}"
+    database = os.path.basename(make_url(url).database or "")
+    if "test" not in database.lower():
+        pytest.fail(
+            f"TEST_DATABASE_URL 의 DB 이름({database!r})에 'test' 가 없습니다 — 테이블을 모두 지우므로 전용 테스트 DB만 허용합니다.",
+            pytrace=False,
+        )
+    if url == os.getenv("DATABASE_URL"):
+        pytest.fail("TEST_DATABASE_URL 이 DATABASE_URL 과 같습니다 — 전용 테스트 DB를 지정하세요.", pytrace=False)
+    return url
+
+
+@pytest.fixture
+def engine_options() -> dict:
+    """create_engine 추가 인자. 커넥션이 많이 필요한 테스트 모듈에서 재정의한다."""
+    return {}
+
+
+@pytest.fixture
+def session_factory(tmp_path, engine_options):
+    """빈 스키마의 DB에 바인딩된 sessionmaker."""
+    url = _test_database_url(tmp_path)
+    connect_args = {"check_same_thread": False, "timeout": 30} if url.startswith("sqlite") else {}
+    engine = create_engine(url, connect_args=connect_args, **engine_options)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine)
+    Base.metadata.drop_all(engine)
+    engine.dispose()
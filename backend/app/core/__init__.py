@@ -0,0 +1 @@
+"""코어 패키지. DB·Redis·HTTP 클라이언트·캐시 등 도메인 공통 인프라."""
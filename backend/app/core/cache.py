@@ -0,0 +1,79 @@
+"""
+프로세스 내 LRU + TTL 캐시.
+Redis 앞단(L1) 또는 Redis 미사용 시 단독 캐시로 사용한다.
+스레드 세이프하며 hit/miss 카운터를 노출한다.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    최대 max_size 항목을 유지하는 LRU 캐시. 각 항목은 ttl_seconds 후 만료된다.
+    워커 프로세스마다 독립적이므로 다른 워커의 무효화는 TTL 경과 후에 반영된다.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 60.0) -> None:
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """값을 반환한다. 없거나 만료되었으면 default."""
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING or item[0] <= now:
+                if item is not _MISSING:
+                    del self._data[key]
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return item[1]
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: float | None = None) -> None:
+        """값을 저장한다. ttl_seconds 미지정 시 기본 TTL."""
+        expires_at = time.monotonic() + (self._ttl if ttl_seconds is None else ttl_seconds)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._max_size:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def delete(self, key: Hashable) -> bool:
+        """항목을 제거한다. 존재했으면 True."""
+        with self._lock:
+            return self._data.pop(key, _MISSING) is not _MISSING
+
+    def delete_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """predicate(key)가 참인 항목을 모두 제거하고 제거 수를 반환한다."""
+        with self._lock:
+            keys = [k for k in self._data if predicate(k)]
+            for k in keys:
+                del self._data[k]
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict[str, int]:
+        """hit/miss/eviction 카운터와 현재 크기."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._data),
+                "max_size": self._max_size,
+            }
@@ -1,12 +1,33 @@
 """
-SQLAlchemy 동기 엔진 및 세션 팩토리.
+SQLAlchemy 동기/비동기 엔진 및 세션 팩토리.
 DATABASE_URL 환경 변수가 없으면 프로젝트 루트의 SQLite 파일을 기본값으로 사용한다.
+비동기 엔진은 같은 URL을 async 드라이버(aiosqlite / asyncpg)로 변환해 사용하며,
+ASYNC_DATABASE_URL 로 별도 지정할 수 있다.
+
+요청 범위 세션: RequestDBMiddleware 가 요청마다 RequestDBScope 를 contextvar 에 두면
+get_db / get_async_db 는 요청 세션(요청 트랜잭션의 소유자)을 돌려주고, 서비스의 session_scope /
+async_session_scope 는 같은 커넥션 위의 SAVEPOINT 세션을 빌려 준다. 빌린 세션의 commit·rollback 은
+SAVEPOINT 에만 적용되므로 서비스 실패가 라우터의 미커밋 작업을 취소하거나 중간에 커밋하지 않는다.
+커넥션은 엔진별로 요청당 한 번만 체크아웃되며 그 수는 RequestDBScope.checkouts 로 집계된다.
+요청 밖(스케줄러·스크립트)에서는 기존처럼 호출마다 새 세션을 열고 닫는다.
 """
+import asyncio
 import os
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from pathlib import Path
+from typing import AsyncIterator, Iterator
 
-from sqlalchemy import create_engine
+from sqlalchemy import Connection, create_engine, event, inspect, text
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.schema import CreateColumn
 
 _DEFAULT_DB_PATH = Path(__file__).resolve().parents[2] / "data" / "100pro.db"
 
@@ -18,17 +39,55 @@ Base = declarative_base()
 _engine = None
 _SessionLocal: sessionmaker[Session] | None = None
 
+_async_engine: AsyncEngine | None = None
+_AsyncSessionLocal: async_sessionmaker[AsyncSession] | None = None
+
+# 동기 드라이버 스킴 → 비동기 드라이버 스킴
+_ASYNC_DRIVER_MAP = {
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+}
+
 
 def _get_url() -> str:
     return os.getenv("DATABASE_URL", f"sqlite:///{_DEFAULT_DB_PATH}")
 
 
+def _get_async_url() -> str:
+    """ASYNC_DATABASE_URL 우선, 없으면 DATABASE_URL의 드라이버를 async 드라이버로 치환한다."""
+    explicit = os.getenv("ASYNC_DATABASE_URL")
+    if explicit:
+        return explicit
+    url = _get_url()
+    scheme, sep, rest = url.partition("://")
+    return f"{_ASYNC_DRIVER_MAP.get(scheme, scheme)}{sep}{rest}"
+
+
+def dialect_insert(bind, table):
+    """
+    bind(엔진/세션)의 방언에 맞는 INSERT 구문을 반환한다.
+    ON CONFLICT(upsert)를 쓰기 위해 SQLite / PostgreSQL 전용 insert를 고른다.
+    """
+    dialect = bind.get_bind().dialect.name if hasattr(bind, "get_bind") else bind.dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"ON CONFLICT 미지원 방언: {dialect}")
+    return insert(table)
+
+
 def get_engine():
     global _engine
     if _engine is None:
         url = _get_url()
         connect_args = {"check_same_thread": False} if url.startswith("sqlite") else {}
         _engine = create_engine(url, echo=False, connect_args=connect_args)
+        event.listen(_engine, "checkout", _count_checkout)
     return _engine
 
 
@@ -39,15 +98,220 @@ def get_session_factory() -> sessionmaker[Session]:
     return _SessionLocal
 
 
+def get_async_engine() -> AsyncEngine:
+    """비동기 엔진 싱글톤. 요청 동시성이 스레드풀 크기에 묶이지 않도록 async 라우터에서 사용한다."""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(_get_async_url(), echo=False, pool_pre_ping=True)
+        event.listen(_async_engine.sync_engine, "checkout", _count_checkout)
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    AsyncSession 팩토리. expire_on_commit=False 로 두어 commit 이후에도
+    응답 직렬화 시 lazy load(= 이벤트 루프 밖 I/O)가 일어나지 않게 한다.
+    """
+    global _AsyncSessionLocal
+    if _AsyncSessionLocal is None:
+        _AsyncSessionLocal = async_sessionmaker(
+            bind=get_async_engine(), autoflush=False, expire_on_commit=False
+        )
+    return _AsyncSessionLocal
+
+
+class RequestDBScope:
+    """
+    요청 하나가 공유하는 DB 자원 (unit-of-work).
+    엔진별 커넥션은 처음 쓰일 때 한 번만 체크아웃해 요청이 끝날 때까지 붙잡아 두고,
+    세션은 그 커넥션에 바인딩한다. 중간 commit 은 같은 커넥션에서 다음 트랜잭션을 연다.
+    """
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self._connection: Connection | None = None
+        self._session: Session | None = None
+        self._async_connection: AsyncConnection | None = None
+        self._async_session: AsyncSession | None = None
+
+    def session(self) -> Session:
+        if self._session is None:
+            self._connection = get_engine().connect()
+            self._session = get_session_factory()(bind=self._connection)
+        return self._session
+
+    async def async_session(self) -> AsyncSession:
+        if self._async_session is None:
+            self._async_connection = await get_async_engine().connect()
+            self._async_session = get_async_session_factory()(bind=self._async_connection)
+        return self._async_session
+
+    @contextmanager
+    def borrow(self) -> Iterator[Session]:
+        """
+        요청 커넥션 위의 SAVEPOINT 세션. 요청 세션의 변경을 먼저 flush 해 서비스가 볼 수 있게 한다.
+        commit 은 SAVEPOINT 해제, 예외·rollback·커밋 없이 닫기는 SAVEPOINT 까지만 되돌린다.
+        """
+        self.session().flush()
+        session = get_session_factory()(bind=self._connection, join_transaction_mode="create_savepoint")
+        try:
+            yield session
+        except BaseException:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    @asynccontextmanager
+    async def borrow_async(self) -> AsyncIterator[AsyncSession]:
+        """borrow 의 AsyncSession 변형."""
+        await (await self.async_session()).flush()
+        session = get_async_session_factory()(
+            bind=self._async_connection, join_transaction_mode="create_savepoint"
+        )
+        try:
+            yield session
+        except BaseException:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+    def _close_sync(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._connection.close()
+            self._session = self._connection = None
+
+    async def close(self) -> None:
+        """커밋되지 않은 작업은 롤백하고 커넥션을 풀에 반납한다."""
+        if self._session is not None:
+            await asyncio.to_thread(self._close_sync)
+        if self._async_session is not None:
+            await self._async_session.close()
+            await self._async_connection.close()
+            self._async_session = self._async_connection = None
+
+
+_request_scope: ContextVar[RequestDBScope | None] = ContextVar("request_db_scope", default=None)
+
+
+def _count_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+    scope = _request_scope.get()
+    if scope is not None:
+        scope.checkouts += 1
+
+
+@asynccontextmanager
+async def request_db_scope() -> AsyncIterator[RequestDBScope]:
+    """요청 범위 세션을 연다. 미들웨어에서 요청당 1회 사용한다."""
+    scope = RequestDBScope()
+    token = _request_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _request_scope.reset(token)
+        await scope.close()
+
+
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """
+    동기 Session 컨텍스트. 요청 범위 세션이 있으면 같은 커넥션의 SAVEPOINT 세션을 빌려 주고
+    (RequestDBScope.borrow), 없으면 새 세션을 열고 닫는다. 어느 쪽이든 커밋하지 않은 작업은 닫을 때 버려진다.
+    """
+    scope = _request_scope.get()
+    if scope is None:
+        with get_session_factory()() as session:
+            yield session
+        return
+    with scope.borrow() as session:
+        yield session
+
+
+@asynccontextmanager
+async def async_session_scope() -> AsyncIterator[AsyncSession]:
+    """session_scope 의 AsyncSession 변형."""
+    scope = _request_scope.get()
+    if scope is None:
+        async with get_async_session_factory()() as session:
+            yield session
+        return
+    async with scope.borrow_async() as session:
+        yield session
+
+
+def get_db() -> Iterator[Session]:
+    """FastAPI 의존성: 요청 범위 동기 Session. 요청 트랜잭션의 commit 은 라우터가 한다. 예외 시 롤백."""
+    scope = _request_scope.get()
+    if scope is None:
+        with get_session_factory()() as session:
+            yield session
+        return
+    session = scope.session()
+    try:
+        yield session
+    except BaseException:
+        session.rollback()
+        raise
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """FastAPI 의존성: 요청 범위 AsyncSession. 요청 트랜잭션의 commit 은 라우터가 한다. 예외 시 롤백."""
+    scope = _request_scope.get()
+    if scope is None:
+        async with get_async_session_factory()() as session:
+            yield session
+        return
+    session = await scope.async_session()
+    try:
+        yield session
+    except BaseException:
+        await session.rollback()
+        raise
+
+
+async def dispose_async_engine() -> None:
+    """비동기 엔진 커넥션 풀을 정리한다. 앱 종료 시 1회 호출."""
+    global _async_engine, _AsyncSessionLocal
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _AsyncSessionLocal = None
+
+
 def init_db() -> None:
-    """모든 모델 테이블을 생성한다. 앱 시작 시 1회 호출."""
+    """모든 모델 테이블과 인덱스를 생성한다(이미 있으면 건너뜀). 앱 시작 시 1회 호출."""
     import app.domains.auth.models  # noqa: F401
     import app.domains.task.models  # noqa: F401
     import app.domains.TodayFocus.today_focus.session_log  # noqa: F401 [PM-TF-INF-01]
     import app.infrastructure.task_archive.models  # noqa: F401
+    import app.infrastructure.task_miss.models  # noqa: F401
     import app.infrastructure.task_tracking.models  # noqa: F401
     import app.infrastructure.task_params.models  # noqa: F401
     import app.infrastructure.experiment_config.config  # noqa: F401
     import app.infrastructure.trigger_config.settings  # noqa: F401
     import app.infrastructure.chain.models  # noqa: F401 [PRO-B-41]
-    Base.metadata.create_all(bind=get_engine())
+    engine = get_engine()
+    Base.metadata.create_all(bind=engine)
+    # create_all 은 이미 존재하는 테이블에 새로 추가된 인덱스를 만들지 않으므로 따로 보장한다.
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+    _add_missing_columns(engine)
+
+
+def _add_missing_columns(engine) -> None:
+    """
+    create_all 은 기존 테이블에 새 컬럼도 추가하지 않으므로, 나중에 추가된 컬럼 중
+    기존 행에 채울 수 있는 것(nullable 또는 server_default 가 있는 컬럼)을 ALTER TABLE 로 보장한다.
+    """
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing or (not column.nullable and column.server_default is None):
+                    continue
+                spec = CreateColumn(column).compile(dialect=engine.dialect)
+                conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {spec}"))
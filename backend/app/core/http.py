@@ -0,0 +1,112 @@
+"""
+외부 API 호출용 공유 httpx.AsyncClient.
+앱 수명 동안 하나의 커넥션 풀(keep-alive, 가능하면 HTTP/2)을 재사용해
+요청마다 TCP+TLS 핸드셰이크가 반복되지 않게 한다. main.lifespan 에서 생성·종료한다.
+
+- 타임아웃/풀 크기는 HTTP_CLIENT_* 환경 변수로 조정한다.
+- 외부 API base URL(KAKAO_*_BASE)도 여기서 한 번만 읽는다 — 호출하는 모듈마다 다시 정의하지 않는다.
+- request_with_retry: 연결 단계 실패는 항상, 응답 대기 중 실패·5xx는 idempotent 요청만
+  지수 백오프로 재시도한다 (인가 코드 교환처럼 1회성 POST가 중복 전송되지 않도록).
+"""
+import asyncio
+import importlib.util
+import logging
+import os
+import random
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# 로컬 목 서버(scripts/mock_kakao_server.py)로 테스트할 수 있도록 환경 변수로 재정의 가능
+KAKAO_AUTH_BASE = os.getenv("KAKAO_AUTH_BASE", "https://kauth.kakao.com")
+KAKAO_API_BASE = os.getenv("KAKAO_API_BASE", "https://kapi.kakao.com")
+
+HTTP_CLIENT_CONNECT_TIMEOUT = float(os.getenv("HTTP_CLIENT_CONNECT_TIMEOUT", "3"))
+HTTP_CLIENT_READ_TIMEOUT = float(os.getenv("HTTP_CLIENT_READ_TIMEOUT", "5"))
+HTTP_CLIENT_POOL_TIMEOUT = float(os.getenv("HTTP_CLIENT_POOL_TIMEOUT", "2"))
+HTTP_CLIENT_MAX_CONNECTIONS = int(os.getenv("HTTP_CLIENT_MAX_CONNECTIONS", "50"))
+HTTP_CLIENT_MAX_KEEPALIVE = int(os.getenv("HTTP_CLIENT_MAX_KEEPALIVE", "20"))
+HTTP_CLIENT_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_CLIENT_KEEPALIVE_EXPIRY", "30"))
+HTTP_CLIENT_RETRIES = int(os.getenv("HTTP_CLIENT_RETRIES", "2"))
+HTTP_CLIENT_BACKOFF_SECONDS = float(os.getenv("HTTP_CLIENT_BACKOFF_SECONDS", "0.2"))
+# HTTP/2는 h2 패키지(httpx[http2])가 있을 때만 사용한다.
+HTTP_CLIENT_HTTP2 = (
+    os.getenv("HTTP_CLIENT_HTTP2", "true").lower() in ("true", "1", "yes")
+    and importlib.util.find_spec("h2") is not None
+)
+
+_RETRYABLE_STATUS = {502, 503, 504}
+# 요청이 서버에 전달되기 전에 실패한 경우 — 어떤 메서드든 재시도해도 안전하다.
+_CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+_client: httpx.AsyncClient | None = None
+
+
+def build_timeout() -> httpx.Timeout:
+    return httpx.Timeout(
+        HTTP_CLIENT_READ_TIMEOUT,
+        connect=HTTP_CLIENT_CONNECT_TIMEOUT,
+        pool=HTTP_CLIENT_POOL_TIMEOUT,
+    )
+
+
+def build_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=HTTP_CLIENT_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_CLIENT_MAX_KEEPALIVE,
+        keepalive_expiry=HTTP_CLIENT_KEEPALIVE_EXPIRY,
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """공유 AsyncClient. lifespan 밖(스크립트 등)에서 호출되면 지연 생성한다."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(timeout=build_timeout(), limits=build_limits(), http2=HTTP_CLIENT_HTTP2)
+    return _client
+
+
+async def close_http_client() -> None:
+    """공유 클라이언트의 커넥션 풀을 닫는다. 앱 종료 시 1회 호출."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def request_with_retry(
+    method: str,
+    url: str,
+    *,
+    idempotent: bool | None = None,
+    retries: int = HTTP_CLIENT_RETRIES,
+    backoff_seconds: float = HTTP_CLIENT_BACKOFF_SECONDS,
+    **kwargs,
+) -> httpx.Response:
+    """
+    공유 클라이언트로 요청하고, 일시적 실패 시 지수 백오프(+지터)로 최대 retries 회 재시도한다.
+    idempotent 미지정 시 GET/HEAD/OPTIONS 만 idempotent 로 본다.
+    마지막 시도의 응답(5xx 포함)을 반환하거나, 전송 오류를 그대로 던진다.
+    """
+    if idempotent is None:
+        idempotent = method.upper() in ("GET", "HEAD", "OPTIONS")
+    client = get_http_client()
+    for attempt in range(retries + 1):
+        last = attempt == retries
+        try:
+            resp = await client.request(method, url, **kwargs)
+        except _CONNECT_ERRORS:
+            if last:
+                raise
+            logger.warning("HTTP 연결 실패, 재시도 %d/%d: %s %s", attempt + 1, retries, method, url)
+        except httpx.TransportError:
+            if last or not idempotent:
+                raise
+            logger.warning("HTTP 전송 오류, 재시도 %d/%d: %s %s", attempt + 1, retries, method, url)
+        else:
+            if last or not idempotent or resp.status_code not in _RETRYABLE_STATUS:
+                return resp
+            logger.warning("HTTP %d 응답, 재시도 %d/%d: %s %s", resp.status_code, attempt + 1, retries, method, url)
+        await asyncio.sleep(backoff_seconds * (2 ** attempt) * (0.5 + random.random()))
+    raise AssertionError("unreachable")
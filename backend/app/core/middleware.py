@@ -0,0 +1,34 @@
+"""
+요청 범위 DB 세션 미들웨어.
+요청마다 RequestDBScope 를 열어 라우터·서비스·리포지토리가 같은 세션/커넥션을 쓰게 하고,
+이번 요청에서 풀 커넥션을 체크아웃한 횟수를 X-DB-Checkouts 응답 헤더로 노출한다.
+(동기·비동기 엔진을 모두 쓰는 요청은 엔진별 1회씩 2가 될 수 있다.)
+"""
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.database import request_db_scope
+
+DB_CHECKOUTS_HEADER = "X-DB-Checkouts"
+
+
+class RequestDBMiddleware:
+    """순수 ASGI 미들웨어 — contextvar 가 엔드포인트·의존성·스레드풀까지 전달된다."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async with request_db_scope() as db_scope:
+
+            async def send_with_checkouts(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = list(message.get("headers", []))
+                    headers.append((DB_CHECKOUTS_HEADER.lower().encode(), str(db_scope.checkouts).encode()))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_with_checkouts)
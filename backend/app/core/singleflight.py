@@ -0,0 +1,87 @@
+"""
+키 단위 single-flight (요청 병합).
+캐시 미스 직후 같은 키로 동시에 들어온 재계산을 한 번만 실행하고, 나머지 호출자는 그 결과(또는 예외)를 함께 받는다.
+
+- do(): 스레드용. 첫 호출자가 실행하고, 같은 키의 동시 호출자는 완료까지 기다린다.
+- do_async(): asyncio 용. 이벤트 루프마다 키당 Task 하나를 공유하며, 호출자가 취소돼도 공유 작업은 계속된다.
+- 결과를 보관하지 않는다 — 실행이 끝나면 키를 지우므로 이후 호출은 캐시를 다시 확인하게 된다.
+"""
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """같은 키의 동시 호출을 하나의 실행으로 합친다. 스레드·asyncio 양쪽에서 안전하다."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._tasks: dict[tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task] = {}
+        self._executed = 0
+        self._shared = 0
+
+    def do(self, key: Hashable, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """key 로 진행 중인 실행이 있으면 그 결과를 기다리고, 없으면 fn(*args, **kwargs) 를 실행한다."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._executed += 1
+            else:
+                self._shared += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key: Hashable, fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """do() 의 asyncio 변형. fn 은 코루틴 함수이며 현재 루프의 Task 로 한 번만 실행된다."""
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, key)
+        with self._lock:
+            task = self._tasks.get(flight_key)
+            if task is None:
+                task = self._tasks[flight_key] = loop.create_task(fn(*args, **kwargs))
+                task.add_done_callback(lambda t: self._forget(flight_key, t))
+                self._executed += 1
+            else:
+                self._shared += 1
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict[str, int]:
+        """실행 수, 다른 호출의 결과를 공유받은 수, 현재 진행 중인 키 수."""
+        with self._lock:
+            return {
+                "executed": self._executed,
+                "shared": self._shared,
+                "in_flight": len(self._calls) + len(self._tasks),
+            }
+
+    def _forget(self, flight_key: tuple[asyncio.AbstractEventLoop, Hashable], task: asyncio.Task) -> None:
+        with self._lock:
+            if self._tasks.get(flight_key) is task:
+                del self._tasks[flight_key]
@@ -0,0 +1,51 @@
+"""request_with_retry 재시도 규칙 테스트: 목 Kakao 서버(scripts/mock_kakao_server)의 503 응답으로 검증한다."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.core import http
+from scripts.mock_kakao_server import build_app
+
+TOKEN_FORM = {"grant_type": "authorization_code", "client_id": "mock", "code": "abc"}
+
+
+@pytest.fixture
+def mock_kakao(monkeypatch):
+    """공유 클라이언트를 목 서버에 연결된 ASGI 클라이언트로 바꿔 끼운다."""
+
+    def install(**options) -> None:
+        transport = httpx.ASGITransport(app=build_app(**options))
+        monkeypatch.setattr(http, "_client", httpx.AsyncClient(transport=transport))
+
+    yield install
+    asyncio.run(http.close_http_client())
+
+
+def _request(method: str, path: str, **kwargs) -> httpx.Response:
+    return asyncio.run(
+        http.request_with_retry(method, f"http://kakao.mock{path}", retries=2, backoff_seconds=0, **kwargs)
+    )
+
+
+def test_get_is_retried_on_503(mock_kakao):
+    mock_kakao(fail_first=2)
+    resp = _request("GET", "/v2/user/me", headers={"Authorization": "Bearer mock-access-abc"})
+    assert resp.status_code == 200
+    assert resp.json()["kakao_account"]["email"] == "abc@kakao.mock"
+
+
+def test_get_gives_up_after_retries(mock_kakao):
+    mock_kakao(fail_first=3)
+    assert _request("GET", "/v2/user/me").status_code == 503
+    assert _request("GET", "/v2/user/me").status_code == 200
+
+
+def test_token_post_is_not_retried(mock_kakao):
+    mock_kakao(fail_token_first=1)
+    assert _request("POST", "/oauth/token", data=TOKEN_FORM).status_code == 503
+    # 첫 요청이 한 번만 전송됐다면 다음 교환은 바로 성공한다
+    resp = _request("POST", "/oauth/token", data=TOKEN_FORM)
+    assert resp.status_code == 200
+    assert resp.json()["access_token"] == "mock-access-abc"
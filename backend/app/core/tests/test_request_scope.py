@@ -0,0 +1,91 @@
+"""요청 범위 세션에서 빌린 session_scope / async_session_scope 의 SAVEPOINT 격리 테스트."""
+
+import asyncio
+
+import pytest
+from sqlalchemy import select
+
+from app.core import database
+from app.domains.auth.models import User
+
+import app.domains.task.models  # noqa: F401  users 관계 대상 테이블 등록
+import app.infrastructure.chain.models  # noqa: F401
+
+
+@pytest.fixture
+def request_engine(tmp_path, monkeypatch):
+    """임시 SQLite 파일로 전역 엔진·세션 팩토리를 바꿔 끼운다."""
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'scope.db'}")
+    monkeypatch.delenv("ASYNC_DATABASE_URL", raising=False)
+    for name in ("_engine", "_SessionLocal", "_async_engine", "_AsyncSessionLocal"):
+        monkeypatch.setattr(database, name, None)
+    database.Base.metadata.create_all(database.get_engine())
+    yield
+    asyncio.run(database.dispose_async_engine())
+    database.get_engine().dispose()
+
+
+def _emails() -> list[str]:
+    with database.get_session_factory()() as session:
+        return sorted(session.scalars(select(User.email)).all())
+
+
+def _user(email: str) -> User:
+    return User(email=email, name=email, provider="email")
+
+
+def test_swallowed_service_error_keeps_router_work(request_engine):
+    async def run():
+        async with database.request_db_scope():
+            dependency = database.get_db()
+            owner = next(dependency)
+            owner.add(_user("router"))
+            try:
+                with database.session_scope() as session:
+                    session.add(_user("service"))
+                    session.flush()
+                    raise RuntimeError("service failure")
+            except RuntimeError:
+                pass
+            owner.commit()
+
+    asyncio.run(run())
+    assert _emails() == ["router"]
+
+
+def test_service_commit_does_not_commit_router_transaction(request_engine):
+    async def run():
+        async with database.request_db_scope():
+            dependency = database.get_db()
+            owner = next(dependency)
+            owner.add(_user("router"))
+            with database.session_scope() as session:
+                assert session.scalar(select(User.email).where(User.email == "router")) == "router"
+                session.add(_user("service"))
+                session.commit()
+            owner.rollback()
+
+    asyncio.run(run())
+    assert _emails() == []
+
+
+def test_async_borrowed_session_is_isolated(request_engine):
+    async def run():
+        async with database.request_db_scope():
+            dependency = database.get_async_db()
+            owner = await dependency.__anext__()
+            owner.add(_user("router"))
+            try:
+                async with database.async_session_scope() as session:
+                    session.add(_user("failed"))
+                    await session.flush()
+                    raise RuntimeError("service failure")
+            except RuntimeError:
+                pass
+            async with database.async_session_scope() as session:
+                session.add(_user("service"))
+                await session.commit()
+            await owner.commit()
+
+    asyncio.run(run())
+    assert _emails() == ["router", "service"]
@@ -0,0 +1,120 @@
+"""single-flight 요청 병합 테스트: 동시 캐시 미스 100건에서 DB 조회가 1회만 실행되는지 검증한다."""
+
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from app.core.singleflight import SingleFlight
+from app.domains.auth.models import User
+from app.infrastructure.task_miss.models import UserMissCount
+from app.infrastructure.task_miss.service import impl as miss_impl
+
+import app.infrastructure.chain.models  # noqa: F401  users 관계 대상 테이블 등록
+
+WORKERS = 100
+
+
+def _run_concurrently(fn, n: int = WORKERS) -> tuple[list, list[BaseException]]:
+    barrier = threading.Barrier(n)
+    results: list = []
+    errors: list[BaseException] = []
+    lock = threading.Lock()
+
+    def worker():
+        barrier.wait()
+        try:
+            value = fn()
+        except BaseException as e:
+            with lock:
+                errors.append(e)
+            return
+        with lock:
+            results.append(value)
+
+    threads = [threading.Thread(target=worker) for _ in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results, errors
+
+
+def test_concurrent_miss_count_misses_run_one_query(session_factory, monkeypatch):
+    """캐시가 빈 상태에서 같은 사용자 조회 100건이 동시에 와도 카운터 조회 쿼리는 1회만 실행된다."""
+    with session_factory() as session:
+        user = User(email="flight@example.com", name="flight", provider="email")
+        session.add(user)
+        session.flush()
+        session.add(UserMissCount(user_id=user.id, miss_count=7))
+        session.commit()
+        user_id = str(user.id)
+
+    @contextmanager
+    def scope():
+        with session_factory() as session:
+            yield session
+
+    monkeypatch.setattr(miss_impl, "session_scope", scope)
+    monkeypatch.setattr(miss_impl, "get_redis", lambda: None)
+
+    queries: list[str] = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        if "user_miss_counts" in statement:
+            queries.append(statement)
+            time.sleep(0.2)  # 조회가 끝나기 전에 나머지 요청이 모두 도착하도록
+
+    engine = session_factory.kw["bind"]
+    event.listen(engine, "before_cursor_execute", on_execute)
+
+    service = miss_impl.TaskMissServiceImpl()
+    results, errors = _run_concurrently(lambda: service.get_cumulative_miss_count(user_id))
+
+    assert errors == []
+    assert results == [(7, False)] * WORKERS
+    assert len(queries) == 1
+
+
+def test_errors_are_shared_and_key_is_released():
+    """실행이 실패하면 대기 중인 호출자도 같은 예외를 받고, 이후 호출은 다시 실행된다."""
+    flight = SingleFlight()
+    calls = 0
+
+    def fail():
+        nonlocal calls
+        calls += 1
+        time.sleep(0.1)
+        raise RuntimeError("db down")
+
+    results, errors = _run_concurrently(lambda: flight.do("k", fail), n=20)
+
+    assert results == []
+    assert len(errors) == 20 and all(isinstance(e, RuntimeError) for e in errors)
+    assert calls == 1
+    assert flight.do("k", lambda: 42) == 42
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_async_callers_share_one_execution():
+    """같은 루프의 코루틴 100개가 같은 키로 호출하면 한 번만 실행되고, 다른 키는 따로 실행된다."""
+    flight = SingleFlight()
+    calls: list[str] = []
+
+    async def load(key: str) -> str:
+        calls.append(key)
+        await asyncio.sleep(0.05)
+        return key.upper()
+
+    async def main():
+        return await asyncio.gather(
+            *(flight.do_async(key, load, key) for key in ["a"] * WORKERS + ["b"])
+        )
+
+    results = asyncio.run(main())
+
+    assert results == ["A"] * WORKERS + ["B"]
+    assert sorted(calls) == ["a", "b"]
+    assert flight.stats() == {"executed": 2, "shared": WORKERS - 1, "in_flight": 0}
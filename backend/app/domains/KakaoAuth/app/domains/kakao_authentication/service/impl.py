@@ -1,12 +1,12 @@
 """
 Kakao 인증 Service 구현체.
 환경 변수(.env) 기반으로 client_id, redirect_uri를 로드하며, URL/토큰/사용자정보 로직을 담당한다.
+HTTP 호출은 앱 수명 공유 클라이언트(app.core.http)로 하며, 클라이언트 종료는 lifespan 이 맡는다.
 """
 import os
 from urllib.parse import urlencode
 
-import httpx
-
+from app.core.http import KAKAO_API_BASE, KAKAO_AUTH_BASE, request_with_retry
 from app.domains.kakao_authentication.exceptions import (
     KakaoOAuthConfigError,
     KakaoTokenError,
@@ -18,9 +18,6 @@ from app.domains.kakao_authentication.schemas import (
     TokenAndUserResponse,
 )
 
-KAKAO_AUTH_BASE = "https://kauth.kakao.com"
-KAKAO_API_BASE = "https://kapi.kakao.com"
-
 
 class KakaoAuthenticationServiceImpl:
     """Kakao OAuth 인증 URL 생성, 토큰 발급, 사용자 정보 조회 구현체."""
@@ -50,7 +47,7 @@ class KakaoAuthenticationServiceImpl:
         url = f"{KAKAO_AUTH_BASE}/oauth/authorize?{urlencode(params)}"
         return OAuthLinkResponse(oauth_link=url)
 
-    def request_access_token_after_redirection(self, code: str) -> TokenAndUserResponse:
+    async def request_access_token_after_redirection(self, code: str) -> TokenAndUserResponse:
         """인가 코드로 액세스 토큰을 발급하고, 사용자 정보를 조회하여 반환한다 (PM-JSH-3 + PM-JSH-4)."""
         if not code or not code.strip():
             raise KakaoTokenError("인가 코드(code)가 필요합니다.", detail="code 파라미터를 전달하세요.")
@@ -60,8 +57,8 @@ class KakaoAuthenticationServiceImpl:
                 detail="KAKAO_CLIENT_ID, KAKAO_REDIRECT_URI 환경 변수를 확인하세요.",
             )
 
-        token_data = self._request_token(code)
-        user_info = self._fetch_user_info(token_data["access_token"])
+        token_data = await self._request_token(code)
+        user_info = await self._fetch_user_info(token_data["access_token"])
         return TokenAndUserResponse(
             access_token=token_data["access_token"],
             token_type=token_data.get("token_type", "bearer"),
@@ -71,8 +68,8 @@ class KakaoAuthenticationServiceImpl:
             user=user_info,
         )
 
-    def _request_token(self, code: str) -> dict:
-        """Kakao 토큰 서버에 토큰 요청."""
+    async def _request_token(self, code: str) -> dict:
+        """Kakao 토큰 서버에 토큰 요청. 인가 코드는 1회용이므로 연결 단계 실패만 재시도된다."""
         payload = {
             "grant_type": "authorization_code",
             "client_id": self._client_id,
@@ -82,12 +79,12 @@ class KakaoAuthenticationServiceImpl:
         if self._client_secret:
             payload["client_secret"] = self._client_secret
 
-        with httpx.Client() as client:
-            resp = client.post(
-                f"{KAKAO_AUTH_BASE}/oauth/token",
-                data=payload,
-                headers={"Content-Type": "application/x-www-form-urlencoded;charset=utf-8"},
-            )
+        resp = await request_with_retry(
+            "POST",
+            f"{KAKAO_AUTH_BASE}/oauth/token",
+            data=payload,
+            headers={"Content-Type": "application/x-www-form-urlencoded;charset=utf-8"},
+        )
         if resp.status_code != 200:
             body = resp.json() if resp.headers.get("content-type", "").startswith("application/json") else {}
             error_msg = body.get("error_description", body.get("error", resp.text)) or "토큰 발급에 실패했습니다."
@@ -98,16 +95,16 @@ class KakaoAuthenticationServiceImpl:
                 raise KakaoTokenError(f"토큰 응답에 필수 필드가 없습니다: {key}")
         return data
 
-    def _fetch_user_info(self, access_token: str) -> KakaoUserInfo:
+    async def _fetch_user_info(self, access_token: str) -> KakaoUserInfo:
         """액세스 토큰으로 Kakao 사용자 정보 조회 (PM-JSH-4)."""
-        with httpx.Client() as client:
-            resp = client.get(
-                f"{KAKAO_API_BASE}/v2/user/me",
-                headers={
-                    "Authorization": f"Bearer {access_token}",
-                    "Content-Type": "application/x-www-form-urlencoded;charset=utf-8",
-                },
-            )
+        resp = await request_with_retry(
+            "GET",
+            f"{KAKAO_API_BASE}/v2/user/me",
+            headers={
+                "Authorization": f"Bearer {access_token}",
+                "Content-Type": "application/x-www-form-urlencoded;charset=utf-8",
+            },
+        )
         if resp.status_code != 200:
             body = resp.json() if resp.headers.get("content-type", "").startswith("application/json") else {}
             error_msg = body.get("msg", body.get("error_description", "사용자 정보 조회에 실패했습니다."))
@@ -14,6 +14,6 @@ class KakaoAuthenticationService(Protocol):
         """Kakao OAuth 인증 URL을 생성하여 반환한다."""
         ...
 
-    def request_access_token_after_redirection(self, code: str) -> TokenAndUserResponse:
+    async def request_access_token_after_redirection(self, code: str) -> TokenAndUserResponse:
         """인가 코드로 액세스 토큰을 발급하고, 발급된 토큰으로 사용자 정보를 조회하여 반환한다."""
         ...
@@ -1,20 +1,22 @@
 """
 FastAPI 애플리케이션 진입점.
-시작 시 app.core.env.load_env()를 호출하여 환경 변수를 1회 로드한다.
+시작 시 app.core.env.load_env()를 호출하여 환경 변수를 1회 로드하고, 종료 시 공유 HTTP 클라이언트를 닫는다.
 """
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from app.core.http import close_http_client
 from app.domains.KakaoAuth.app.core.env import load_env
 ##from app.domains.kakao_authentication import router as kakao_router
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """앱 시작 시 .env 1회 로드."""
+    """앱 시작 시 .env 1회 로드, 종료 시 공유 HTTP 클라이언트 종료."""
     load_env()
     yield
+    await close_http_client()
 
 
 app = FastAPI(
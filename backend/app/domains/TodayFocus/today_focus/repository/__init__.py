@@ -1,5 +1,16 @@
 """TodayFocus repository."""
-from app.domains.TodayFocus.today_focus.repository.home_task_repository import HomeTaskRepository
-from app.domains.TodayFocus.today_focus.repository.session_log_repository import SessionLogRepository
+from app.domains.TodayFocus.today_focus.repository.home_task_repository import (
+    AsyncHomeTaskRepository,
+    HomeTaskRepository,
+)
+from app.domains.TodayFocus.today_focus.repository.session_log_repository import (
+    AsyncSessionLogRepository,
+    SessionLogRepository,
+)
 
-__all__ = ["HomeTaskRepository", "SessionLogRepository"]
+__all__ = [
+    "AsyncHomeTaskRepository",
+    "AsyncSessionLogRepository",
+    "HomeTaskRepository",
+    "SessionLogRepository",
+]
@@ -6,9 +6,9 @@ today 범위는 KST(Asia/Seoul) 기준 오늘 00:00 ~ 다음날 00:00을 UTC로
 from datetime import datetime, timezone, timedelta
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import and_
+from sqlalchemy import and_, select
 
-from app.core.database import get_session_factory
+from app.core.database import async_session_scope, session_scope
 from app.domains.task.models import Task
 
 KST = ZoneInfo("Asia/Seoul")
@@ -36,8 +36,7 @@ class HomeTaskRepository:
         scope == "today" 이면 due_date가 KST 기준 오늘인 할일만 (반개구간 >= start_utc AND < end_utc),
         그 외에는 is_archived=False 전체. 오늘 할 일이 없으면 빈 리스트 반환.
         """
-        session_factory = get_session_factory()
-        with session_factory() as session:
+        with session_scope() as session:
             base = session.query(Task).filter(
                 and_(Task.user_id == user_id, Task.is_archived == False)  # noqa: E712
             )
@@ -47,5 +46,20 @@ class HomeTaskRepository:
                     and_(Task.due_date >= start_utc, Task.due_date < end_utc)
                 )
             tasks = base.order_by(Task.due_date.asc()).all()
-            session.expunge_all()
+        return list(tasks)
+
+
+class AsyncHomeTaskRepository:
+    """HomeTaskRepository의 AsyncSession 변형 (async 라우터용)."""
+
+    async def get_tasks_for_home(self, user_id: str, scope: str) -> list[Task]:
+        """[PM-TF-PAR-01] HomeTaskRepository.get_tasks_for_home 과 동일한 조건으로 조회한다."""
+        stmt = select(Task).where(
+            and_(Task.user_id == user_id, Task.is_archived == False)  # noqa: E712
+        )
+        if scope == "today":
+            start_utc, end_utc = _today_range_utc()
+            stmt = stmt.where(and_(Task.due_date >= start_utc, Task.due_date < end_utc))
+        async with async_session_scope() as session:
+            tasks = (await session.scalars(stmt.order_by(Task.due_date.asc()))).all()
         return list(tasks)
@@ -6,20 +6,40 @@ STEP 4: app_close 시 app_close_at, pre_exit_inaction_ms, is_high_risk_exit 기
 """
 from datetime import datetime
 
-from app.core.database import get_session_factory
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.database import async_session_scope, session_scope
 from app.domains.TodayFocus.today_focus.session_log import SessionLog
 
 EXPERIMENT_GROUP_A = "A"
 HIGH_RISK_EXIT_THRESHOLD_MS = 30_000
 
 
+def _apply_action(row: SessionLog, action_at: datetime) -> None:
+    """[STEP 3] first_action_at·reentry_latency_ms(첫 액션만), last_action_at 갱신."""
+    if row.first_action_at is None:
+        row.first_action_at = action_at
+        delta = action_at - row.app_open_at
+        row.reentry_latency_ms = max(0, int(delta.total_seconds() * 1000))
+    row.last_action_at = action_at
+
+
+def _apply_app_close(row: SessionLog, app_close_at: datetime) -> None:
+    """[STEP 4] app_close_at, pre_exit_inaction_ms, is_high_risk_exit 계산."""
+    row.app_close_at = app_close_at
+    ref_at = row.last_action_at if row.last_action_at is not None else row.app_open_at
+    delta = app_close_at - ref_at
+    row.pre_exit_inaction_ms = max(0, int(delta.total_seconds() * 1000))
+    row.is_high_risk_exit = row.pre_exit_inaction_ms >= HIGH_RISK_EXIT_THRESHOLD_MS
+
+
 class SessionLogRepository:
     """session_log INSERT/UPDATE 전담 Repository."""
 
     def create_session(self, user_id: str, app_open_at: datetime) -> SessionLog:
         """[PM-TF-INF-01] 세션 1건 생성. experiment_group은 "A"로 저장."""
-        session_factory = get_session_factory()
-        with session_factory() as db:
+        with session_scope() as db:
             row = SessionLog(
                 user_id=user_id,
                 app_open_at=app_open_at,
@@ -33,38 +53,91 @@ class SessionLogRepository:
 
     def get_by_session_id(self, session_id: str) -> SessionLog | None:
         """session_id로 세션 1건 조회."""
-        session_factory = get_session_factory()
-        with session_factory() as db:
+        with session_scope() as db:
             row = db.query(SessionLog).filter(SessionLog.session_id == session_id).first()
             if row is None:
                 return None
             db.expunge(row)
         return row
 
-    def update_on_action(self, session_id: str, action_at: datetime) -> None:
-        """[PM-TF-INF-02 STEP 3] 액션 시 first_action_at(첫 액션만), reentry_latency_ms(첫 액션만), last_action_at 갱신."""
-        session_factory = get_session_factory()
-        with session_factory() as db:
+    def update_on_action(self, session_id: str, action_at: datetime, db: Session | None = None) -> None:
+        """
+        [PM-TF-INF-02 STEP 3] 액션 시 first_action_at(첫 액션만), reentry_latency_ms(첫 액션만), last_action_at 갱신.
+        db 를 넘기면 호출자 트랜잭션에서 변경만 하고 commit 은 호출자가 한다.
+        """
+        if db is not None:
+            row = db.scalar(select(SessionLog).where(SessionLog.session_id == session_id))
+            if row is not None:
+                _apply_action(row, action_at)
+            return
+        with session_scope() as db:
             row = db.query(SessionLog).filter(SessionLog.session_id == session_id).first()
             if row is None:
                 return
-            if row.first_action_at is None:
-                row.first_action_at = action_at
-                delta = action_at - row.app_open_at
-                row.reentry_latency_ms = max(0, int(delta.total_seconds() * 1000))
-            row.last_action_at = action_at
+            _apply_action(row, action_at)
             db.commit()
 
+    def update_on_actions(self, actions: list[tuple[str, datetime]], db: Session) -> int:
+        """
+        [PM-TF-INF-02 STEP 3] (session_id, action_at) 여러 건을 update_on_action 과 같은 규칙으로 반영한다.
+        세션은 IN 조회 1회로 읽고 액션은 시각순으로 적용한다. commit 은 호출자가 한다. 반영한 액션 수를 반환한다.
+        """
+        if not actions:
+            return 0
+        rows = {
+            row.session_id: row
+            for row in db.scalars(
+                select(SessionLog).where(SessionLog.session_id.in_({session_id for session_id, _ in actions}))
+            )
+        }
+        applied = 0
+        for session_id, action_at in sorted(actions, key=lambda a: a[1]):
+            row = rows.get(session_id)
+            if row is not None:
+                _apply_action(row, action_at)
+                applied += 1
+        return applied
+
     def update_on_app_close(self, session_id: str, app_close_at: datetime) -> None:
         """[PM-TF-INF-03 STEP 4] app_close 시 app_close_at, pre_exit_inaction_ms, is_high_risk_exit 기록."""
-        session_factory = get_session_factory()
-        with session_factory() as db:
+        with session_scope() as db:
             row = db.query(SessionLog).filter(SessionLog.session_id == session_id).first()
             if row is None:
                 return
-            row.app_close_at = app_close_at
-            ref_at = row.last_action_at if row.last_action_at is not None else row.app_open_at
-            delta = app_close_at - ref_at
-            row.pre_exit_inaction_ms = max(0, int(delta.total_seconds() * 1000))
-            row.is_high_risk_exit = row.pre_exit_inaction_ms >= HIGH_RISK_EXIT_THRESHOLD_MS
-            db.commit()
\ No newline at end of file
+            _apply_app_close(row, app_close_at)
+            db.commit()
+
+
+class AsyncSessionLogRepository:
+    """SessionLogRepository의 AsyncSession 변형 (async 라우터용)."""
+
+    async def create_session(self, user_id: str, app_open_at: datetime) -> SessionLog:
+        """[PM-TF-INF-01] 세션 1건 생성. experiment_group은 "A"로 저장."""
+        async with async_session_scope() as db:
+            row = SessionLog(
+                user_id=user_id,
+                app_open_at=app_open_at,
+                experiment_group=EXPERIMENT_GROUP_A,
+            )
+            db.add(row)
+            await db.commit()
+            await db.refresh(row)
+        return row
+
+    async def update_on_action(self, session_id: str, action_at: datetime) -> None:
+        """[PM-TF-INF-02 STEP 3] SessionLogRepository.update_on_action 비동기 변형."""
+        async with async_session_scope() as db:
+            row = await db.scalar(select(SessionLog).where(SessionLog.session_id == session_id))
+            if row is None:
+                return
+            _apply_action(row, action_at)
+            await db.commit()
+
+    async def update_on_app_close(self, session_id: str, app_close_at: datetime) -> None:
+        """[PM-TF-INF-03 STEP 4] SessionLogRepository.update_on_app_close 비동기 변형."""
+        async with async_session_scope() as db:
+            row = await db.scalar(select(SessionLog).where(SessionLog.session_id == session_id))
+            if row is None:
+                return
+            _apply_app_close(row, app_close_at)
+            await db.commit()
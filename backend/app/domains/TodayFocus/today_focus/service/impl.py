@@ -5,7 +5,14 @@ app_open 이벤트 시 SessionLogRepository로 세션 생성(experiment_group="A
 """
 from datetime import datetime
 
-from app.domains.TodayFocus.today_focus.repository import HomeTaskRepository, SessionLogRepository
+from sqlalchemy.orm import Session
+
+from app.domains.TodayFocus.today_focus.repository import (
+    AsyncHomeTaskRepository,
+    AsyncSessionLogRepository,
+    HomeTaskRepository,
+    SessionLogRepository,
+)
 from app.domains.TodayFocus.today_focus.service.interface import TodayFocusServiceProtocol
 from app.domains.TodayFocus.today_focus.session_log import SessionLog
 from app.domains.TodayFocus.today_focus.settings import TodayFocusSettings
@@ -18,6 +25,8 @@ class TodayFocusServiceImpl(TodayFocusServiceProtocol):
     def __init__(self) -> None:
         self._repository = HomeTaskRepository()
         self._session_log_repository = SessionLogRepository()
+        self._async_repository = AsyncHomeTaskRepository()
+        self._async_session_log_repository = AsyncSessionLogRepository()
 
     def get_home_tasks(self, user_id: str) -> list[Task]:
         """설정된 TaskDisplayScope에 따라 홈에 표시할 과업만 반환. 오늘 할 일 없으면 빈 리스트."""
@@ -28,10 +37,31 @@ class TodayFocusServiceImpl(TodayFocusServiceProtocol):
         """[PM-TF-INF-01 STEP 2] app_open 이벤트 시 세션 생성. experiment_group은 "A"로 저장."""
         return self._session_log_repository.create_session(user_id, app_open_at)
 
-    def record_action(self, session_id: str, action_at: datetime) -> None:
+    def record_action(self, session_id: str, action_at: datetime, db: Session | None = None) -> None:
         """[PM-TF-INF-02 STEP 3] 액션 시 first_action_at(첫 액션만), reentry_latency_ms(첫 액션만), last_action_at 갱신."""
-        self._session_log_repository.update_on_action(session_id, action_at)
+        self._session_log_repository.update_on_action(session_id, action_at, db)
+
+    def record_actions(self, actions: list[tuple[str, datetime]], db: Session) -> int:
+        """[PM-TF-INF-02 STEP 3] (session_id, action_at) 여러 건을 호출자 트랜잭션에서 반영한다 (텔레메트리 배치용)."""
+        return self._session_log_repository.update_on_actions(actions, db)
 
     def record_app_close(self, session_id: str, app_close_at: datetime) -> None:
         """[PM-TF-INF-03 STEP 4] app_close 시 app_close_at, pre_exit_inaction_ms, is_high_risk_exit 기록."""
         self._session_log_repository.update_on_app_close(session_id, app_close_at)
+
+    async def get_home_tasks_async(self, user_id: str) -> list[Task]:
+        """get_home_tasks의 비동기 변형 (AsyncSession)."""
+        scope = TodayFocusSettings.task_display_scope()
+        return await self._async_repository.get_tasks_for_home(user_id, scope)
+
+    async def record_app_open_async(self, user_id: str, app_open_at: datetime) -> SessionLog:
+        """record_app_open의 비동기 변형 (AsyncSession)."""
+        return await self._async_session_log_repository.create_session(user_id, app_open_at)
+
+    async def record_action_async(self, session_id: str, action_at: datetime) -> None:
+        """record_action의 비동기 변형 (AsyncSession)."""
+        await self._async_session_log_repository.update_on_action(session_id, action_at)
+
+    async def record_app_close_async(self, session_id: str, app_close_at: datetime) -> None:
+        """record_app_close의 비동기 변형 (AsyncSession)."""
+        await self._async_session_log_repository.update_on_app_close(session_id, app_close_at)
@@ -1,6 +1,8 @@
 """TodayFocus Service 인터페이스."""
 from datetime import datetime
 
+from sqlalchemy.orm import Session
+
 from app.domains.TodayFocus.today_focus.session_log import SessionLog
 from app.domains.task.models import Task
 
@@ -16,10 +18,36 @@ class TodayFocusServiceProtocol:
         """[PM-TF-INF-01] app_open 이벤트 수신 시 세션 생성. experiment_group="A" 저장."""
         ...
 
-    def record_action(self, session_id: str, action_at: datetime) -> None:
-        """[PM-TF-INF-02 STEP 3] 액션 시 first_action_at(첫 액션만), reentry_latency_ms(첫 액션만), last_action_at 갱신."""
+    def record_action(self, session_id: str, action_at: datetime, db: Session | None = None) -> None:
+        """
+        [PM-TF-INF-02 STEP 3] 액션 시 first_action_at(첫 액션만), reentry_latency_ms(첫 액션만), last_action_at 갱신.
+        db 를 넘기면 호출자 트랜잭션에 합류한다 (commit 은 호출자).
+        """
+        ...
+
+    def record_actions(self, actions: list[tuple[str, datetime]], db: Session) -> int:
+        """
+        [PM-TF-INF-02 STEP 3] (session_id, action_at) 여러 건을 record_action 과 같은 규칙으로 반영한다.
+        commit 은 호출자가 한다. 반영한 액션 수를 반환한다.
+        """
         ...
 
     def record_app_close(self, session_id: str, app_close_at: datetime) -> None:
         """[PM-TF-INF-03 STEP 4] app_close 시 app_close_at, pre_exit_inaction_ms, is_high_risk_exit 기록."""
         ...
+
+    async def get_home_tasks_async(self, user_id: str) -> list[Task]:
+        """get_home_tasks의 비동기 변형."""
+        ...
+
+    async def record_app_open_async(self, user_id: str, app_open_at: datetime) -> SessionLog:
+        """record_app_open의 비동기 변형."""
+        ...
+
+    async def record_action_async(self, session_id: str, action_at: datetime) -> None:
+        """record_action의 비동기 변형."""
+        ...
+
+    async def record_app_close_async(self, session_id: str, app_close_at: datetime) -> None:
+        """record_app_close의 비동기 변형."""
+        ...
@@ -17,3 +17,6 @@ class User(Base):
     # [PRO-B-41][PRO-B-42] ChainLength 및 성취 지표: 연속 달성 일수, 마지막 완료 시점 (서버 DB 영속성·재진입 후 유지)
     current_chain_length = Column(Integer, nullable=False, default=0)
     last_task_completed_at = Column(DateTime, nullable=True)
+
+    # 무상태 JWT 모드의 토큰 버전 — logout/withdraw 시 증가하며, tv 클레임이 다른 토큰은 폐기된 것으로 본다
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
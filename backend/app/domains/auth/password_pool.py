@@ -0,0 +1,116 @@
+"""
+bcrypt 전용 작업 풀.
+해싱/검증(요청당 100‒300ms CPU)을 이벤트 루프·기본 스레드풀과 분리된 고정 크기 풀에서 실행한다.
+bcrypt는 해싱 중 GIL을 해제하므로 스레드 풀로 코어 수만큼 병렬 처리된다.
+
+- 동시 대기 작업 수가 PASSWORD_HASH_MAX_PENDING 을 넘으면 즉시 PasswordPoolBusy 를 던져
+  호출자가 503으로 빠르게 응답하게 한다 (로그인 폭주가 다른 엔드포인트를 굶기지 않도록).
+- 해싱 소요 시간과 큐 대기 시간을 누적해 stats() 로 노출한다.
+"""
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
+PASSWORD_HASH_RETRY_AFTER_SECONDS = int(os.getenv("PASSWORD_HASH_RETRY_AFTER_SECONDS", "1"))
+
+
+class PasswordPoolBusy(Exception):
+    """대기 작업 수가 한도에 도달해 새 작업을 받지 않음."""
+
+
+class PasswordHashPool:
+    """bcrypt 호출을 실행하는 유한 크기 풀. 실행 중 + 대기 작업 수를 max_pending 으로 제한한다."""
+
+    def __init__(self, workers: int = PASSWORD_HASH_WORKERS, max_pending: int = PASSWORD_HASH_MAX_PENDING) -> None:
+        self._workers = workers
+        self._max_pending = max_pending
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._hash_ms_total = 0.0
+        self._hash_ms_max = 0.0
+        self._wait_ms_total = 0.0
+        self._wait_ms_max = 0.0
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        """fn(*args)를 풀에서 실행하고 결과를 기다린다. 한도 초과 시 PasswordPoolBusy."""
+        with self._lock:
+            if self._pending >= self._max_pending:
+                self._rejected += 1
+                raise PasswordPoolBusy()
+            self._pending += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="bcrypt")
+            executor = self._executor
+        submitted = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                executor, self._timed, submitted, fn, *args
+            )
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _timed(self, submitted: float, fn: Callable[..., T], *args) -> T:
+        started = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            finished = time.perf_counter()
+            wait_ms = (started - submitted) * 1000
+            hash_ms = (finished - started) * 1000
+            with self._lock:
+                self._completed += 1
+                self._wait_ms_total += wait_ms
+                self._wait_ms_max = max(self._wait_ms_max, wait_ms)
+                self._hash_ms_total += hash_ms
+                self._hash_ms_max = max(self._hash_ms_max, hash_ms)
+
+    def stats(self) -> dict[str, float | int]:
+        """처리·거절 건수, 현재 대기 수, 해싱/큐 대기 평균·최대(ms)."""
+        with self._lock:
+            done = self._completed or 1
+            return {
+                "workers": self._workers,
+                "max_pending": self._max_pending,
+                "pending": self._pending,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "hash_ms_avg": round(self._hash_ms_total / done, 2),
+                "hash_ms_max": round(self._hash_ms_max, 2),
+                "queue_wait_ms_avg": round(self._wait_ms_total / done, 2),
+                "queue_wait_ms_max": round(self._wait_ms_max, 2),
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_pool: PasswordHashPool | None = None
+
+
+def get_password_pool() -> PasswordHashPool:
+    global _pool
+    if _pool is None:
+        _pool = PasswordHashPool()
+    return _pool
+
+
+def shutdown_password_pool() -> None:
+    """풀 스레드를 정리한다. 앱 종료 시 1회 호출."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
@@ -0,0 +1,183 @@
+"""
+인증 주체(Principal) 캐시.
+get_current_user가 요청마다 users 행을 다시 읽지 않도록 sub(user id) 기준으로
+User 스냅샷을 캐싱한다. 토큰 서명·만료 검증은 캐시와 무관하게 매 요청 수행된다.
+
+- L1: 프로세스 내 LRU + TTL (app.core.cache.TTLCache)
+- L2: Redis (auth:principal:{user_id}, 선택) — 워커 간 공유, Redis 미가용 시 L1만 사용
+  async 의존성에서는 get_async/put_async 로 Redis 호출을 스레드로 넘겨 루프를 막지 않는다.
+- link_account / kakao 연동 / logout / withdraw / chain 갱신 시 invalidate 로 무효화한다.
+  다른 워커의 L1은 최대 TTL 동안 이전 값을 유지할 수 있다.
+"""
+import asyncio
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Any, Iterable
+
+from app.core.cache import TTLCache
+from app.core.redis import get_redis
+from app.domains.auth.models import User
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "auth:principal:{user_id}"
+PRINCIPAL_CACHE_TTL_SECONDS = int(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "60"))
+PRINCIPAL_CACHE_MAX_SIZE = int(os.getenv("PRINCIPAL_CACHE_MAX_SIZE", "10000"))
+PRINCIPAL_CACHE_REDIS_ENABLED = os.getenv("PRINCIPAL_CACHE_REDIS_ENABLED", "true").lower() in ("true", "1", "yes")
+
+# 비밀번호 해시는 캐시에 두지 않는다 (비밀번호 검증 경로는 항상 DB 조회).
+_SNAPSHOT_COLUMNS = [c.key for c in User.__table__.columns if c.key != "password_hash"]
+_DATETIME_COLUMNS = {"created_at", "updated_at", "last_task_completed_at"}
+
+
+def _to_snapshot(user: User) -> dict[str, Any]:
+    return {key: getattr(user, key) for key in _SNAPSHOT_COLUMNS}
+
+
+def _from_snapshot(snapshot: dict[str, Any]) -> User:
+    """스냅샷으로 세션에 속하지 않는 User 인스턴스를 만든다 (읽기 전용 용도)."""
+    return User(**snapshot)
+
+
+def _dumps(snapshot: dict[str, Any]) -> str:
+    return json.dumps(
+        {k: (v.isoformat() if isinstance(v, datetime) else v) for k, v in snapshot.items()},
+        ensure_ascii=False,
+    )
+
+
+def _loads(raw: str) -> dict[str, Any]:
+    data = json.loads(raw)
+    for key in _DATETIME_COLUMNS:
+        if data.get(key):
+            data[key] = datetime.fromisoformat(data[key])
+    return data
+
+
+class PrincipalCache:
+    """sub(user id) → User 스냅샷 캐시. hit/miss 카운터를 제공한다."""
+
+    def __init__(
+        self,
+        ttl_seconds: int = PRINCIPAL_CACHE_TTL_SECONDS,
+        max_size: int = PRINCIPAL_CACHE_MAX_SIZE,
+        use_redis: bool = PRINCIPAL_CACHE_REDIS_ENABLED,
+    ) -> None:
+        self._ttl = ttl_seconds
+        self._local = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        self._use_redis = use_redis
+        self._lock = threading.Lock()
+        self._redis_hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get(self, user_id: int) -> User | None:
+        """캐시된 Principal을 반환한다. L1 → Redis 순으로 조회하며, 없으면 None."""
+        snapshot = self._local.get(user_id)
+        if snapshot is None:
+            snapshot = self._fill_from_redis(user_id)
+        return _from_snapshot(snapshot) if snapshot is not None else None
+
+    async def get_async(self, user_id: int) -> User | None:
+        """get 의 async 변형. L1 적중 시 I/O 없이 반환하고, Redis 조회만 스레드로 넘긴다."""
+        snapshot = self._local.get(user_id)
+        if snapshot is None:
+            if self._use_redis:
+                snapshot = await asyncio.to_thread(self._fill_from_redis, user_id)
+            else:
+                snapshot = self._fill_from_redis(user_id)
+        return _from_snapshot(snapshot) if snapshot is not None else None
+
+    def put(self, user: User) -> None:
+        """DB에서 읽은 User를 캐시에 저장한다."""
+        snapshot = _to_snapshot(user)
+        self._local.set(user.id, snapshot)
+        self._set_to_redis(user.id, snapshot)
+
+    async def put_async(self, user: User) -> None:
+        """put 의 async 변형."""
+        snapshot = _to_snapshot(user)
+        self._local.set(user.id, snapshot)
+        if self._use_redis:
+            await asyncio.to_thread(self._set_to_redis, user.id, snapshot)
+
+    def invalidate(self, user_id: int) -> None:
+        """users 행이 바뀐 사용자의 캐시 항목을 제거한다."""
+        self.invalidate_many([user_id])
+
+    def invalidate_many(self, user_ids: Iterable[int]) -> None:
+        ids = list(user_ids)
+        if not ids:
+            return
+        for uid in ids:
+            self._local.delete(uid)
+        with self._lock:
+            self._invalidations += len(ids)
+        client = self._redis()
+        if client is None:
+            return
+        try:
+            client.delete(*(REDIS_KEY_PREFIX.format(user_id=uid) for uid in ids))
+        except Exception:
+            logger.warning("Principal 캐시 무효화 실패 user_ids=%s", ids, exc_info=True)
+
+    def stats(self) -> dict[str, int]:
+        """L1 hit, Redis hit, miss, 무효화 횟수 및 L1 크기."""
+        local = self._local.stats()
+        with self._lock:
+            return {
+                "hits": local["hits"] + self._redis_hits,
+                "local_hits": local["hits"],
+                "redis_hits": self._redis_hits,
+                "misses": self._misses,
+                "invalidations": self._invalidations,
+                "size": local["size"],
+            }
+
+    def _redis(self):
+        return get_redis() if self._use_redis else None
+
+    def _fill_from_redis(self, user_id: int) -> dict[str, Any] | None:
+        """L1 미스 시 Redis에서 읽어 L1을 채운다. 카운터도 여기서 갱신한다."""
+        snapshot = self._get_from_redis(user_id)
+        with self._lock:
+            if snapshot is None:
+                self._misses += 1
+            else:
+                self._redis_hits += 1
+        if snapshot is not None:
+            self._local.set(user_id, snapshot)
+        return snapshot
+
+    def _get_from_redis(self, user_id: int) -> dict[str, Any] | None:
+        client = self._redis()
+        if client is None:
+            return None
+        try:
+            raw = client.get(REDIS_KEY_PREFIX.format(user_id=user_id))
+            return _loads(raw) if raw is not None else None
+        except Exception:
+            logger.warning("Principal 캐시 조회 실패 user=%s", user_id, exc_info=True)
+            return None
+
+    def _set_to_redis(self, user_id: int, snapshot: dict[str, Any]) -> None:
+        client = self._redis()
+        if client is None:
+            return
+        try:
+            client.setex(REDIS_KEY_PREFIX.format(user_id=user_id), self._ttl, _dumps(snapshot))
+        except Exception:
+            logger.warning("Principal 캐시 저장 실패 user=%s", user_id, exc_info=True)
+
+
+_principal_cache: PrincipalCache | None = None
+
+
+def get_principal_cache() -> PrincipalCache:
+    global _principal_cache
+    if _principal_cache is None:
+        _principal_cache = PrincipalCache()
+    return _principal_cache
@@ -1,26 +1,24 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import Optional
 
-from app.core.database import get_session_factory
+from app.core.database import get_async_db, get_db
 from app.domains.auth import models, schemas, security
+from app.domains.auth.password_pool import get_password_pool
+from app.domains.auth.principal_cache import get_principal_cache
 
 router = APIRouter()
 
-def get_db():
-    db = get_session_factory()()
-    try:
-        yield db
-    finally:
-        db.close()
-
 @router.post("/signup", response_model=schemas.UserOut, status_code=status.HTTP_201_CREATED)
-def signup(user: schemas.UserCreate, db: Session = Depends(get_db)):
-    db_user = db.query(models.User).filter(models.User.email == user.email).first()
+async def signup(user: schemas.UserCreate, db: AsyncSession = Depends(get_async_db)):
+    # bcrypt는 전용 풀에서 실행하고, DB 조회는 AsyncSession으로 루프를 막지 않는다.
+    db_user = await db.scalar(select(models.User).where(models.User.email == user.email))
     if db_user:
         raise HTTPException(status_code=400, detail="Email already registered")
     
-    hashed_password = security.get_password_hash(user.password)
+    hashed_password = await security.get_password_hash_async(user.password)
     new_user = models.User(
         email=user.email,
         password_hash=hashed_password,
@@ -28,43 +26,70 @@ def signup(user: schemas.UserCreate, db: Session = Depends(get_db)):
         provider="email"
     )
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
     return new_user
 
 @router.post("/login", response_model=schemas.TokenWithUser)
-def login(user_credentials: schemas.UserLogin, db: Session = Depends(get_db)):
-    user = db.query(models.User).filter(models.User.email == user_credentials.email).first()
+async def login(user_credentials: schemas.UserLogin, db: AsyncSession = Depends(get_async_db)):
+    user = await db.scalar(select(models.User).where(models.User.email == user_credentials.email))
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid Credentials"
         )
 
-    if not user.password_hash or not security.verify_password(user_credentials.password, user.password_hash):
+    if not user.password_hash or not await security.verify_password_async(user_credentials.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid Credentials"
         )
 
-    access_token = security.create_access_token(data={"sub": str(user.id)})
+    access_token = security.create_user_access_token(user)
     return {"access_token": access_token, "token_type": "bearer", "user": user}
 
+_REVOCATION_FAILED = HTTPException(
+    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+    detail="토큰 폐기를 처리하지 못했습니다. 잠시 후 다시 시도해 주세요.",
+)
+
 @router.post("/logout")
-def logout():
-    # Stateless JWT removes capability of explicit logout on server.
-    # We rely on client to delete the token, but we return a success response.
+def logout(
+    db: Session = Depends(get_db),
+    current_user: Optional[models.User] = Depends(security.get_current_user_optional),
+):
+    # The client still deletes the token. In JWT_STATELESS_CLAIMS mode the token version
+    # is bumped as well, so every token issued to this user is rejected server-side.
+    if current_user is not None:
+        try:
+            security.revoke_user_tokens(db, current_user.id)
+        except security.TokenRevocationError:
+            db.rollback()
+            raise _REVOCATION_FAILED
+        db.commit()
+        get_principal_cache().invalidate(current_user.id)
     return {"message": "Successfully logged out. Please remove token from client headers."}
 
 @router.delete("/withdraw")
 def withdraw(db: Session = Depends(get_db), current_user: models.User = Depends(security.get_current_user)):
-    db.delete(current_user)
+    # 삭제 전에 토큰 버전을 올려 캐시에 남은 이전 버전으로 기존 토큰이 통과하지 않게 한다.
+    try:
+        security.revoke_user_tokens(db, current_user.id)
+    except security.TokenRevocationError:
+        db.rollback()
+        raise _REVOCATION_FAILED
+    # current_user는 인증 의존성의 AsyncSession 소속이므로 이 세션에서 다시 로드해 삭제한다.
+    user = db.get(models.User, current_user.id)
+    if user is not None:
+        db.delete(user)
     db.commit()
+    get_principal_cache().invalidate(current_user.id)
     return {"message": "User account successfully deleted."}
 
-import httpx
 import os
 
+from app.core.http import KAKAO_API_BASE, KAKAO_AUTH_BASE, request_with_retry
+
 @router.post("/kakao", response_model=schemas.TokenWithUser)
 async def kakao_login(
     kakao_data: schemas.KakaoLogin,
@@ -88,12 +113,14 @@ async def kakao_login(
     if kakao_client_secret:
         token_payload["client_secret"] = kakao_client_secret
 
-    async with httpx.AsyncClient() as client:
-        token_res = await client.post(
-            "https://kauth.kakao.com/oauth/token",
-            data=token_payload,
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-        )
+    # 앱 수명 공유 클라이언트(app.core.http) 사용 — 요청마다 TCP+TLS 핸드셰이크를 반복하지 않는다.
+    # 인가 코드는 1회용이므로 연결 단계 실패만 재시도된다.
+    token_res = await request_with_retry(
+        "POST",
+        f"{KAKAO_AUTH_BASE}/oauth/token",
+        data=token_payload,
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
 
     if token_res.status_code != 200:
         error_msg = token_res.text
@@ -103,11 +130,11 @@ async def kakao_login(
     kakao_access_token = token_res.json().get("access_token")
 
     # 2. S2S: Kakao access token → user info
-    async with httpx.AsyncClient() as client:
-        user_res = await client.get(
-            "https://kapi.kakao.com/v2/user/me",
-            headers={"Authorization": f"Bearer {kakao_access_token}"},
-        )
+    user_res = await request_with_retry(
+        "GET",
+        f"{KAKAO_API_BASE}/v2/user/me",
+        headers={"Authorization": f"Bearer {kakao_access_token}"},
+    )
 
     if user_res.status_code != 200:
         raise HTTPException(status_code=400, detail="Failed to retrieve user info from Kakao")
@@ -124,8 +151,10 @@ async def kakao_login(
         if existing and existing.id != current_user.id:
             raise HTTPException(status_code=409, detail="이 카카오 계정은 이미 다른 사용자에 연동되어 있습니다.")
         
-        # Merge the user object from the security dependency's session into the current route's session
-        current_user = db.merge(current_user)
+        # current_user는 캐시 스냅샷일 수 있으므로 이 세션에서 최신 행을 다시 로드한다.
+        current_user = db.get(models.User, current_user.id)
+        if current_user is None:
+            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
         current_user.social_id = social_id
         current_user.provider = "kakao"
         
@@ -135,7 +164,8 @@ async def kakao_login(
             
         db.commit()
         db.refresh(current_user)
-        access_token = security.create_access_token(data={"sub": str(current_user.id)})
+        get_principal_cache().invalidate(current_user.id)
+        access_token = security.create_user_access_token(current_user)
         return {"access_token": access_token, "token_type": "bearer", "user": current_user}
 
     # 3. Find or create user (unified account)
@@ -167,11 +197,11 @@ async def kakao_login(
         # Rare case: email already linked to a DIFFERENT kakao account
         raise HTTPException(status_code=400, detail="이메일이 다른 소셜 계정에 이미 연동되어 있습니다.")
 
-    access_token = security.create_access_token(data={"sub": str(user.id)})
+    access_token = security.create_user_access_token(user)
     return {"access_token": access_token, "token_type": "bearer", "user": user}
 
 @router.post("/link-account", response_model=schemas.TokenWithUser)
-def link_account(data: schemas.LinkAccountRequest, db: Session = Depends(get_db)):
+async def link_account(data: schemas.LinkAccountRequest, db: AsyncSession = Depends(get_async_db)):
     payload = security.verify_temp_token(data.temp_token)
     if not payload:
         raise HTTPException(status_code=401, detail="임시 토큰이 만료되었거나 유효하지 않습니다.")
@@ -179,18 +209,27 @@ def link_account(data: schemas.LinkAccountRequest, db: Session = Depends(get_db)
     user_id_str = payload.get("sub")
     social_id = payload.get("social_id")
     
-    user = db.query(models.User).filter(models.User.id == int(user_id_str)).first()
+    user = await db.get(models.User, int(user_id_str))
     if not user:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
         
-    if not user.password_hash or not security.verify_password(data.password, user.password_hash):
+    if not user.password_hash or not await security.verify_password_async(data.password, user.password_hash):
         raise HTTPException(status_code=401, detail="비밀번호가 일치하지 않습니다.")
         
     # Link account
     user.social_id = social_id
     user.provider = "kakao"
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
+    get_principal_cache().invalidate(user.id)
     
-    access_token = security.create_access_token(data={"sub": str(user.id)})
+    access_token = security.create_user_access_token(user)
     return {"access_token": access_token, "token_type": "bearer", "user": user}
+
+@router.get("/metrics")
+def auth_metrics():
+    """인증 경로 관측 지표: Principal 캐시 hit/miss, bcrypt 풀 처리량·지연."""
+    return {
+        "principal_cache": get_principal_cache().stats(),
+        "password_pool": get_password_pool().stats(),
+    }
@@ -8,8 +8,11 @@ from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 import bcrypt
 
-from app.core.database import get_session_factory
+from app.core.database import async_session_scope
 from app.domains.auth.models import User
+from app.domains.auth.password_pool import PASSWORD_HASH_RETRY_AFTER_SECONDS, PasswordPoolBusy, get_password_pool
+from app.domains.auth.principal_cache import get_principal_cache
+from app.domains.auth.token_version import TokenRevocationError, bump_token_version, get_token_version_store
 
 # Configuration
 SECRET_KEY = os.getenv("JWT_SECRET_KEY")
@@ -19,6 +22,12 @@ if not SECRET_KEY:
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
 
+# 무상태 클레임 모드: 액세스 토큰에 uid·provider·토큰 버전(tv)을 담고,
+# get_current_user 가 users 조회 없이 토큰 버전만으로 인증한다.
+# tv 클레임이 없는 기존 토큰은 Principal 캐시/DB 경로로 처리된다.
+# 현재 버전을 확인할 수 없는 tv 토큰은 거부한다 (fail closed).
+JWT_STATELESS_CLAIMS = os.getenv("JWT_STATELESS_CLAIMS", "false").lower() in ("true", "1", "yes")
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -28,6 +37,24 @@ def get_password_hash(password: str) -> str:
     salt = bcrypt.gensalt()
     return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
 
+async def _run_in_password_pool(fn, *args):
+    try:
+        return await get_password_pool().run(fn, *args)
+    except PasswordPoolBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="인증 요청이 많아 잠시 후 다시 시도해 주세요.",
+            headers={"Retry-After": str(PASSWORD_HASH_RETRY_AFTER_SECONDS)},
+        )
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password 를 bcrypt 전용 풀에서 실행한다. 풀이 가득 차면 503."""
+    return await _run_in_password_pool(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash 를 bcrypt 전용 풀에서 실행한다. 풀이 가득 차면 503."""
+    return await _run_in_password_pool(get_password_hash, password)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -38,6 +65,29 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+def create_user_access_token(user: User) -> str:
+    """
+    사용자 액세스 토큰을 발급한다. user 는 DB 에서 읽은 행이어야 한다.
+    무상태 클레임 모드에서는 라우터가 쓰는 클레임(uid, provider, 토큰 버전)을 함께 담는다.
+    """
+    data = {"sub": str(user.id)}
+    if JWT_STATELESS_CLAIMS:
+        data.update({"uid": user.id, "prv": user.provider, "tv": user.token_version or 0})
+    return create_access_token(data=data)
+
+def revoke_user_tokens(db: Session, user_id: int) -> None:
+    """
+    사용자의 기존 액세스 토큰을 폐기한다 (logout / withdraw). db 트랜잭션 안에서, 커밋 전에 호출한다.
+    무상태 모드에서는 users.token_version 을 올리고 캐시에 반영하므로 기존 토큰이 모두 거부된다.
+    캐시 반영에 실패하면 TokenRevocationError — 호출자는 롤백하고 실패로 응답한다.
+    Principal 캐시 무효화는 커밋 후 호출자가 한다.
+    """
+    if not JWT_STATELESS_CLAIMS:
+        return
+    version = bump_token_version(db, user_id)
+    if version is not None:
+        get_token_version_store().publish(user_id, version)
+
 TEMP_TOKEN_EXPIRE_MINUTES = 15
 
 def create_temp_token(data: dict):
@@ -54,44 +104,91 @@ def verify_temp_token(token: str):
     except JWTError:
         return None
 
-def get_db():
-    db = get_session_factory()()
+def _decode_payload(token: str) -> Optional[dict]:
+    """액세스 토큰의 서명·만료를 검증하고 페이로드를 반환한다. 실패 시 None."""
     try:
-        yield db
-    finally:
-        db.close()
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        return None
+
+def _decode_user_id(token: str) -> Optional[int]:
+    """액세스 토큰을 검증하고 sub(user id)를 반환한다. 서명·만료·형식 오류 시 None."""
+    payload = _decode_payload(token)
+    if payload is None:
+        return None
+    return _user_id_from_payload(payload)
+
+def _user_id_from_payload(payload: dict) -> Optional[int]:
+    user_id_str = payload.get("sub")
+    if user_id_str is None:
+        return None
+    try:
+        return int(user_id_str)
+    except (TypeError, ValueError):
+        return None
+
+async def _load_principal(user_id: int) -> Optional[User]:
+    """
+    Principal 캐시 → DB 순으로 User를 조회하고, DB에서 읽었으면 캐시에 채운다.
+    요청 범위 AsyncSession은 캐시 미스일 때만 열어 적중 시 커넥션을 체크아웃하지 않는다.
+    """
+    cache = get_principal_cache()
+    user = await cache.get_async(user_id)
+    if user is not None:
+        return user
+    async with async_session_scope() as db:
+        user = await db.get(User, user_id)
+    if user is not None:
+        await cache.put_async(user)
+    return user
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
+async def _principal_from_claims(user_id: int, payload: dict) -> Optional[User]:
+    """
+    무상태 클레임으로 세션에 속하지 않는 User(id, provider)를 만든다.
+    토큰 버전이 현재 버전과 다르거나(logout/withdraw 이후), 현재 버전을 확인할 수 없으면
+    (없는 사용자, Redis·DB 모두 조회 실패) None.
+    """
+    token_version = payload.get("tv")
+    if not isinstance(token_version, int):
+        return None
+    current_version = await get_token_version_store().current_async(user_id)
+    if current_version is None or token_version != current_version:
+        return None
+    return User(id=user_id, provider=payload.get("prv"))
+
+async def _authenticate(token: str) -> Optional[User]:
+    """토큰 검증 후 Principal을 반환한다. tv 클레임이 있으면 DB를 거치지 않는다."""
+    payload = _decode_payload(token)
+    if payload is None:
+        return None
+    user_id = _user_id_from_payload(payload)
+    if user_id is None:
+        return None
+    if JWT_STATELESS_CLAIMS and "tv" in payload:
+        return await _principal_from_claims(user_id, payload)
+    return await _load_principal(user_id)
+
+async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
+    """
+    인증 의존성. 사용자 조회를 AsyncSession으로 수행하여 이벤트 루프를 블로킹하지 않는다.
+    (동기 Session을 async def 안에서 쓰면 요청마다 DB 왕복 동안 루프가 직렬화된다.)
+    Principal 캐시 적중 시 DB를 조회하지 않는다.
+    JWT_STATELESS_CLAIMS 모드의 토큰은 클레임만으로 인증하며, 반환되는 User에는
+    id·provider만 채워져 있다 (그 외 속성이 필요한 라우터는 자체 세션에서 다시 로드한다).
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id_str: str = payload.get("sub")
-        if user_id_str is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
-    
-    user = db.query(User).filter(User.id == int(user_id_str)).first()
+    user = await _authenticate(token)
     if user is None:
         raise credentials_exception
     return user
 
 oauth2_scheme_optional = OAuth2PasswordBearer(tokenUrl="/auth/login", auto_error=False)
 
-async def get_current_user_optional(token: Optional[str] = Depends(oauth2_scheme_optional), db: Session = Depends(get_db)) -> Optional[User]:
+async def get_current_user_optional(token: Optional[str] = Depends(oauth2_scheme_optional)) -> Optional[User]:
     if not token:
         return None
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id_str: str = payload.get("sub")
-        if user_id_str is None:
-            return None
-    except JWTError:
-        return None
-    
-    user = db.query(User).filter(User.id == int(user_id_str)).first()
-    return user
+    return await _authenticate(token)
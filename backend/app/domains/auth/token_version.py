@@ -0,0 +1,148 @@
+"""
+사용자별 토큰 버전(token version).
+무상태 JWT 모드(JWT_STATELESS_CLAIMS)에서 토큰 폐기를 판정한다: 토큰의 tv 클레임이 현재 버전과 다르면 폐기된 토큰.
+
+- 원본: users.token_version (영속). logout/withdraw 는 호출자 트랜잭션에서 bump_token_version 으로 올린다.
+- 캐시: Redis auth:token_version:{user_id} (TOKEN_VERSION_REDIS_TTL_SECONDS) 앞단에 L1 TTLCache.
+  Redis 키가 없으면(만료·flush·재시작) users 에서 다시 읽으므로, 캐시 유실로 폐기된 토큰이 되살아나지 않는다.
+- Redis 쓰기는 "더 큰 값일 때만 SET" 스크립트로 하므로, DB 에서 읽은 오래된 값이 bump 결과를 덮어쓰지 않는다.
+- bump 후 publish 는 커밋 **전에** 호출한다. Redis 쓰기가 실패하면 TokenRevocationError 로 요청을 실패시켜
+  (호출자가 롤백) 폐기가 캐시에 반영되지 않은 채 성공으로 응답하지 않는다.
+- 다른 워커의 L1 에는 최대 TOKEN_VERSION_CACHE_TTL_SECONDS 뒤에 반영된다.
+  Redis 에 연결할 수 없는 워커의 bump 는 DB 에만 기록되며, 다른 워커가 캐시해 둔 이전 값은 Redis TTL 안에 만료된다.
+"""
+import asyncio
+import logging
+import os
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.database import async_session_scope
+from app.core.redis import get_redis
+from app.domains.auth.models import User
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "auth:token_version:{user_id}"
+TOKEN_VERSION_CACHE_TTL_SECONDS = int(os.getenv("TOKEN_VERSION_CACHE_TTL_SECONDS", "5"))
+TOKEN_VERSION_CACHE_MAX_SIZE = int(os.getenv("TOKEN_VERSION_CACHE_MAX_SIZE", "10000"))
+TOKEN_VERSION_REDIS_TTL_SECONDS = int(os.getenv("TOKEN_VERSION_REDIS_TTL_SECONDS", "300"))
+
+# 버전은 단조 증가하므로 기존 값보다 클 때만 저장하고, 저장 후의 값을 반환한다.
+_SET_IF_GREATER_LUA = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '-1')
+local version = tonumber(ARGV[1])
+if version > current then
+    redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+    return version
+end
+return current
+"""
+
+
+class TokenRevocationError(Exception):
+    """토큰 버전 변경을 캐시에 반영하지 못했다. 호출자는 트랜잭션을 롤백하고 실패로 응답한다."""
+
+
+def bump_token_version(session: Session, user_id: int) -> int | None:
+    """users.token_version 을 1 올리고 새 버전을 반환한다 (없는 사용자는 None). commit 은 호출자가 한다."""
+    return session.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(token_version=User.token_version + 1)
+        .returning(User.token_version)
+        .execution_options(synchronize_session=False)
+    ).scalar()
+
+
+class TokenVersionStore:
+    """user id → 현재 토큰 버전. L1 → Redis → users 순으로 조회한다."""
+
+    def __init__(
+        self,
+        cache_ttl_seconds: int = TOKEN_VERSION_CACHE_TTL_SECONDS,
+        cache_max_size: int = TOKEN_VERSION_CACHE_MAX_SIZE,
+        redis_ttl_seconds: int = TOKEN_VERSION_REDIS_TTL_SECONDS,
+    ) -> None:
+        self._local = TTLCache(max_size=cache_max_size, ttl_seconds=cache_ttl_seconds)
+        self._redis_ttl = redis_ttl_seconds
+        self._script = None
+
+    async def current_async(self, user_id: int) -> int | None:
+        """현재 토큰 버전. 없는 사용자이거나 DB 도 읽을 수 없으면 None (호출자는 토큰을 거부한다)."""
+        version = self._local.get(user_id)
+        if version is not None:
+            return version
+        version = await asyncio.to_thread(self._get_from_redis, user_id)
+        if version is None:
+            version = await self._load_from_db(user_id)
+            if version is None:
+                return None
+            version = await asyncio.to_thread(self._fill_redis, user_id, version)
+        self._local.set(user_id, version)
+        return version
+
+    def publish(self, user_id: int, version: int) -> None:
+        """
+        bump 한 버전을 캐시에 반영한다. 커밋 전에 호출한다.
+        Redis 명령이 실패하면 TokenRevocationError. Redis 에 연결할 수 없으면 L1 만 갱신한다.
+        """
+        self._local.set(user_id, version)
+        client = get_redis()
+        if client is None:
+            logger.warning("토큰 버전 캐시 미반영 user=%s — Redis 미가용, users 에만 기록", user_id)
+            return
+        try:
+            self._set_if_greater(client, user_id, version)
+        except Exception as e:
+            self._local.delete(user_id)
+            logger.warning("토큰 버전 캐시 반영 실패 user=%s", user_id, exc_info=True)
+            raise TokenRevocationError(user_id) from e
+
+    def _get_from_redis(self, user_id: int) -> int | None:
+        client = get_redis()
+        if client is None:
+            return None
+        try:
+            raw = client.get(REDIS_KEY_PREFIX.format(user_id=user_id))
+        except Exception:
+            logger.warning("토큰 버전 조회 실패 user=%s", user_id, exc_info=True)
+            return None
+        return int(raw) if raw is not None else None
+
+    @staticmethod
+    async def _load_from_db(user_id: int) -> int | None:
+        try:
+            async with async_session_scope() as db:
+                return await db.scalar(select(User.token_version).where(User.id == user_id))
+        except Exception:
+            logger.warning("토큰 버전 DB 조회 실패 user=%s", user_id, exc_info=True)
+            return None
+
+    def _fill_redis(self, user_id: int, version: int) -> int:
+        """DB 에서 읽은 버전을 캐시에 채운다. 그 사이 bump 가 더 큰 값을 써 뒀으면 그 값을 반환한다."""
+        client = get_redis()
+        if client is None:
+            return version
+        try:
+            return self._set_if_greater(client, user_id, version)
+        except Exception:
+            logger.warning("토큰 버전 캐시 저장 실패 user=%s", user_id, exc_info=True)
+            return version
+
+    def _set_if_greater(self, client, user_id: int, version: int) -> int:
+        if self._script is None:
+            self._script = client.register_script(_SET_IF_GREATER_LUA)
+        return int(self._script(keys=[REDIS_KEY_PREFIX.format(user_id=user_id)], args=[version, self._redis_ttl]))
+
+
+_token_version_store: TokenVersionStore | None = None
+
+
+def get_token_version_store() -> TokenVersionStore:
+    global _token_version_store
+    if _token_version_store is None:
+        _token_version_store = TokenVersionStore()
+    return _token_version_store
@@ -0,0 +1,120 @@
+"""
+일일 할 일 생성 한도 예약 [PRO-B-34].
+COUNT 후 INSERT 하면 같은 사용자의 동시 요청이 모두 한도 검사를 통과할 수 있으므로,
+user_daily_task_counts 카운터를 조건부로 증가시켜 "검사 + 슬롯 예약"을 한 문장으로 처리한다.
+
+- 빠른 경로: UPDATE ... SET count = count + 1 WHERE count < max RETURNING count (행 잠금으로 직렬화)
+- 행이 없는 날: 기존 tasks 수로 초기화하며 INSERT ... ON CONFLICT DO UPDATE (동시 최초 예약 경합 처리)
+- 한도 초과 시 TaskHardLimit 과 같은 limit_blocked 로그를 남기고 MaxActiveTasksExceededError 를 던진다.
+모든 함수는 호출자 트랜잭션 안에서 실행되며 commit 은 호출자가 관리한다.
+"""
+import logging
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import case, func, select, update
+from sqlalchemy.orm import Session
+
+from app.core.database import dialect_insert
+from app.domains.TaskHardLimit.task_hard_limit import MaxActiveTasksExceededError, get_max_active_task_count
+from app.domains.task.models import Task, UserDailyTaskCount
+
+logger = logging.getLogger(__name__)
+
+
+def _count_existing(session: Session, user_id: int, day: date) -> int:
+    start = datetime.combine(day, datetime.min.time())
+    return session.scalar(
+        select(func.count(Task.id)).where(
+            Task.user_id == user_id,
+            Task.due_date >= start,
+            Task.due_date < start + timedelta(days=1),
+        )
+    ) or 0
+
+
+def reserve_daily_slot(session: Session, user_id: int, day: date) -> int:
+    """
+    day 의 할 일 슬롯 1개를 예약하고 예약 후 개수를 반환한다.
+    한도에 도달했으면 MaxActiveTasksExceededError.
+    """
+    return reserve_daily_slots(session, user_id, day, 1)
+
+
+def reserve_daily_slots(session: Session, user_id: int, day: date, n: int) -> int:
+    """
+    day 의 슬롯 n개를 한 번에 예약한다 (전부 또는 전무). 예약 후 개수를 반환한다.
+    예약 후 개수가 한도를 넘으면 MaxActiveTasksExceededError.
+    """
+    max_count = get_max_active_task_count()
+    counter = UserDailyTaskCount.__table__
+
+    reserved = session.execute(
+        update(counter)
+        .where(counter.c.user_id == user_id, counter.c.day == day, counter.c.count + n <= max_count)
+        .values(count=counter.c.count + n)
+        .returning(counter.c.count)
+    ).scalar()
+    if reserved is not None:
+        return reserved
+
+    existing = session.scalar(
+        select(counter.c.count).where(counter.c.user_id == user_id, counter.c.day == day)
+    )
+    if existing is None:
+        # 카운터 도입 이전 데이터가 있을 수 있으므로 실제 tasks 수로 초기화한다.
+        existing = _count_existing(session, user_id, day)
+        if existing + n <= max_count:
+            stmt = dialect_insert(session, counter).values(user_id=user_id, day=day, count=existing + n)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[counter.c.user_id, counter.c.day],
+                set_={"count": counter.c.count + n},
+                where=counter.c.count + n <= max_count,
+            ).returning(counter.c.count)
+            reserved = session.execute(stmt).scalar()
+            if reserved is not None:
+                return reserved
+            existing = max_count
+
+    # 조건부 UPDATE 직후 다른 요청이 슬롯을 반납해 existing 이 한도 아래로 보이더라도
+    # 이번 요청은 한도 도달로 처리한다.
+    active_task_count = max(existing, max_count - n + 1)
+    logger.warning(
+        "limit_blocked",
+        extra={
+            "active": active_task_count,
+            "next": active_task_count + n,
+            "max": max_count,
+            "user_id": user_id,
+        },
+    )
+    raise MaxActiveTasksExceededError(
+        max_active_task_count=max_count,
+        active_task_count=active_task_count,
+        next_task_count=active_task_count + n,
+    )
+
+
+def release_daily_slots(session: Session, user_id: int, days: dict[date, int]) -> None:
+    """삭제된 할 일만큼 일자별 카운터를 감소시킨다. 카운터 행이 없는 날은 건너뛴다."""
+    counter = UserDailyTaskCount.__table__
+    for day, n in days.items():
+        if n <= 0:
+            continue
+        session.execute(
+            update(counter)
+            .where(counter.c.user_id == user_id, counter.c.day == day)
+            .values(count=case((counter.c.count > n, counter.c.count - n), else_=0))
+        )
+
+
+def move_daily_slot(session: Session, user_id: int, from_day: date, to_day: date) -> None:
+    """할 일의 기한 일자가 바뀐 경우 카운터를 옮긴다 (한도 검사 없음, 행이 없는 날은 건너뜀)."""
+    if from_day == to_day:
+        return
+    release_daily_slots(session, user_id, {from_day: 1})
+    counter = UserDailyTaskCount.__table__
+    session.execute(
+        update(counter)
+        .where(counter.c.user_id == user_id, counter.c.day == to_day)
+        .values(count=counter.c.count + 1)
+    )
@@ -3,12 +3,23 @@ Task 도메인 모델.
 과업(Task)의 상태(status)와 기한(due_date)을 중심으로 정의한다.
 """
 import enum
+import zoneinfo
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, Enum, Integer, String, Text, func
+from sqlalchemy import Boolean, Column, Date, DateTime, Enum, ForeignKey, Index, Integer, String, Text, func
 
 from app.core.database import Base
 
+# tasks.due_date 는 이 시간대의 naive 시각으로 저장한다
+LOCAL_TZ = zoneinfo.ZoneInfo("Asia/Seoul")
+
+
+def to_local_naive(due_date: datetime) -> datetime:
+    """tz 포함 시각을 서비스 기준 시간대(Asia/Seoul)의 naive datetime으로 맞춘다."""
+    if due_date.tzinfo is not None:
+        return due_date.astimezone(LOCAL_TZ).replace(tzinfo=None)
+    return due_date
+
 
 class TaskStatus(str, enum.Enum):
     """과업 상태 열거형."""
@@ -23,6 +34,10 @@ class Task(Base):
     """과업 테이블."""
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # 목록 키셋 페이지네이션: WHERE user_id, is_archived + ORDER BY (due_date, id)
+        Index("ix_tasks_user_archived_due_id", "user_id", "is_archived", "due_date", "id"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     title = Column(String(255), nullable=False)
@@ -44,3 +59,17 @@ class Task(Base):
     is_archived = Column(Boolean, nullable=False, default=False, index=True)  # [PRO-B-21]
     created_at = Column(DateTime, nullable=False, server_default=func.now())
     updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
+
+
+class UserDailyTaskCount(Base):
+    """
+    사용자·일자별 할 일 수 (일일 생성 한도 예약용).
+    create_task 가 같은 트랜잭션 안에서 조건부 UPDATE/UPSERT 로 슬롯을 예약하므로
+    동시 요청에서도 한도를 넘지 않는다. 행이 없는 날은 최초 예약 시 기존 tasks 수로 초기화된다.
+    """
+
+    __tablename__ = "user_daily_task_counts"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,140 @@
+"""
+Task 조회 Repository (AsyncSession).
+async 라우터가 스레드풀을 거치지 않고 이벤트 루프에서 바로 DB I/O를 기다리도록
+목록·단건·일별 카운트 조회를 AsyncSession 기반으로 제공한다. caller가 세션을 관리한다.
+
+목록 조회는 (due_date, id) 키셋 페이지네이션을 사용한다. id 를 보조 키로 두어
+같은 due_date 내에서도 순서가 안정적이며, ix_tasks_user_archived_due_id 인덱스를 탄다.
+limit 가 None이면 페이지를 나누지 않고 전체를 같은 순서로 반환한다 (기존 클라이언트 호환).
+"""
+import base64
+import json
+from datetime import datetime
+from typing import NamedTuple
+
+from sqlalchemy import case, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from app.domains.task.models import Task, TaskStatus
+
+
+class TaskPage(NamedTuple):
+    """목록 한 페이지. next_cursor 가 None이면 마지막 페이지."""
+
+    items: list[Task]
+    next_cursor: str | None
+
+
+def encode_cursor(due_date: datetime, task_id: int) -> str:
+    """(due_date, id) → 불투명 커서 문자열 (base64url JSON)."""
+    raw = json.dumps({"d": due_date.isoformat(), "i": task_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """커서 문자열 → (due_date, id). 형식이 잘못되면 ValueError."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(data["d"]), int(data["i"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("invalid cursor") from e
+
+
+async def _fetch_page(
+    session: AsyncSession,
+    stmt: Select,
+    descending: bool,
+    limit: int | None,
+    after: tuple[datetime, int] | None,
+) -> TaskPage:
+    """
+    (due_date, id) 순으로 after 다음부터 limit 건을 읽는다.
+    limit+1 건을 조회해 다음 페이지 유무를 판단한다. limit 가 None이면 남은 전체를 읽는다.
+    """
+    if after is not None:
+        key, bound = tuple_(Task.due_date, Task.id), tuple_(*after)
+        stmt = stmt.where(key < bound if descending else key > bound)
+    if descending:
+        stmt = stmt.order_by(Task.due_date.desc(), Task.id.desc())
+    else:
+        stmt = stmt.order_by(Task.due_date.asc(), Task.id.asc())
+    if limit is None:
+        return TaskPage(list((await session.scalars(stmt)).all()), None)
+    rows = list((await session.scalars(stmt.limit(limit + 1))).all())
+    if len(rows) <= limit:
+        return TaskPage(rows, None)
+    last = rows[limit - 1]
+    return TaskPage(rows[:limit], encode_cursor(last.due_date, last.id))
+
+
+class AsyncTaskRepository:
+    """Task 비동기 조회 전담 Repository. 단일 AsyncSession 내에서 호출되어야 한다."""
+
+    @staticmethod
+    async def list_active(
+        session: AsyncSession, user_id: int, limit: int | None, after: tuple[datetime, int] | None = None
+    ) -> TaskPage:
+        """보관되지 않은 활성 할 일 (due_date, id 오름차순)."""
+        stmt = select(Task).where(Task.user_id == user_id, Task.is_archived == False)  # noqa: E712
+        return await _fetch_page(session, stmt, descending=False, limit=limit, after=after)
+
+    @staticmethod
+    async def list_archived(
+        session: AsyncSession, user_id: int, limit: int | None, after: tuple[datetime, int] | None = None
+    ) -> TaskPage:
+        """보관함 할 일 (due_date, id 내림차순)."""
+        stmt = select(Task).where(Task.user_id == user_id, Task.is_archived == True)  # noqa: E712
+        return await _fetch_page(session, stmt, descending=True, limit=limit, after=after)
+
+    @staticmethod
+    async def list_past_incomplete(
+        session: AsyncSession, user_id: int, before: datetime, limit: int | None, after: tuple[datetime, int] | None = None
+    ) -> TaskPage:
+        """before 이전 기한의 미완료·미보관 할 일 (due_date, id 내림차순)."""
+        stmt = select(Task).where(
+            Task.user_id == user_id,
+            Task.is_archived == False,  # noqa: E712
+            Task.due_date < before,
+            Task.status != TaskStatus.COMPLETED,
+        )
+        return await _fetch_page(session, stmt, descending=True, limit=limit, after=after)
+
+    @staticmethod
+    async def get_for_user(session: AsyncSession, task_id: int, user_id: int) -> Task | None:
+        """소유자 조건을 포함한 단건 조회."""
+        stmt = select(Task).where(Task.id == task_id, Task.user_id == user_id)
+        return (await session.scalars(stmt)).first()
+
+    @staticmethod
+    async def count_for_day(
+        session: AsyncSession,
+        user_id: int,
+        start: datetime,
+        end: datetime,
+        status: TaskStatus | None = None,
+    ) -> int:
+        """[start, end) 기한의 할 일 수. status 지정 시 해당 상태만 센다."""
+        stmt = select(func.count(Task.id)).where(
+            Task.user_id == user_id,
+            Task.due_date >= start,
+            Task.due_date < end,
+        )
+        if status is not None:
+            stmt = stmt.where(Task.status == status)
+        return (await session.scalar(stmt)) or 0
+
+    @staticmethod
+    async def day_stats(session: AsyncSession, user_id: int, start: datetime, end: datetime) -> tuple[int, int]:
+        """[start, end) 기한의 (전체 수, 완료 수)를 조건부 집계 한 번으로 구한다."""
+        stmt = select(
+            func.count(Task.id),
+            func.coalesce(func.sum(case((Task.status == TaskStatus.COMPLETED, 1), else_=0)), 0),
+        ).where(
+            Task.user_id == user_id,
+            Task.due_date >= start,
+            Task.due_date < end,
+        )
+        total, completed = (await session.execute(stmt)).one()
+        return int(total), int(completed)
@@ -1,21 +1,39 @@
-from datetime import datetime, timezone, timedelta
-import zoneinfo
-from typing import List
+import asyncio
+from datetime import date, datetime, timezone, timedelta
+import os
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, insert, update
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 
-from app.core.database import get_session_factory
+from app.core.database import get_async_db, get_db
 from app.domains.task import models, schemas
+from app.domains.task.daily_limit import release_daily_slots, reserve_daily_slot, reserve_daily_slots
+from app.domains.TaskHardLimit.task_hard_limit import MaxActiveTasksExceededError
+from app.domains.task.repository import AsyncTaskRepository, TaskPage, decode_cursor
+from app.domains.task.stats_cache import get_task_stats_cache
 from app.domains.auth.security import get_current_user
 from app.domains.auth.models import User
+from app.domains.auth.principal_cache import get_principal_cache
 from app.domains.TodayFocus.today_focus.service import TodayFocusServiceImpl
 from app.infrastructure.chain.chain_manager import ChainManager
 from app.infrastructure.chain.service import ChainServiceImpl
+from app.infrastructure.task_miss.miss_counter import apply_miss_deltas, invalidate_miss_counts, miss_delta
+from app.infrastructure.task_miss.scheduler import get_due_timer
+from app.infrastructure.task_miss.service import TaskMissServiceImpl
 
 router = APIRouter()
 
+# 목록 API 페이지 크기. limit·cursor 를 보낸 요청만 페이지로 나누며, 다음 페이지 커서는
+# X-Next-Cursor 응답 헤더로 전달한다. 둘 다 없으면 기존처럼 전체 목록을 반환한다.
+TASK_PAGE_SIZE = int(os.getenv("TASK_PAGE_SIZE", "100"))
+TASK_PAGE_SIZE_MAX = int(os.getenv("TASK_PAGE_SIZE_MAX", "500"))
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+# batch-action 한 문장에 넣는 id 수 (IN 목록·바인드 파라미터 한도 대비)
+BATCH_ACTION_CHUNK_SIZE = int(os.getenv("BATCH_ACTION_CHUNK_SIZE", "500"))
+
 _today_focus_service: TodayFocusServiceImpl | None = None
 
 
@@ -25,6 +43,15 @@ def _get_today_focus_service() -> TodayFocusServiceImpl:
         _today_focus_service = TodayFocusServiceImpl()
     return _today_focus_service
 
+_task_miss_service: TaskMissServiceImpl | None = None
+
+
+def _get_task_miss_service() -> TaskMissServiceImpl:
+    global _task_miss_service
+    if _task_miss_service is None:
+        _task_miss_service = TaskMissServiceImpl()
+    return _task_miss_service
+
 _chain_service: ChainServiceImpl | None = None
 
 def _get_chain_service() -> ChainServiceImpl:
@@ -33,12 +60,14 @@ def _get_chain_service() -> ChainServiceImpl:
         _chain_service = ChainServiceImpl()
     return _chain_service
 
-def get_db():
-    db = get_session_factory()()
-    try:
-        yield db
-    finally:
-        db.close()
+def _completed(task_status) -> int:
+    return 1 if task_status == models.TaskStatus.COMPLETED else 0
+
+def _add_stats_delta(deltas: dict[date, tuple[int, int]], due_date: datetime, total: int, completed: int) -> None:
+    """일자별 통계 증감을 누적한다 (커밋 후 get_task_stats_cache().apply_deltas 로 반영)."""
+    day = due_date.date()
+    prev_total, prev_completed = deltas.get(day, (0, 0))
+    deltas[day] = (prev_total + total, prev_completed + completed)
 
 def get_today_bounds():
     now = datetime.now()
@@ -46,44 +75,64 @@ def get_today_bounds():
     end_of_day = start_of_day + timedelta(days=1)
     return start_of_day, end_of_day
 
+def _page_response(response: Response, page: TaskPage) -> list[models.Task]:
+    if page.next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
+
+def _page_after(
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+) -> Optional[tuple[datetime, int]]:
+    """커서 쿼리 파라미터를 (due_date, id) 키로 해석한다. 형식 오류 시 400."""
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor.")
+
+def _page_limit(limit: Optional[int], after: Optional[tuple[datetime, int]]) -> Optional[int]:
+    """limit·cursor 가 모두 없으면 None(전체 목록). cursor 만 있으면 기본 페이지 크기."""
+    if limit is None and after is not None:
+        return TASK_PAGE_SIZE
+    return limit
+
 @router.get("", response_model=List[schemas.TaskResponse])
-def list_my_tasks(
-    db: Session = Depends(get_db),
+async def list_my_tasks(
+    response: Response,
+    after: Optional[tuple[datetime, int]] = Depends(_page_after),
+    limit: Optional[int] = Query(None, ge=1, le=TASK_PAGE_SIZE_MAX),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
-    """자신의 활성 할 일 조회 (보관되지 않은 것)"""
-    tasks = db.query(models.Task).filter(
-        models.Task.user_id == current_user.id,
-        models.Task.is_archived == False
-    ).order_by(models.Task.due_date.asc()).all()
-    return tasks
+    """자신의 활성 할 일 조회 (보관되지 않은 것, due_date 오름차순). limit/cursor 지정 시 페이지 단위, 다음 페이지가 있으면 X-Next-Cursor 헤더."""
+    page = await AsyncTaskRepository.list_active(db, current_user.id, _page_limit(limit, after), after)
+    return _page_response(response, page)
 
 @router.get("/archive", response_model=List[schemas.TaskResponse])
-def list_archived_tasks(
-    db: Session = Depends(get_db),
+async def list_archived_tasks(
+    response: Response,
+    after: Optional[tuple[datetime, int]] = Depends(_page_after),
+    limit: Optional[int] = Query(None, ge=1, le=TASK_PAGE_SIZE_MAX),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
-    """보관함 조회"""
-    tasks = db.query(models.Task).filter(
-        models.Task.user_id == current_user.id,
-        models.Task.is_archived == True
-    ).order_by(models.Task.due_date.desc()).all()
-    return tasks
+    """보관함 조회 (due_date 내림차순). limit/cursor 지정 시 페이지 단위, 다음 페이지가 있으면 X-Next-Cursor 헤더."""
+    page = await AsyncTaskRepository.list_archived(db, current_user.id, _page_limit(limit, after), after)
+    return _page_response(response, page)
 
 @router.get("/past-incomplete", response_model=List[schemas.TaskResponse])
-def list_past_incomplete_tasks(
-    db: Session = Depends(get_db),
+async def list_past_incomplete_tasks(
+    response: Response,
+    after: Optional[tuple[datetime, int]] = Depends(_page_after),
+    limit: Optional[int] = Query(None, ge=1, le=TASK_PAGE_SIZE_MAX),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
-    """과거 미완료 할 일 조회"""
+    """과거 미완료 할 일 조회 (due_date 내림차순). limit/cursor 지정 시 페이지 단위, 다음 페이지가 있으면 X-Next-Cursor 헤더."""
     start_of_day, _ = get_today_bounds()
-    tasks = db.query(models.Task).filter(
-        models.Task.user_id == current_user.id,
-        models.Task.is_archived == False,
-        models.Task.due_date < start_of_day,
-        models.Task.status != models.TaskStatus.COMPLETED
-    ).order_by(models.Task.due_date.desc()).all()
-    return tasks
+    page = await AsyncTaskRepository.list_past_incomplete(db, current_user.id, start_of_day, _page_limit(limit, after), after)
+    return _page_response(response, page)
 
 @router.post("", response_model=schemas.TaskResponse, status_code=status.HTTP_201_CREATED)
 def create_task(
@@ -94,11 +143,7 @@ def create_task(
     # [PRO-B-35] 미래 날짜 차단
     start_of_day, end_of_day = get_today_bounds()
     
-    if task_data.due_date.tzinfo is not None:
-        local_tz = zoneinfo.ZoneInfo("Asia/Seoul")
-        due_date_naive = task_data.due_date.astimezone(local_tz).replace(tzinfo=None)
-    else:
-        due_date_naive = task_data.due_date
+    due_date_naive = models.to_local_naive(task_data.due_date)
     
     if due_date_naive >= end_of_day:
         raise HTTPException(
@@ -106,17 +151,14 @@ def create_task(
             detail="Cannot create a task for a future date."
         )
 
-    # [PRO-B-34] 일일 5개 제한 차단
-    c_tasks_today = db.query(func.count(models.Task.id)).filter(
-        models.Task.user_id == current_user.id,
-        models.Task.due_date >= start_of_day,
-        models.Task.due_date < end_of_day
-    ).scalar()
-    
-    if c_tasks_today >= 5:
+    # [PRO-B-34] 일일 한도: 기한 일자의 카운터를 같은 트랜잭션에서 조건부 증가시켜 슬롯을 예약한다.
+    try:
+        reserve_daily_slot(db, current_user.id, due_date_naive.date())
+    except MaxActiveTasksExceededError as e:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Maximum 5 tasks allowed per day."
+            detail=f"Maximum {e.max_active_task_count} tasks allowed per day."
         )
 
     new_task = models.Task(
@@ -129,11 +171,68 @@ def create_task(
     db.add(new_task)
     db.commit()
     db.refresh(new_task)
+    get_task_stats_cache().apply_deltas(current_user.id, {new_task.due_date.date(): (1, 0)})
+    get_due_timer().schedule(new_task.id, new_task.user_id, new_task.due_date)
     if task_data.session_id:
         now_utc = datetime.now(timezone.utc).replace(tzinfo=None)
         _get_today_focus_service().record_action(task_data.session_id, now_utc)
     return new_task
 
+@router.post("/bulk", response_model=List[schemas.TaskResponse], status_code=status.HTTP_201_CREATED)
+def create_tasks_bulk(
+    bulk_data: schemas.TaskBulkCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    여러 할 일을 한 번에 생성한다 (전부 또는 전무).
+    미래 날짜·일일 한도를 배치 전체에 대해 검사하고, 일자별로 슬롯을 한 번에 예약한 뒤
+    단일 INSERT(executemany)로 삽입한다. TodayFocus 액션 기록은 배치당 1회.
+    """
+    _, end_of_day = get_today_bounds()
+    rows = []
+    per_day: dict[date, int] = {}
+    for item in bulk_data.tasks:
+        due_date_naive = models.to_local_naive(item.due_date)
+        # [PRO-B-35] 미래 날짜 차단
+        if due_date_naive >= end_of_day:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cannot create a task for a future date."
+            )
+        rows.append({
+            "title": item.title,
+            "description": item.description,
+            "due_date": due_date_naive,
+            "user_id": current_user.id,
+            "status": models.TaskStatus.PENDING,
+        })
+        per_day[due_date_naive.date()] = per_day.get(due_date_naive.date(), 0) + 1
+
+    # [PRO-B-34] 일일 한도: 일자별 n개 슬롯을 조건부로 한 번에 예약
+    try:
+        for day, n in sorted(per_day.items()):
+            reserve_daily_slots(db, current_user.id, day, n)
+    except MaxActiveTasksExceededError as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Maximum {e.max_active_task_count} tasks allowed per day."
+        )
+
+    # RETURNING 으로 서버 기본값(created_at 등)까지 받아 두고, commit 으로 만료되기 전에 직렬화한다.
+    created = [
+        schemas.TaskResponse.model_validate(task)
+        for task in db.scalars(insert(models.Task).returning(models.Task), rows)
+    ]
+    db.commit()
+    get_task_stats_cache().apply_deltas(current_user.id, {day: (n, 0) for day, n in per_day.items()})
+    get_due_timer().schedule_many((task.id, task.user_id, task.due_date) for task in created)
+    if bulk_data.session_id:
+        now_utc = datetime.now(timezone.utc).replace(tzinfo=None)
+        _get_today_focus_service().record_action(bulk_data.session_id, now_utc)
+    return created
+
 @router.patch("/{task_id}", response_model=schemas.TaskUpdateResponse)
 def update_task(
     task_id: int,
@@ -149,6 +248,8 @@ def update_task(
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
+    was_completed = _completed(task.status)
+    previous_status = task.status
     if task_data.title is not None:
         task.title = task_data.title
     if task_data.description is not None:
@@ -158,26 +259,41 @@ def update_task(
     if task_data.is_archived is not None:
         task.is_archived = task_data.is_archived
 
-    db.commit()
-    db.refresh(task)
+    # 과업 변경·세션 로그 액션·완료 이벤트·체인/일별 집계를 한 세션, 한 번의 commit 으로 처리한다.
+    now_utc = datetime.now(timezone.utc)
     if task_data.session_id:
-        now_utc = datetime.now(timezone.utc).replace(tzinfo=None)
-        _get_today_focus_service().record_action(task_data.session_id, now_utc)
+        _get_today_focus_service().record_action(task_data.session_id, now_utc.replace(tzinfo=None), db)
 
     # [PRO-B-44] task_complete 시 서버 기반 집계: Raw Event + ChainLength·일별 집계 원자적 갱신, 멱등성 보장
     chain_length: int | None = None
     is_long_term_chain: bool | None = None
+    completion_result = None
     if task_data.status == models.TaskStatus.COMPLETED:
-        now_utc_chain = datetime.now(timezone.utc)
         completion_result = ChainManager.record_completion(
             task_id=task_id,
             user_id=current_user.id,
-            completed_at=now_utc_chain,
+            completed_at=now_utc,
             idempotency_key=f"task:{task_id}",
+            session=db,
         )
         chain_length = completion_result.chain_length
         is_long_term_chain = completion_result.is_long_term_chain
 
+    miss_deltas = {current_user.id: miss_delta(previous_status, task.status)}
+    apply_miss_deltas(db, miss_deltas)
+    db.commit()
+    db.refresh(task)
+    get_task_stats_cache().apply_deltas(
+        current_user.id, {task.due_date.date(): (0, _completed(task.status) - was_completed)}
+    )
+    if completion_result is not None and not completion_result.already_processed:
+        get_principal_cache().invalidate(current_user.id)
+    _get_task_miss_service().apply_cache_deltas(miss_deltas)
+    if task.status in (models.TaskStatus.COMPLETED, models.TaskStatus.TASK_MISS):
+        get_due_timer().cancel(task.id)
+    else:
+        get_due_timer().schedule(task.id, task.user_id, task.due_date)
+
     response = schemas.TaskUpdateResponse.model_validate(task)
     response.chain_length = chain_length
     response.is_long_term_chain = is_long_term_chain
@@ -197,60 +313,119 @@ def delete_task(
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
         
+    stats_delta = {task.due_date.date(): (-1, -_completed(task.status))}
+    miss_deltas = {current_user.id: miss_delta(task.status, None)}
+    release_daily_slots(db, current_user.id, {task.due_date.date(): 1})
+    apply_miss_deltas(db, miss_deltas)
     db.delete(task)
     db.commit()
+    get_task_stats_cache().apply_deltas(current_user.id, stats_delta)
+    _get_task_miss_service().apply_cache_deltas(miss_deltas)
+    get_due_timer().cancel(task_id)
     return {"message": "Task permanently deleted"}
 
+def _chunks(ids: list[int], size: int):
+    for offset in range(0, len(ids), size):
+        yield ids[offset:offset + size]
+
 @router.post("/batch-action")
 def batch_action_past_tasks(
     action_data: schemas.TaskBatchAction,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
+    """
+    과거 할 일 일괄 보관/삭제.
+    ORM 객체를 로드하지 않고 id 청크 단위의 UPDATE/DELETE ... RETURNING 으로 처리하며,
+    반환된 행(due_date, status)으로 통계·일일 한도 카운터를 갱신한다. 전체가 한 트랜잭션이다.
+    보관은 상태를 대기로 되돌리므로 커밋 후 기한 타이머에 다시 올리고, 삭제한 과업은 타이머에서 뺀다.
+    """
     if action_data.action not in ["archive", "delete"]:
         raise HTTPException(status_code=400, detail="Invalid action")
 
-    tasks = db.query(models.Task).filter(
-        models.Task.id.in_(action_data.task_ids),
-        models.Task.user_id == current_user.id
-    ).all()
+    task_ids = sorted(set(action_data.task_ids))
+    Task = models.Task
+    affected = 0
+    affected_days: set[date] = set()
+    rescheduled: list[tuple[int, int, datetime]] = []
+    deleted_ids: list[int] = []
+    stats_deltas: dict[date, tuple[int, int]] = {}
+    released: dict[date, int] = {}
+    missed_deleted = 0
 
-    if not tasks:
-        return {"message": "No valid tasks found for the operation"}
+    for chunk in _chunks(task_ids, BATCH_ACTION_CHUNK_SIZE):
+        owned = (Task.id.in_(chunk), Task.user_id == current_user.id)
+        if action_data.action == "archive":
+            rows = db.execute(
+                update(Task)
+                .where(*owned)
+                .values(is_archived=True, status=models.TaskStatus.PENDING)  # optional status reset if wanted
+                .returning(Task.id, Task.due_date)
+                .execution_options(synchronize_session=False)
+            ).all()
+            affected_days.update(due_date.date() for _, due_date in rows)
+            rescheduled.extend((task_id, current_user.id, due_date) for task_id, due_date in rows)
+        else:
+            rows = db.execute(
+                delete(Task)
+                .where(*owned)
+                .returning(Task.id, Task.due_date, Task.status)
+                .execution_options(synchronize_session=False)
+            ).all()
+            for task_id, due_date, task_status in rows:
+                deleted_ids.append(task_id)
+                _add_stats_delta(stats_deltas, due_date, -1, -_completed(task_status))
+                released[due_date.date()] = released.get(due_date.date(), 0) + 1
+                missed_deleted += task_status == models.TaskStatus.TASK_MISS
+        affected += len(rows)
+
+    if not affected:
+        return {"message": "No valid tasks found for the operation", "affected": 0}
 
     if action_data.action == "archive":
-        for t in tasks:
-            t.is_archived = True
-            t.status = models.TaskStatus.PENDING # optional status reset if wanted
+        # 대기로 되돌린 과업 중 task_miss 였던 수를 알 수 없으므로 누적 miss 카운터는 재집계되게 지운다.
+        invalidate_miss_counts(db, [current_user.id])
         db.commit()
-        return {"message": f"Archived {len(tasks)} tasks."}
+        # 완료→대기 전환 수를 알 수 없으므로 해당 일자 통계는 재집계되게 삭제한다.
+        get_task_stats_cache().invalidate(current_user.id, *affected_days)
+        get_due_timer().schedule_many(rescheduled)
+        message = f"Archived {affected} tasks."
     else:
-        for t in tasks:
-            db.delete(t)
+        release_daily_slots(db, current_user.id, released)
+        apply_miss_deltas(db, {current_user.id: -missed_deleted})
         db.commit()
-        return {"message": f"Deleted {len(tasks)} tasks."}
+        get_task_stats_cache().apply_deltas(current_user.id, stats_deltas)
+        due_timer = get_due_timer()
+        for task_id in deleted_ids:
+            due_timer.cancel(task_id)
+        message = f"Deleted {affected} tasks."
+    _get_task_miss_service().invalidate_cache(str(current_user.id))
+    return {"message": message, "affected": affected}
 
 @router.get("/stats/today")
-def get_productivity_stats(
-    db: Session = Depends(get_db),
+async def get_productivity_stats(
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
-    """[PRO-B-40] 오늘 생산성 달성률 조회"""
+    """
+    [PRO-B-40] 오늘 생산성 달성률 조회.
+    사용자·일자별 카운터 캐시 적중 시 DB를 조회하지 않고, 미스 시 조건부 집계 1회로 채운다.
+    """
     start_of_day, end_of_day = get_today_bounds()
-    
-    total_today = db.query(func.count(models.Task.id)).filter(
-        models.Task.user_id == current_user.id,
-        models.Task.due_date >= start_of_day,
-        models.Task.due_date < end_of_day
-    ).scalar()
-    
-    completed_today = db.query(func.count(models.Task.id)).filter(
-        models.Task.user_id == current_user.id,
-        models.Task.due_date >= start_of_day,
-        models.Task.due_date < end_of_day,
-        models.Task.status == models.TaskStatus.COMPLETED
-    ).scalar()
-    
+    cache = get_task_stats_cache()
+    day = start_of_day.date()
+
+    cached = await asyncio.to_thread(cache.get, current_user.id, day)
+    if cached is None:
+        # 집계 도중 커밋된 쓰기가 있으면 set 이 오래된 값을 저장하지 않도록 세대를 먼저 받는다
+        token = await asyncio.to_thread(cache.fill_token, current_user.id, day)
+        total_today, completed_today = await AsyncTaskRepository.day_stats(
+            db, current_user.id, start_of_day, end_of_day
+        )
+        await asyncio.to_thread(cache.set, current_user.id, day, total_today, completed_today, token)
+    else:
+        total_today, completed_today = cached
+
     return {
         "total": total_today,
         "completed": completed_today,
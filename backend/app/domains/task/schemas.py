@@ -8,6 +8,9 @@ from pydantic import BaseModel, Field
 
 from app.domains.task.models import TaskStatus
 
+# POST /task-miss/miss-counts:batch 한 요청당 최대 사용자 수
+MISS_COUNT_BATCH_MAX_USERS = 1000
+
 
 class TaskResponse(BaseModel):
     """과업 단건 응답."""
@@ -56,11 +59,29 @@ class CumulativeMissCountResponse(BaseModel):
     timestamp: datetime = Field(..., description="조회 시각 (ms 단위 정밀도)")
 
 
+class MissCountBatchRequest(BaseModel):
+    """사용자별 누적 task_miss 카운트 일괄 조회 요청."""
+
+    user_ids: list[str] = Field(
+        ..., min_length=1, max_length=MISS_COUNT_BATCH_MAX_USERS, description="사용자 식별자 목록"
+    )
+
+
+class MissCountBatchResponse(BaseModel):
+    """일괄 조회 응답. 요청 순서대로, 중복 id 는 한 번만 담는다."""
+
+    counts: list[CumulativeMissCountResponse]
+    cache_hits: int = Field(..., description="Redis 캐시 적중 사용자 수")
+    execution_time_ms: float = Field(..., description="조회 소요 시간(ms)")
+
+
 class TaskMissBatchResultResponse(BaseModel):
     """배치 실행 결과 응답."""
 
     transitioned_count: int = Field(..., description="task_miss로 전환된 과업 수")
     execution_time_ms: float = Field(..., description="배치 실행 소요 시간(ms)")
+    chunks: int = Field(0, description="청크(커밋) 수")
+    max_lock_hold_ms: float = Field(0.0, description="청크별 UPDATE~커밋 최대 소요(쓰기 잠금 보유) 시간(ms)")
     timestamp: datetime = Field(..., description="배치 실행 시각")
 
 class TaskCreate(BaseModel):
@@ -69,6 +90,16 @@ class TaskCreate(BaseModel):
     due_date: datetime
     session_id: Optional[str] = Field(None, description="[STEP 3] 액션 시 session_log first_action_at / last_action_at 갱신용")
 
+class TaskBulkItem(BaseModel):
+    title: str = Field(..., max_length=255)
+    description: Optional[str] = None
+    due_date: datetime
+
+class TaskBulkCreate(BaseModel):
+    """POST /tasks/bulk — 여러 할 일을 한 트랜잭션으로 생성 (로컬 저장소 복원·하루 계획)."""
+    tasks: list[TaskBulkItem] = Field(..., min_length=1, max_length=100)
+    session_id: Optional[str] = Field(None, description="[STEP 3] session_log 액션 갱신용 (배치당 1회)")
+
 class TaskUpdate(BaseModel):
     title: Optional[str] = Field(None, max_length=255)
     description: Optional[str] = None
@@ -0,0 +1,171 @@
+"""
+사용자·일자별 할 일 통계 캐시 (/tasks/stats/today).
+키: task:stats:{user_id}:{YYYY-MM-DD} (Redis hash: total, completed)
+
+- 조회: 캐시 적중 시 DB를 조회하지 않는다. 미스 시 호출자가 fill_token 을 받은 뒤 집계하고 set 한다.
+- 갱신: create/update/delete/batch-action 은 커밋 후 apply_deltas 로 카운터를 증감한다.
+  Lua 스크립트로 키가 있을 때만 HINCRBY 하므로, 캐시가 없는 날은 다음 조회에서 새로 집계된다.
+- 증감 규칙을 적용하기 어려운 경로(보관함 전환 등)는 invalidate 로 삭제한다.
+- 채우기 경합: apply_deltas·invalidate 는 (사용자, 일자) 세대(task:stats:gen:...)를 올린다.
+  set 은 집계 전에 받은 세대가 그대로일 때만 저장하므로, 집계 도중 커밋된 쓰기의 증감이
+  키가 없어 버려진 뒤 오래된 집계가 덮어쓰는 일이 없다 (그 경우 다음 조회가 다시 집계한다).
+- Redis 미가용 시 프로세스 내 TTLCache를 사용하며, 이때 쓰기는 항목 삭제 + 세대 증가로 처리한다.
+"""
+import logging
+import os
+import threading
+from datetime import date
+
+from app.core.cache import TTLCache
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY = "task:stats:{user_id}:{day}"
+GENERATION_KEY = "task:stats:gen:{user_id}:{day}"
+TASK_STATS_CACHE_TTL_SECONDS = int(os.getenv("TASK_STATS_CACHE_TTL_SECONDS", "300"))
+
+# 키가 존재할 때만 증감 (없으면 0 반환 → 다음 조회 때 DB 집계로 채워짐)
+_APPLY_DELTA_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('HINCRBY', KEYS[1], 'total', ARGV[1])
+    redis.call('HINCRBY', KEYS[1], 'completed', ARGV[2])
+    return 1
+end
+return 0
+"""
+
+# 세대가 채우기 시작 시점과 같을 때만 저장 (KEYS: 통계, 세대 / ARGV: 세대, total, completed, ttl)
+_SET_IF_GENERATION_LUA = """
+if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'total', ARGV[2], 'completed', ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return 1
+"""
+
+
+class TaskStatsCache:
+    """(user_id, 일자) → (total, completed) 카운터 캐시."""
+
+    def __init__(self, ttl_seconds: int = TASK_STATS_CACHE_TTL_SECONDS) -> None:
+        self._ttl = ttl_seconds
+        self._local = TTLCache(max_size=10000, ttl_seconds=ttl_seconds)
+        self._local_generations = TTLCache(max_size=10000, ttl_seconds=ttl_seconds)
+        self._local_lock = threading.Lock()
+        self._script = None
+        self._set_script = None
+
+    def get(self, user_id: int, day: date) -> tuple[int, int] | None:
+        client = get_redis()
+        if client is None:
+            return self._local.get((user_id, day))
+        try:
+            total, completed = client.hmget(self._key(user_id, day), "total", "completed")
+        except Exception:
+            logger.warning("통계 캐시 조회 실패 user=%s day=%s", user_id, day, exc_info=True)
+            return None
+        if total is None or completed is None:
+            return None
+        return int(total), int(completed)
+
+    def fill_token(self, user_id: int, day: date) -> str | None:
+        """
+        캐시 미스 후 DB 집계 **전에** 호출해 현재 세대를 받는다. set 에 그대로 넘긴다.
+        None이면(Redis 오류) 세대를 확인할 수 없으므로 set 이 저장하지 않는다.
+        """
+        client = get_redis()
+        if client is None:
+            return str(self._local_generations.get((user_id, day), 0))
+        try:
+            return client.get(self._generation_key(user_id, day)) or "0"
+        except Exception:
+            logger.warning("통계 캐시 세대 조회 실패 user=%s day=%s", user_id, day, exc_info=True)
+            return None
+
+    def set(self, user_id: int, day: date, total: int, completed: int, token: str | None) -> None:
+        """집계 결과를 저장한다. fill_token 이후 해당 일자에 쓰기가 있었으면 저장하지 않는다."""
+        if token is None:
+            return
+        client = get_redis()
+        if client is None:
+            with self._local_lock:
+                if str(self._local_generations.get((user_id, day), 0)) == token:
+                    self._local.set((user_id, day), (total, completed))
+            return
+        try:
+            if self._set_script is None:
+                self._set_script = client.register_script(_SET_IF_GENERATION_LUA)
+            self._set_script(
+                keys=[self._key(user_id, day), self._generation_key(user_id, day)],
+                args=[token, total, completed, self._ttl],
+            )
+        except Exception:
+            logger.warning("통계 캐시 저장 실패 user=%s day=%s", user_id, day, exc_info=True)
+
+    def apply_deltas(self, user_id: int, deltas: dict[date, tuple[int, int]]) -> None:
+        """일자별 (total 증감, completed 증감)을 반영한다. 커밋 이후 호출한다."""
+        deltas = {day: d for day, d in deltas.items() if d != (0, 0)}
+        if not deltas:
+            return
+        client = get_redis()
+        if client is None:
+            self._bump_local(user_id, deltas)
+            return
+        try:
+            if self._script is None:
+                self._script = client.register_script(_APPLY_DELTA_LUA)
+            pipe = client.pipeline()
+            for day, (total_delta, completed_delta) in deltas.items():
+                self._bump_generation(pipe, user_id, day)
+                self._script(keys=[self._key(user_id, day)], args=[total_delta, completed_delta], client=pipe)
+            pipe.execute()
+        except Exception:
+            logger.warning("통계 캐시 증감 실패 user=%s — 무효화로 대체", user_id, exc_info=True)
+            self.invalidate(user_id, *deltas)
+
+    def invalidate(self, user_id: int, *days: date) -> None:
+        self._bump_local(user_id, days)
+        client = get_redis()
+        if client is None or not days:
+            return
+        try:
+            pipe = client.pipeline()
+            for day in days:
+                self._bump_generation(pipe, user_id, day)
+            pipe.delete(*(self._key(user_id, day) for day in days))
+            pipe.execute()
+        except Exception:
+            logger.warning("통계 캐시 무효화 실패 user=%s", user_id, exc_info=True)
+
+    def _bump_local(self, user_id: int, days) -> None:
+        with self._local_lock:
+            for day in days:
+                key = (user_id, day)
+                self._local_generations.set(key, self._local_generations.get(key, 0) + 1)
+                self._local.delete(key)
+
+    def _bump_generation(self, pipe, user_id: int, day: date) -> None:
+        # 진행 중인 채우기보다 오래 살아 있으면 충분하므로 통계 TTL을 그대로 쓴다
+        key = self._generation_key(user_id, day)
+        pipe.incr(key)
+        pipe.expire(key, self._ttl)
+
+    @staticmethod
+    def _key(user_id: int, day: date) -> str:
+        return REDIS_KEY.format(user_id=user_id, day=day.isoformat())
+
+    @staticmethod
+    def _generation_key(user_id: int, day: date) -> str:
+        return GENERATION_KEY.format(user_id=user_id, day=day.isoformat())
+
+
+_stats_cache: TaskStatsCache | None = None
+
+
+def get_task_stats_cache() -> TaskStatsCache:
+    global _stats_cache
+    if _stats_cache is None:
+        _stats_cache = TaskStatsCache()
+    return _stats_cache
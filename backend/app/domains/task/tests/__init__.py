@@ -0,0 +1 @@
+"""Tests for task domain."""
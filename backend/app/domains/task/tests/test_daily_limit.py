@@ -0,0 +1,112 @@
+"""일일 할 일 한도 예약(reserve_daily_slot) 동시성 테스트."""
+
+import threading
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import func, select
+
+from app.domains.auth.models import User
+from app.domains.task.daily_limit import release_daily_slots, reserve_daily_slot
+from app.domains.task.models import Task, TaskStatus, UserDailyTaskCount
+from app.domains.TaskHardLimit.task_hard_limit import MaxActiveTasksExceededError
+
+import app.infrastructure.chain.models  # noqa: F401  users 관계 대상 테이블 등록
+
+MAX_PER_DAY = 5
+WORKERS = 24
+
+
+@pytest.fixture(autouse=True)
+def _daily_cap(monkeypatch):
+    monkeypatch.setenv("MAX_ACTIVE_TASK_COUNT", str(MAX_PER_DAY))
+
+
+@pytest.fixture
+def engine_options():
+    return {"pool_size": WORKERS}
+
+
+def _create_user(factory) -> int:
+    with factory() as session:
+        user = User(email="limit@example.com", name="limit", provider="email")
+        session.add(user)
+        session.commit()
+        return user.id
+
+
+def _create_task(factory, user_id: int, day: date) -> bool:
+    with factory() as session:
+        try:
+            reserve_daily_slot(session, user_id, day)
+        except MaxActiveTasksExceededError:
+            session.rollback()
+            return False
+        session.add(Task(
+            title="t",
+            user_id=user_id,
+            due_date=datetime.combine(day, datetime.min.time()),
+            status=TaskStatus.PENDING,
+        ))
+        session.commit()
+        return True
+
+
+def test_concurrent_creates_never_exceed_daily_cap(session_factory):
+    """동시에 많은 생성 요청이 와도 하루 한도 수만큼만 성공한다."""
+    user_id = _create_user(session_factory)
+    day = date(2026, 1, 1)
+    barrier = threading.Barrier(WORKERS)
+    results: list[bool] = []
+    errors: list[BaseException] = []
+    lock = threading.Lock()
+
+    def worker():
+        barrier.wait()
+        try:
+            ok = _create_task(session_factory, user_id, day)
+        except BaseException as e:  # 잠금 충돌 등 예약 외 실패도 검증 대상
+            with lock:
+                errors.append(e)
+            return
+        with lock:
+            results.append(ok)
+
+    threads = [threading.Thread(target=worker) for _ in range(WORKERS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert results.count(True) == MAX_PER_DAY
+    with session_factory() as session:
+        assert session.scalar(select(func.count(Task.id)).where(Task.user_id == user_id)) == MAX_PER_DAY
+        assert session.get(UserDailyTaskCount, (user_id, day)).count == MAX_PER_DAY
+
+
+def test_counter_is_seeded_from_existing_tasks(session_factory):
+    """카운터 행이 없으면 기존 tasks 수에서 시작한다."""
+    user_id = _create_user(session_factory)
+    day = date(2026, 1, 2)
+    with session_factory() as session:
+        for _ in range(MAX_PER_DAY - 1):
+            session.add(Task(title="legacy", user_id=user_id, due_date=datetime(2026, 1, 2, 9)))
+        session.commit()
+
+    assert _create_task(session_factory, user_id, day) is True
+    assert _create_task(session_factory, user_id, day) is False
+
+
+def test_release_frees_a_slot(session_factory):
+    """삭제로 카운터를 반납하면 다시 생성할 수 있다."""
+    user_id = _create_user(session_factory)
+    day = date(2026, 1, 3)
+    for _ in range(MAX_PER_DAY):
+        assert _create_task(session_factory, user_id, day) is True
+    assert _create_task(session_factory, user_id, day) is False
+
+    with session_factory() as session:
+        release_daily_slots(session, user_id, {day: 1})
+        session.commit()
+    assert _create_task(session_factory, user_id, day) is True
@@ -1,4 +1,5 @@
 """ChainLength 및 성취 지표 인프라 [PRO-B-41]."""
+from app.infrastructure.chain.router import router
 from app.infrastructure.chain.service import ChainServiceImpl
 
-__all__ = ["ChainServiceImpl"]
+__all__ = ["router", "ChainServiceImpl"]
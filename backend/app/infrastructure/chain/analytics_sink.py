@@ -0,0 +1,200 @@
+"""
+[PRO-B-41] Chain 분석 이벤트 write-behind 싱크.
+calendar_view / sticker_exposed / app_paused·app_terminate 로그를 요청 안에서 커밋하지 않고
+프로세스 내 유한 큐에 넣은 뒤, 백그라운드 스레드가 배치 크기 또는 주기마다 한 번의 INSERT 로 기록한다.
+
+- 큐가 가득 차면 새 이벤트는 버리고 dropped 로 집계한다 (요청은 막지 않는다 — 분석 로그는 유실 허용).
+- 배치 INSERT 가 실패하면 행 단위로 다시 시도해 문제 행만 failed 로 집계한다 (탈퇴 사용자 FK 등).
+- main.lifespan 종료 시 shutdown_analytics_sink() 가 남은 이벤트를 모두 기록한다.
+- 기록은 최대 CHAIN_ANALYTICS_FLUSH_INTERVAL_SECONDS 만큼 늦게 보인다 (is_active_user 조회 포함).
+- CHAIN_ANALYTICS_WRITE_BEHIND=false 이면 이전처럼 호출 스레드에서 즉시 기록한다.
+"""
+import logging
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import insert
+
+from app.core.database import session_scope
+from app.infrastructure.chain.models import ChainAnalyticsLog
+
+logger = logging.getLogger(__name__)
+
+CHAIN_ANALYTICS_WRITE_BEHIND = os.getenv("CHAIN_ANALYTICS_WRITE_BEHIND", "true").lower() in ("true", "1", "yes")
+CHAIN_ANALYTICS_QUEUE_MAX = int(os.getenv("CHAIN_ANALYTICS_QUEUE_MAX", "10000"))
+CHAIN_ANALYTICS_BATCH_SIZE = int(os.getenv("CHAIN_ANALYTICS_BATCH_SIZE", "200"))
+CHAIN_ANALYTICS_FLUSH_INTERVAL_SECONDS = float(os.getenv("CHAIN_ANALYTICS_FLUSH_INTERVAL_SECONDS", "1.0"))
+# 큐 포화 시 경고 로그 간격 (버린 건수 기준)
+_DROP_LOG_EVERY = 1000
+
+
+class ChainAnalyticsSink:
+    """ChainAnalyticsLog 행을 모아 배치로 기록하는 유한 크기 write-behind 큐."""
+
+    def __init__(
+        self,
+        write_behind: bool = CHAIN_ANALYTICS_WRITE_BEHIND,
+        max_pending: int = CHAIN_ANALYTICS_QUEUE_MAX,
+        batch_size: int = CHAIN_ANALYTICS_BATCH_SIZE,
+        flush_interval_seconds: float = CHAIN_ANALYTICS_FLUSH_INTERVAL_SECONDS,
+    ) -> None:
+        self._write_behind = write_behind
+        self._max_pending = max_pending
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval_seconds
+        self._queue: deque[dict[str, Any]] = deque()
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self._submitted = 0
+        self._written = 0
+        self._dropped = 0
+        self._failed = 0
+        self._batches = 0
+        self._flush_ms_total = 0.0
+        self._flush_ms_max = 0.0
+
+    def submit(self, user_id: int, event_type: str, event_at: datetime, metadata_json: str | None) -> bool:
+        """이벤트 1건을 큐에 넣는다. 큐가 가득 찼거나 종료된 뒤면 버리고 False."""
+        row = {
+            "user_id": user_id,
+            "event_type": event_type,
+            "event_at": event_at,
+            "metadata_json": metadata_json,
+        }
+        return self.submit_many([row]) == 1
+
+    def submit_many(self, rows: list[dict[str, Any]]) -> int:
+        """
+        ChainAnalyticsLog 행(user_id, event_type, event_at, metadata_json) 여러 건을 한 번에 큐에 넣는다.
+        자리가 있는 만큼만 받고 나머지는 버린다. 받은 건수를 반환한다.
+        """
+        if not rows:
+            return 0
+        if not self._write_behind:
+            self._write(rows)
+            return len(rows)
+        with self._cond:
+            room = 0 if self._closed else max(0, self._max_pending - len(self._queue))
+            accepted = rows[:room]
+            self._queue.extend(accepted)
+            self._submitted += len(accepted)
+            dropped_before = self._dropped
+            self._dropped += len(rows) - len(accepted)
+            dropped_total = self._dropped
+            if accepted and self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="chain-analytics-sink", daemon=True)
+                self._thread.start()
+            if len(self._queue) >= self._batch_size:
+                self._cond.notify()
+        # 첫 유실과 이후 _DROP_LOG_EVERY 건마다 경고
+        if dropped_total > dropped_before and (
+            dropped_before == 0 or dropped_total // _DROP_LOG_EVERY > dropped_before // _DROP_LOG_EVERY
+        ):
+            logger.warning(
+                "[PRO-B-41] 분석 이벤트 큐 포화 — 누적 %s건 버림 (max_pending=%s)", dropped_total, self._max_pending
+            )
+        return len(accepted)
+
+    def flush(self) -> None:
+        """지금까지 큐에 쌓인 이벤트를 호출 스레드에서 모두 기록한다."""
+        while True:
+            with self._cond:
+                batch = self._take_batch()
+            if not batch:
+                return
+            self._write(batch)
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        """새 이벤트를 받지 않고, 백그라운드 스레드를 멈춘 뒤 남은 이벤트를 기록한다."""
+        with self._cond:
+            self._closed = True
+            thread, self._thread = self._thread, None
+            self._cond.notify()
+        if thread is not None:
+            thread.join(timeout)
+        self.flush()
+
+    def stats(self) -> dict[str, float | int]:
+        """적재·기록·버림·실패 건수, 현재 대기 수, 배치 기록 평균·최대(ms)."""
+        with self._cond:
+            batches = self._batches or 1
+            return {
+                "write_behind": self._write_behind,
+                "max_pending": self._max_pending,
+                "pending": len(self._queue),
+                "submitted": self._submitted,
+                "written": self._written,
+                "dropped": self._dropped,
+                "failed": self._failed,
+                "batches": self._batches,
+                "flush_ms_avg": round(self._flush_ms_total / batches, 2),
+                "flush_ms_max": round(self._flush_ms_max, 2),
+            }
+
+    def _take_batch(self) -> list[dict[str, Any]]:
+        n = min(len(self._queue), self._batch_size)
+        return [self._queue.popleft() for _ in range(n)]
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if len(self._queue) < self._batch_size and not self._closed:
+                    self._cond.wait(self._flush_interval)
+                if self._closed:
+                    return
+                batch = self._take_batch()
+            if batch:
+                self._write(batch)
+
+    def _write(self, rows: list[dict[str, Any]]) -> None:
+        started = time.perf_counter()
+        written = failed = 0
+        try:
+            with session_scope() as session:
+                session.execute(insert(ChainAnalyticsLog), rows)
+                session.commit()
+            written = len(rows)
+        except Exception:
+            logger.warning("[PRO-B-41] 분석 이벤트 배치 기록 실패 — 행 단위로 재시도 rows=%s", len(rows), exc_info=True)
+            for row in rows:
+                try:
+                    with session_scope() as session:
+                        session.execute(insert(ChainAnalyticsLog), row)
+                        session.commit()
+                    written += 1
+                except Exception:
+                    failed += 1
+                    logger.warning(
+                        "[PRO-B-41] 분석 이벤트 기록 실패 user_id=%s event=%s",
+                        row["user_id"], row["event_type"], exc_info=True,
+                    )
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._cond:
+            self._written += written
+            self._failed += failed
+            self._batches += 1
+            self._flush_ms_total += elapsed_ms
+            self._flush_ms_max = max(self._flush_ms_max, elapsed_ms)
+
+
+_sink: ChainAnalyticsSink | None = None
+
+
+def get_analytics_sink() -> ChainAnalyticsSink:
+    global _sink
+    if _sink is None:
+        _sink = ChainAnalyticsSink()
+    return _sink
+
+
+def shutdown_analytics_sink() -> None:
+    """남은 분석 이벤트를 기록하고 싱크를 정리한다. 앱 종료 시 1회 호출."""
+    global _sink
+    if _sink is not None:
+        _sink.shutdown()
+        _sink = None
@@ -0,0 +1,226 @@
+"""
+[PRO-B-44] 월별 캘린더 캐시.
+캘린더 화면은 앱이 포그라운드로 올 때마다 조회되므로, 사용자·월 단위로 DailyCompletion 조회 결과를 캐싱한다.
+값: {date: (completed_count, sticker_grade_id)} — 기록이 있는 날만. 빈 날 채우기는 ChainManager 가 한다.
+
+- L1: 프로세스 내 TTLCache ((user_id, year, month) 키). 다른 워커의 무효화는 L1 TTL 후 반영되므로 짧게 둔다.
+- L2: Redis 해시 chain:calendar:{user_id} (필드 YYYY-MM, JSON) — 연간 조회는 HMGET 1회. 미가용 시 L1만 사용
+- 무효화: 완료 기록은 커밋 후 해당 월만(ChainManager after_commit 훅), 재집계는 사용자 전체.
+  async 경로는 Redis 호출을 스레드로 넘겨 루프를 막지 않는다.
+- 채우기 경합: 무효화는 사용자 세대(chain:calendar:gen:{user_id})를 올린다. 채우는 쪽은 DB 조회 전에
+  fill_token 으로 세대를 받아 put_months 에 넘기고, 그 사이 세대가 바뀌었으면 저장하지 않는다.
+  (조회와 저장 사이에 커밋된 완료의 무효화가 먼저 실행된 뒤 오래된 월이 다시 써지는 것을 막는다.)
+"""
+import asyncio
+import json
+import logging
+import os
+import threading
+from datetime import date
+from typing import Iterable
+
+from app.core.cache import TTLCache
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY = "chain:calendar:{user_id}"
+GENERATION_KEY = "chain:calendar:gen:{user_id}"
+CALENDAR_CACHE_TTL_SECONDS = int(os.getenv("CALENDAR_CACHE_TTL_SECONDS", "600"))
+CALENDAR_CACHE_LOCAL_TTL_SECONDS = int(os.getenv("CALENDAR_CACHE_LOCAL_TTL_SECONDS", "10"))
+CALENDAR_CACHE_MAX_SIZE = int(os.getenv("CALENDAR_CACHE_MAX_SIZE", "10000"))
+
+Month = tuple[int, int]
+MonthDays = dict[date, tuple[int, int | None]]
+
+# 세대가 채우기 시작 시점과 같을 때만 저장 (KEYS: 캘린더, 세대 / ARGV: 세대, ttl, 필드, 값, ...)
+_PUT_IF_GENERATION_LUA = """
+if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('HSET', KEYS[1], unpack(ARGV, 3))
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+
+def _field(month: Month) -> str:
+    return f"{month[0]:04d}-{month[1]:02d}"
+
+
+def _dumps(days: MonthDays) -> str:
+    return json.dumps([[d.day, count, sid] for d, (count, sid) in sorted(days.items())])
+
+
+def _loads(month: Month, raw: str) -> MonthDays:
+    return {date(month[0], month[1], day): (count, sid) for day, count, sid in json.loads(raw)}
+
+
+class CalendarCache:
+    """(user_id, year, month) → 해당 월 DailyCompletion {date: (completed_count, sticker_grade_id)}."""
+
+    def __init__(
+        self,
+        ttl_seconds: int = CALENDAR_CACHE_TTL_SECONDS,
+        local_ttl_seconds: int = CALENDAR_CACHE_LOCAL_TTL_SECONDS,
+        max_size: int = CALENDAR_CACHE_MAX_SIZE,
+    ) -> None:
+        self._ttl = ttl_seconds
+        self._local = TTLCache(max_size=max_size, ttl_seconds=local_ttl_seconds)
+        # Redis 미가용 시 사용하는 프로세스 내 세대
+        self._local_generations = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        self._local_lock = threading.Lock()
+        self._put_script = None
+
+    def get_months(self, user_id: int, months: list[Month]) -> dict[Month, MonthDays]:
+        """캐시에 있는 월만 반환한다. L1 → Redis(HMGET 1회) 순."""
+        found, missing = self._get_local(user_id, months)
+        if missing:
+            found.update(self._get_from_redis(user_id, missing))
+        return found
+
+    async def get_months_async(self, user_id: int, months: list[Month]) -> dict[Month, MonthDays]:
+        """get_months 의 async 변형. L1 적중 시 I/O 없이 반환한다."""
+        found, missing = self._get_local(user_id, months)
+        if missing:
+            found.update(await asyncio.to_thread(self._get_from_redis, user_id, missing))
+        return found
+
+    def fill_token(self, user_id: int) -> str | None:
+        """
+        캐시 미스 후 DB 조회 **전에** 호출해 사용자의 현재 세대를 받는다. put_months 에 그대로 넘긴다.
+        None이면(Redis 오류) 세대를 확인할 수 없으므로 put_months 가 저장하지 않는다.
+        """
+        client = get_redis()
+        if client is None:
+            return str(self._local_generations.get(user_id, 0))
+        try:
+            return client.get(GENERATION_KEY.format(user_id=user_id)) or "0"
+        except Exception:
+            logger.warning("[PRO-B-44] 캘린더 캐시 세대 조회 실패 user=%s", user_id, exc_info=True)
+            return None
+
+    async def fill_token_async(self, user_id: int) -> str | None:
+        return await asyncio.to_thread(self.fill_token, user_id)
+
+    def put_months(self, user_id: int, months: dict[Month, MonthDays], token: str | None) -> None:
+        """조회 결과를 저장한다. fill_token 이후 사용자 캐시가 무효화됐으면 저장하지 않는다."""
+        if token is None or not months:
+            return
+        client = get_redis()
+        if client is None:
+            with self._local_lock:
+                if str(self._local_generations.get(user_id, 0)) == token:
+                    self._set_local(user_id, months)
+            return
+        if self._set_to_redis(client, user_id, months, token):
+            self._set_local(user_id, months)
+
+    async def put_months_async(self, user_id: int, months: dict[Month, MonthDays], token: str | None) -> None:
+        await asyncio.to_thread(self.put_months, user_id, months, token)
+
+    def invalidate_months(self, months: Iterable[tuple[int, int, int]]) -> None:
+        """(user_id, year, month) 항목들을 제거한다. Redis 는 파이프라인 1회."""
+        keys = set(months)
+        if not keys:
+            return
+        self._bump_local({user_id for user_id, _, _ in keys})
+        for key in keys:
+            self._local.delete(key)
+        client = get_redis()
+        if client is None:
+            return
+        try:
+            pipe = client.pipeline()
+            for user_id in {user_id for user_id, _, _ in keys}:
+                self._bump_generation(pipe, user_id)
+            for user_id, year, month in keys:
+                pipe.hdel(REDIS_KEY.format(user_id=user_id), _field((year, month)))
+            pipe.execute()
+        except Exception:
+            logger.warning("[PRO-B-44] 캘린더 캐시 무효화 실패 months=%s", sorted(keys), exc_info=True)
+
+    def invalidate_users(self, user_ids: Iterable[int]) -> None:
+        """사용자의 모든 월을 제거한다 (재집계 이후)."""
+        ids = set(user_ids)
+        if not ids:
+            return
+        self._bump_local(ids)
+        self._local.delete_where(lambda key: key[0] in ids)
+        client = get_redis()
+        if client is None:
+            return
+        try:
+            pipe = client.pipeline()
+            for uid in ids:
+                self._bump_generation(pipe, uid)
+            pipe.delete(*(REDIS_KEY.format(user_id=uid) for uid in ids))
+            pipe.execute()
+        except Exception:
+            logger.warning("[PRO-B-44] 캘린더 캐시 무효화 실패 user_ids=%s", sorted(ids), exc_info=True)
+
+    def _get_local(self, user_id: int, months: list[Month]) -> tuple[dict[Month, MonthDays], list[Month]]:
+        found: dict[Month, MonthDays] = {}
+        missing: list[Month] = []
+        for month in months:
+            days = self._local.get((user_id, *month))
+            if days is None:
+                missing.append(month)
+            else:
+                found[month] = days
+        return found, missing
+
+    def _get_from_redis(self, user_id: int, months: list[Month]) -> dict[Month, MonthDays]:
+        client = get_redis()
+        if client is None:
+            return {}
+        try:
+            raws = client.hmget(REDIS_KEY.format(user_id=user_id), [_field(m) for m in months])
+        except Exception:
+            logger.warning("[PRO-B-44] 캘린더 캐시 조회 실패 user=%s", user_id, exc_info=True)
+            return {}
+        found = {month: _loads(month, raw) for month, raw in zip(months, raws) if raw is not None}
+        for month, days in found.items():
+            self._local.set((user_id, *month), days)
+        return found
+
+    def _set_local(self, user_id: int, months: dict[Month, MonthDays]) -> None:
+        for month, days in months.items():
+            self._local.set((user_id, *month), days)
+
+    def _set_to_redis(self, client, user_id: int, months: dict[Month, MonthDays], token: str) -> bool:
+        args: list = [token, self._ttl]
+        for month, days in months.items():
+            args.extend((_field(month), _dumps(days)))
+        try:
+            if self._put_script is None:
+                self._put_script = client.register_script(_PUT_IF_GENERATION_LUA)
+            stored = self._put_script(
+                keys=[REDIS_KEY.format(user_id=user_id), GENERATION_KEY.format(user_id=user_id)],
+                args=args,
+            )
+        except Exception:
+            logger.warning("[PRO-B-44] 캘린더 캐시 저장 실패 user=%s", user_id, exc_info=True)
+            return False
+        return bool(stored)
+
+    def _bump_local(self, user_ids: set[int]) -> None:
+        with self._local_lock:
+            for user_id in user_ids:
+                self._local_generations.set(user_id, self._local_generations.get(user_id, 0) + 1)
+
+    def _bump_generation(self, pipe, user_id: int) -> None:
+        # 진행 중인 채우기보다 오래 살아 있으면 충분하므로 캘린더 TTL을 그대로 쓴다
+        key = GENERATION_KEY.format(user_id=user_id)
+        pipe.incr(key)
+        pipe.expire(key, self._ttl)
+
+
+_calendar_cache: CalendarCache | None = None
+
+
+def get_calendar_cache() -> CalendarCache:
+    global _calendar_cache
+    if _calendar_cache is None:
+        _calendar_cache = CalendarCache()
+    return _calendar_cache
@@ -4,22 +4,34 @@ Raw Event 기록, 48h 윈도우, 일별 집계, 멱등성(Idempotency Key), 원
 """
 import calendar
 import logging
-from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import date, datetime, timedelta, timezone
 
 from sqlalchemy import func as sqlfunc
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import and_, case, delete, event, or_, select, update
+from sqlalchemy.orm import Session
 
-from app.core.database import get_session_factory
+from app.core.database import dialect_insert, session_scope
+from app.core.singleflight import SingleFlight
 from app.domains.auth.models import User
+from app.domains.auth.principal_cache import get_principal_cache
+from app.infrastructure.chain.calendar_cache import get_calendar_cache
+from app.infrastructure.chain.completion_cache import get_completion_result_cache
 from app.infrastructure.chain.constants import CHAIN_WINDOW_HOURS, LONG_TERM_CHAIN_DAYS
 from app.infrastructure.chain.models import DailyCompletion, TaskCompletionEvent
+from app.infrastructure.chain.repository import AsyncChainRepository
 from app.infrastructure.chain.sticker_grade import completed_count_to_sticker_grade_id
 from app.infrastructure.chain.sticker_config import get_max_active_task_count
 
 logger = logging.getLogger(__name__)
 
+# 재집계: 이벤트 스트리밍 배치 크기, upsert executemany 1회당 행 수
+RECOMPUTE_YIELD_PER = 1000
+RECOMPUTE_UPSERT_CHUNK_SIZE = 500
+
+# 캘린더 캐시 미스 시 같은 (사용자, 월/연) 동시 조회를 DB 1회로 합친다
+_calendar_flight = SingleFlight()
+
 
 @dataclass
 class RecordCompletionResult:
@@ -41,6 +53,27 @@ class DayEntry:
     sticker_grade_id: int | None
 
 
+_PENDING_RESULTS_KEY = "chain_completion_results"
+_PENDING_CALENDAR_KEY = "chain_calendar_invalidations"
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_completion_results(session: Session) -> None:
+    """커밋된 완료 결과만 멱등 응답 캐시에 올리고, 바뀐 월의 캘린더 캐시를 무효화한다."""
+    pending = session.info.pop(_PENDING_RESULTS_KEY, None)
+    if pending:
+        get_completion_result_cache().put_many(pending)
+    months = session.info.pop(_PENDING_CALENDAR_KEY, None)
+    if months:
+        get_calendar_cache().invalidate_months(months)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_completion_results(session: Session) -> None:
+    session.info.pop(_PENDING_RESULTS_KEY, None)
+    session.info.pop(_PENDING_CALENDAR_KEY, None)
+
+
 class ChainManager:
     """
     [PRO-B-44] 서버 기반 ChainLength·일별 집계 관리.
@@ -67,23 +100,34 @@ class ChainManager:
             return previous_chain + 1
         return previous_chain
 
-    # [PRO-B-44] 일별/목표별 집계: 특정 사용자·날짜의 완료 이벤트 수 합산 (0~MaxActiveTaskCount 상한)
+    # [PRO-B-44] 일별/목표별 집계: 완료 1건마다 해당 날짜 카운터를 증분 (0~MaxActiveTaskCount 상한)
     @staticmethod
-    def _count_daily_completions(session, user_id: int, d: date) -> int:
-        start = datetime.combine(d, datetime.min.time(), tzinfo=timezone.utc)
-        end = start + timedelta(days=1)
-        count = (
-            session.query(sqlfunc.count(TaskCompletionEvent.id))
-            .filter(
-                TaskCompletionEvent.user_id == user_id,
-                TaskCompletionEvent.completed_at >= start,
-                TaskCompletionEvent.completed_at < end,
-            )
-            .scalar()
-            or 0
-        )
+    def _increment_daily_completion(session: Session, user_id: int, d: date) -> int:
+        """
+        INSERT ... ON CONFLICT(user_id, date) DO UPDATE 한 문장으로 일별 완료 수를 +1 (상한 cap) 하고
+        같은 문장에서 sticker_grade_id 도 새 완료 수로 매핑한다. 갱신된 완료 수를 반환한다.
+        완료 이벤트 전체를 다시 세지 않으므로 사용자 이벤트 수와 무관하게 일정한 비용이다.
+        """
         cap = get_max_active_task_count()
-        return min(int(count), cap)
+        table = DailyCompletion.__table__
+        incremented = table.c.completed_count + 1
+        new_count = case((incremented > cap, cap), else_=incremented)
+        grade_by_count = {c: completed_count_to_sticker_grade_id(c) for c in range(cap + 1)}
+        stmt = dialect_insert(session, table).values(
+            user_id=user_id,
+            date=d,
+            completed_count=min(1, cap),
+            sticker_grade_id=grade_by_count[min(1, cap)],
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.user_id, table.c.date],
+            set_={
+                "completed_count": new_count,
+                "sticker_grade_id": case(grade_by_count, value=new_count, else_=grade_by_count[cap]),
+                "updated_at": sqlfunc.now(),
+            },
+        ).returning(table.c.completed_count)
+        return session.execute(stmt).scalar_one()
 
     # [PRO-B-44] 동기화: 클라이언트 요청 시 서버 최신 집계 반환
     @staticmethod
@@ -92,144 +136,216 @@ class ChainManager:
         user_id: int,
         completed_at: datetime,
         idempotency_key: str,
+        session: Session | None = None,
     ) -> RecordCompletionResult:
         """
         [PRO-B-44] 완료 이벤트 기록 + ChainLength·일별 집계 갱신 (원자적 트랜잭션).
         Idempotency Key 중복 시 ChainLength 중복 증가 없이 기존 상태 반환.
+        session 을 넘기면 호출자 트랜잭션 안에서 flush 까지만 하고 commit·캐시 무효화는 호출자가 한다.
         """
-        if completed_at.tzinfo is None:
-            completed_at = completed_at.replace(tzinfo=timezone.utc)
-        session_factory = get_session_factory()
-        with session_factory() as session:
-            # [PRO-B-44] 멱등성: 이미 처리된 키면 갱신 없이 현재 집계만 반환
-            existing = (
-                session.query(TaskCompletionEvent)
-                .filter(TaskCompletionEvent.idempotency_key == idempotency_key)
-                .first()
+        if session is not None:
+            return ChainManager._apply_completion(session, task_id, user_id, completed_at, idempotency_key)
+        with session_scope() as db:
+            result = ChainManager._apply_completion(
+                db, task_id, user_id, completed_at, idempotency_key
             )
-            if existing:
-                # [PRO-B-44] 멱등: 이미 처리됐으면 현재 집계만 반환(별도 세션에서 조회)
-                session.rollback()
-                with session_factory() as read_session:
-                    user = read_session.query(User).filter(User.id == user_id).first()
-                    chain = (user.current_chain_length or 0) if user else 0
-                    comp_date = completed_at.date()
-                    dc = (
-                        read_session.query(DailyCompletion)
-                        .filter(
-                            DailyCompletion.user_id == user_id,
-                            DailyCompletion.date == comp_date,
-                        )
-                        .first()
-                    )
-                    daily_count = dc.completed_count if dc else 0
-                return RecordCompletionResult(
-                    user_id=user_id,
-                    chain_length=chain,
-                    is_long_term_chain=chain >= LONG_TERM_CHAIN_DAYS,
-                    daily_completion_count=daily_count,
-                    already_processed=True,
-                )
-            try:
-                event = TaskCompletionEvent(
-                    task_id=task_id,
-                    user_id=user_id,
-                    completed_at=completed_at,
-                    idempotency_key=idempotency_key,
-                )
-                session.add(event)
-                session.flush()
-            except IntegrityError:
-                session.rollback()
-                return ChainManager.record_completion(
-                    task_id, user_id, completed_at, idempotency_key
-                )
+            db.commit()
+        if not result.already_processed:
+            get_principal_cache().invalidate(user_id)
+        return result
 
-            # [PRO-B-44] 48시간 윈도우 체크 후 ChainLength 갱신
-            user = session.query(User).filter(User.id == user_id).first()
-            if not user:
-                session.rollback()
-                return RecordCompletionResult(
-                    user_id=user_id,
-                    chain_length=0,
-                    is_long_term_chain=False,
-                    daily_completion_count=0,
-                )
-            prev_chain = user.current_chain_length or 0
-            new_chain = ChainManager._compute_new_chain(
-                prev_chain, user.last_task_completed_at, completed_at
-            )
-            user.current_chain_length = new_chain
-            user.last_task_completed_at = completed_at
-
-            # [PRO-B-44] 일별 집계: 해당 날짜 완료 수 갱신 (0~5)
-            comp_date = completed_at.date()
-            daily_count = ChainManager._count_daily_completions(session, user_id, comp_date)
-            sticker_id = completed_count_to_sticker_grade_id(daily_count)
-            dc = (
-                session.query(DailyCompletion)
-                .filter(
-                    DailyCompletion.user_id == user_id,
-                    DailyCompletion.date == comp_date,
-                )
-                .first()
+    @staticmethod
+    def _current_state(session: Session, user_id: int, comp_date: date) -> RecordCompletionResult:
+        """[PRO-B-44] 멱등: 캐시에 없는 중복 키는 현재 ChainLength·일별 완료 수를 한 번에 조회해 반환."""
+        row = session.execute(
+            select(User.current_chain_length, DailyCompletion.completed_count)
+            .outerjoin(
+                DailyCompletion,
+                and_(DailyCompletion.user_id == User.id, DailyCompletion.date == comp_date),
             )
-            if dc:
-                dc.completed_count = daily_count
-                dc.sticker_grade_id = sticker_id
-            else:
-                session.add(
-                    DailyCompletion(
-                        user_id=user_id,
-                        date=comp_date,
-                        completed_count=daily_count,
-                        sticker_grade_id=sticker_id,
-                    )
-                )
-            session.commit()
-            logger.info(
-                "[PRO-B-44] completion recorded task_id=%s user_id=%s chain=%s daily=%s",
-                task_id, user_id, new_chain, daily_count,
+            .where(User.id == user_id)
+        ).first()
+        chain = (row[0] or 0) if row else 0
+        daily_count = (row[1] or 0) if row else 0
+        return RecordCompletionResult(
+            user_id=user_id,
+            chain_length=chain,
+            is_long_term_chain=chain >= LONG_TERM_CHAIN_DAYS,
+            daily_completion_count=daily_count,
+            already_processed=True,
+        )
+
+    @staticmethod
+    def _apply_completion(
+        session: Session,
+        task_id: int,
+        user_id: int,
+        completed_at: datetime,
+        idempotency_key: str,
+    ) -> RecordCompletionResult:
+        """
+        record_completion 본체. 주어진 세션에서 이벤트·ChainLength·일별 집계를 갱신하고 flush 한다.
+        멱등성은 insert-first: 캐시에 최초 결과가 있으면 DB 없이 반환하고, 없으면
+        INSERT ... ON CONFLICT(idempotency_key) DO NOTHING RETURNING 한 문장으로 신규 여부를 판정한다.
+        """
+        cached = get_completion_result_cache().get(user_id, idempotency_key)
+        if cached is not None:
+            return RecordCompletionResult(**{**cached, "already_processed": True})
+
+        if completed_at.tzinfo is None:
+            completed_at = completed_at.replace(tzinfo=timezone.utc)
+        comp_date = completed_at.date()
+        events = TaskCompletionEvent.__table__
+        event_id = session.execute(
+            dialect_insert(session, events)
+            .values(
+                task_id=task_id,
+                user_id=user_id,
+                completed_at=completed_at,
+                idempotency_key=idempotency_key,
             )
+            .on_conflict_do_nothing(index_elements=[events.c.idempotency_key])
+            .returning(events.c.id)
+        ).scalar()
+        if event_id is None:
+            return ChainManager._current_state(session, user_id, comp_date)
+
+        user = session.get(User, user_id)
+        if not user:
+            session.execute(delete(events).where(events.c.id == event_id))
             return RecordCompletionResult(
                 user_id=user_id,
-                chain_length=new_chain,
-                is_long_term_chain=(new_chain >= LONG_TERM_CHAIN_DAYS),
-                daily_completion_count=daily_count,
-                already_processed=False,
+                chain_length=0,
+                is_long_term_chain=False,
+                daily_completion_count=0,
             )
 
+        # [PRO-B-44] 48시간 윈도우 체크 후 ChainLength 갱신
+        prev_chain = user.current_chain_length or 0
+        new_chain = ChainManager._compute_new_chain(
+            prev_chain, user.last_task_completed_at, completed_at
+        )
+        user.current_chain_length = new_chain
+        user.last_task_completed_at = completed_at
+
+        # [PRO-B-44] 일별 집계: 해당 날짜 완료 수 증분 갱신 (0~5)
+        daily_count = ChainManager._increment_daily_completion(session, user_id, comp_date)
+        session.flush()
+        logger.info(
+            "[PRO-B-44] completion recorded task_id=%s user_id=%s chain=%s daily=%s",
+            task_id, user_id, new_chain, daily_count,
+        )
+        result = RecordCompletionResult(
+            user_id=user_id,
+            chain_length=new_chain,
+            is_long_term_chain=(new_chain >= LONG_TERM_CHAIN_DAYS),
+            daily_completion_count=daily_count,
+            already_processed=False,
+        )
+        session.info.setdefault(_PENDING_RESULTS_KEY, {})[(user_id, idempotency_key)] = asdict(result)
+        session.info.setdefault(_PENDING_CALENDAR_KEY, set()).add((user_id, comp_date.year, comp_date.month))
+        return result
+
     # [PRO-B-44] 기간 조회 API: 특정 달(Month) 날짜별 완료 수·스티커 등급 배열
+    @staticmethod
+    def _month_range(year: int, month: int) -> tuple[date, date]:
+        _, last_day_num = calendar.monthrange(year, month)
+        return date(year, month, 1), date(year, month, last_day_num)
+
+    @staticmethod
+    def _build_month_entries(
+        year: int, month: int, by_date: dict[date, tuple[int, int | None]]
+    ) -> list[DayEntry]:
+        """월의 모든 날짜를 채워 DayEntry 배열을 만든다. 기록 없는 날은 (0, None)."""
+        _, last_day_num = calendar.monthrange(year, month)
+        result = []
+        for d in range(1, last_day_num + 1):
+            dt = date(year, month, d)
+            count, sid = by_date.get(dt, (0, None))
+            result.append(
+                DayEntry(
+                    date=dt.isoformat(),
+                    completed_count=count,
+                    sticker_grade_id=sid,
+                )
+            )
+        return result
+
     @staticmethod
     def get_month_calendar(user_id: int, year: int, month: int) -> list[DayEntry]:
-        """[PRO-B-44] GET /calendar?year=&month= — 날짜별 completed_count, sticker_grade_id 배열."""
-        session_factory = get_session_factory()
-        with session_factory() as session:
-            first_day = date(year, month, 1)
-            _, last_day_num = calendar.monthrange(year, month)
-            last_day = date(year, month, last_day_num)
-            rows = (
-                session.query(DailyCompletion)
-                .filter(
+        """[PRO-B-44] GET /calendar?year=&month= — 날짜별 completed_count, sticker_grade_id 배열. 월 캐시 우선."""
+        by_date = get_calendar_cache().get_months(user_id, [(year, month)]).get((year, month))
+        if by_date is None:
+            by_date = _calendar_flight.do(
+                ("month", user_id, year, month), ChainManager._load_month, user_id, year, month
+            )
+        return ChainManager._build_month_entries(year, month, by_date)
+
+    @staticmethod
+    def _load_month(user_id: int, year: int, month: int) -> dict[date, tuple[int, int | None]]:
+        first_day, last_day = ChainManager._month_range(year, month)
+        token = get_calendar_cache().fill_token(user_id)
+        with session_scope() as session:
+            rows = session.execute(
+                select(
+                    DailyCompletion.date,
+                    DailyCompletion.completed_count,
+                    DailyCompletion.sticker_grade_id,
+                ).where(
                     DailyCompletion.user_id == user_id,
                     DailyCompletion.date >= first_day,
                     DailyCompletion.date <= last_day,
                 )
-                .all()
             )
             by_date = {r.date: (r.completed_count, r.sticker_grade_id) for r in rows}
-            result = []
-            for d in range(1, last_day_num + 1):
-                dt = date(year, month, d)
-                count, sid = by_date.get(dt, (0, None))
-                result.append(
-                    DayEntry(
-                        date=dt.isoformat(),
-                        completed_count=count,
-                        sticker_grade_id=sid,
-                    )
-                )
-            return result
+        get_calendar_cache().put_months(user_id, {(year, month): by_date}, token)
+        return by_date
+
+    @staticmethod
+    async def get_month_calendar_async(user_id: int, year: int, month: int) -> list[DayEntry]:
+        """get_month_calendar의 AsyncSession 변형 (async 라우터용)."""
+        by_date = (await get_calendar_cache().get_months_async(user_id, [(year, month)])).get((year, month))
+        if by_date is None:
+            by_date = await _calendar_flight.do_async(
+                ("month", user_id, year, month), ChainManager._load_month_async, user_id, year, month
+            )
+        return ChainManager._build_month_entries(year, month, by_date)
+
+    @staticmethod
+    async def _load_month_async(user_id: int, year: int, month: int) -> dict[date, tuple[int, int | None]]:
+        first_day, last_day = ChainManager._month_range(year, month)
+        token = await get_calendar_cache().fill_token_async(user_id)
+        by_date = await AsyncChainRepository.get_daily_completions(user_id, first_day, last_day)
+        await get_calendar_cache().put_months_async(user_id, {(year, month): by_date}, token)
+        return by_date
+
+    @staticmethod
+    async def get_year_calendar_async(user_id: int, year: int) -> list[DayEntry]:
+        """
+        [PRO-B-44] GET /calendar/year?year= — 연간 히트맵용 1/1~12/31 날짜별 배열.
+        12개월이 모두 캐시에 있으면 DB 없이, 하나라도 없으면 연 구간 조회 1회로 읽고 월 캐시를 함께 채운다.
+        """
+        months = [(year, m) for m in range(1, 13)]
+        by_month = await get_calendar_cache().get_months_async(user_id, months)
+        if len(by_month) < len(months):
+            by_month = await _calendar_flight.do_async(
+                ("year", user_id, year), ChainManager._load_year_async, user_id, year
+            )
+        return [
+            entry
+            for month in range(1, 13)
+            for entry in ChainManager._build_month_entries(year, month, by_month[(year, month)])
+        ]
+
+    @staticmethod
+    async def _load_year_async(user_id: int, year: int) -> dict[tuple[int, int], dict[date, tuple[int, int | None]]]:
+        token = await get_calendar_cache().fill_token_async(user_id)
+        by_date = await AsyncChainRepository.get_daily_completions(user_id, date(year, 1, 1), date(year, 12, 31))
+        by_month: dict[tuple[int, int], dict[date, tuple[int, int | None]]] = {(year, m): {} for m in range(1, 13)}
+        for d, value in by_date.items():
+            by_month[(d.year, d.month)][d] = value
+        await get_calendar_cache().put_months_async(user_id, by_month, token)
+        return by_month
 
     # [PRO-B-44] 재집계(Re-aggregation): Raw Event만으로 항상 동일한 결과가 나오는 순수 함수형 집계
     @staticmethod
@@ -238,59 +354,108 @@ class ChainManager:
         [PRO-B-44] 과거 데이터 재집계. Raw Event(TaskCompletionEvent)만 읽어
         일별 완료 수·ChainLength를 다시 계산하여 Aggregated Stats에 반영.
         성공 기준: 동일 입력 → 동일 결과(순수 함수형 집계).
+
+        - 일별 완료 수: GROUP BY date(completed_at) 한 번으로 집계 (ORM 객체 로드 없음)
+        - ChainLength: completed_at 컬럼만 시간순 스트리밍(yield_per)하며 48h 윈도우를 순차 적용
+        - 반영: 모든 날짜를 INSERT ... ON CONFLICT DO UPDATE 로 일괄 upsert (값이 바뀐 행만 갱신)
         """
-        session_factory = get_session_factory()
-        with session_factory() as session:
-            events = (
-                session.query(TaskCompletionEvent)
-                .filter(TaskCompletionEvent.user_id == user_id)
-                .order_by(TaskCompletionEvent.completed_at.asc())
-                .all()
-            )
-            # 일별 완료 수 (순수 집계)
-            daily_counts: dict[date, int] = defaultdict(int)
-            cap = get_max_active_task_count()
-            for e in events:
-                at = e.completed_at
-                if at.tzinfo is None:
-                    at = at.replace(tzinfo=timezone.utc)
-                d = at.date()
-                daily_counts[d] = min(daily_counts[d] + 1, cap)
-            # Chain: 48h 윈도우 순차 적용
-            chain = 0
-            last_at: datetime | None = None
-            for e in events:
-                at = e.completed_at
-                if at.tzinfo is None:
-                    at = at.replace(tzinfo=timezone.utc)
-                chain = ChainManager._compute_new_chain(chain, last_at, at)
-                last_at = at
-            # Aggregated Stats 갱신
-            user = session.query(User).filter(User.id == user_id).first()
-            if user:
-                user.current_chain_length = chain
-                user.last_task_completed_at = last_at
-            for d, count in daily_counts.items():
-                sticker_id = completed_count_to_sticker_grade_id(count)
-                dc = (
-                    session.query(DailyCompletion)
-                    .filter(
-                        DailyCompletion.user_id == user_id,
-                        DailyCompletion.date == d,
-                    )
-                    .first()
-                )
-                if dc:
-                    dc.completed_count = count
-                    dc.sticker_grade_id = sticker_id
-                else:
-                    session.add(
-                        DailyCompletion(
-                            user_id=user_id,
-                            date=d,
-                            completed_count=count,
-                            sticker_grade_id=sticker_id,
-                        )
-                    )
+        with session_scope() as session:
+            days, chains = ChainManager.rebuild_aggregates(session, [user_id])
+            chain = chains.get(user_id, 0)
             session.commit()
-            logger.info("[PRO-B-44] recompute_aggregates user_id=%s days=%s chain=%s", user_id, len(daily_counts), chain)
+            get_principal_cache().invalidate(user_id)
+            get_calendar_cache().invalidate_users([user_id])
+            logger.info("[PRO-B-44] recompute_aggregates user_id=%s days=%s chain=%s", user_id, days, chain)
+
+    @staticmethod
+    def rebuild_aggregates(session: Session, user_ids: list[int]) -> tuple[int, dict[int, int]]:
+        """
+        여러 사용자의 집계를 사용자 수와 무관한 문장 수로 다시 쓴다 (전체 재집계 작업은 샤드 단위로 호출).
+        GROUP BY (user_id, date) 1회 + (user_id, completed_at) 정렬 스트리밍 1회 + DailyCompletion 청크 upsert
+        + users executemany UPDATE. commit·캐시 무효화는 호출자가 한다.
+        반환: (집계한 날짜 수, 존재하는 user_id → ChainLength)
+        """
+        if not user_ids:
+            return 0, {}
+        daily_counts = ChainManager._daily_counts_from_events(session, user_ids)
+        chains = ChainManager._chains_from_events(session, user_ids)
+        # Aggregated Stats 갱신 — 이벤트가 없는 사용자는 0 / None 으로 초기화
+        existing_ids = session.scalars(select(User.id).where(User.id.in_(user_ids))).all()
+        user_rows = [
+            {
+                "id": uid,
+                "current_chain_length": chains.get(uid, (0, None))[0],
+                "last_task_completed_at": chains.get(uid, (0, None))[1],
+            }
+            for uid in existing_ids
+        ]
+        if user_rows:
+            session.execute(update(User), user_rows)
+        ChainManager._upsert_daily_completions(session, daily_counts)
+        session.flush()
+        return len(daily_counts), {row["id"]: row["current_chain_length"] for row in user_rows}
+
+    @staticmethod
+    def _daily_counts_from_events(session: Session, user_ids: list[int]) -> dict[tuple[int, date], int]:
+        """(user_id, 날짜)별 완료 이벤트 수 (0~MaxActiveTaskCount 상한)."""
+        cap = get_max_active_task_count()
+        day = sqlfunc.date(TaskCompletionEvent.completed_at)
+        rows = session.execute(
+            select(TaskCompletionEvent.user_id, day, sqlfunc.count(TaskCompletionEvent.id))
+            .where(TaskCompletionEvent.user_id.in_(user_ids))
+            .group_by(TaskCompletionEvent.user_id, day)
+        )
+        # SQLite 의 date() 는 'YYYY-MM-DD' 문자열, PostgreSQL 은 date 를 돌려준다.
+        return {
+            (uid, d if isinstance(d, date) else date.fromisoformat(d)): min(int(count), cap)
+            for uid, d, count in rows
+        }
+
+    @staticmethod
+    def _chains_from_events(session: Session, user_ids: list[int]) -> dict[int, tuple[int, datetime | None]]:
+        """완료 시각을 사용자·시간순으로 스트리밍하며 ChainLength 를 계산한다. user_id → (chain, 마지막 완료 시각)"""
+        chains: dict[int, tuple[int, datetime | None]] = {}
+        rows = session.execute(
+            select(TaskCompletionEvent.user_id, TaskCompletionEvent.completed_at)
+            .where(TaskCompletionEvent.user_id.in_(user_ids))
+            .order_by(TaskCompletionEvent.user_id, TaskCompletionEvent.completed_at.asc())
+            .execution_options(yield_per=RECOMPUTE_YIELD_PER)
+        )
+        for uid, at in rows:
+            if at.tzinfo is None:
+                at = at.replace(tzinfo=timezone.utc)
+            chain, last_at = chains.get(uid, (0, None))
+            chains[uid] = (ChainManager._compute_new_chain(chain, last_at, at), at)
+        return chains
+
+    @staticmethod
+    def _upsert_daily_completions(session: Session, daily_counts: dict[tuple[int, date], int]) -> None:
+        """(user_id, 날짜)별 완료 수·스티커 등급을 일괄 upsert 한다. 기존 값과 같은 행은 건드리지 않는다."""
+        if not daily_counts:
+            return
+        table = DailyCompletion.__table__
+        rows = [
+            {
+                "user_id": uid,
+                "date": d,
+                "completed_count": count,
+                "sticker_grade_id": completed_count_to_sticker_grade_id(count),
+            }
+            for (uid, d), count in sorted(daily_counts.items())
+        ]
+        # VALUES 다중 행 대신 단일 문장 executemany — 컴파일 캐시가 적용되어 청크마다 다시 컴파일하지 않는다.
+        stmt = dialect_insert(session, table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.user_id, table.c.date],
+            set_={
+                "completed_count": stmt.excluded.completed_count,
+                "sticker_grade_id": stmt.excluded.sticker_grade_id,
+                "updated_at": sqlfunc.now(),
+            },
+            where=or_(
+                table.c.completed_count != stmt.excluded.completed_count,
+                table.c.sticker_grade_id.is_distinct_from(stmt.excluded.sticker_grade_id),
+            ),
+        )
+        for offset in range(0, len(rows), RECOMPUTE_UPSERT_CHUNK_SIZE):
+            session.execute(stmt, rows[offset:offset + RECOMPUTE_UPSERT_CHUNK_SIZE])
@@ -0,0 +1,83 @@
+"""
+[PRO-B-44] 완료 기록 결과 캐시 (멱등 재시도 응답용).
+같은 Idempotency Key 재전송(모바일 네트워크 재시도 등)에는 최초 처리 결과를 그대로 돌려준다.
+키: (user_id, idempotency_key) — 다른 사용자가 같은 키를 보내도 남의 결과를 받지 않는다.
+
+- L1: 프로세스 내 TTLCache
+- L2: Redis (chain:completion:{user_id}:{idempotency_key}, JSON) — 워커 간 공유, 미가용 시 L1만 사용
+- 저장은 트랜잭션 커밋 이후에만 한다 (ChainManager 의 after_commit 훅). 롤백된 결과는 캐시되지 않는다.
+"""
+import json
+import logging
+import os
+from typing import Any
+
+from app.core.cache import TTLCache
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY = "chain:completion:{user_id}:{idempotency_key}"
+COMPLETION_RESULT_CACHE_TTL_SECONDS = int(os.getenv("COMPLETION_RESULT_CACHE_TTL_SECONDS", "600"))
+COMPLETION_RESULT_CACHE_MAX_SIZE = int(os.getenv("COMPLETION_RESULT_CACHE_MAX_SIZE", "10000"))
+
+
+class CompletionResultCache:
+    """(user_id, idempotency_key) → record_completion 결과 필드 dict."""
+
+    def __init__(
+        self,
+        ttl_seconds: int = COMPLETION_RESULT_CACHE_TTL_SECONDS,
+        max_size: int = COMPLETION_RESULT_CACHE_MAX_SIZE,
+    ) -> None:
+        self._ttl = ttl_seconds
+        self._local = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+
+    def get(self, user_id: int, idempotency_key: str) -> dict[str, Any] | None:
+        result = self._local.get((user_id, idempotency_key))
+        if result is not None:
+            return result
+        client = get_redis()
+        if client is None:
+            return None
+        try:
+            raw = client.get(self._key(user_id, idempotency_key))
+        except Exception:
+            logger.warning("[PRO-B-44] 완료 결과 캐시 조회 실패 key=%s", idempotency_key, exc_info=True)
+            return None
+        if raw is None:
+            return None
+        result = json.loads(raw)
+        self._local.set((user_id, idempotency_key), result)
+        return result
+
+    def put_many(self, results: dict[tuple[int, str], dict[str, Any]]) -> None:
+        """커밋된 결과들을 저장한다. Redis 는 파이프라인 1회."""
+        if not results:
+            return
+        for cache_key, result in results.items():
+            self._local.set(cache_key, result)
+        client = get_redis()
+        if client is None:
+            return
+        try:
+            pipe = client.pipeline()
+            for (user_id, idempotency_key), result in results.items():
+                pipe.setex(self._key(user_id, idempotency_key), self._ttl, json.dumps(result))
+            pipe.execute()
+        except Exception:
+            logger.warning("[PRO-B-44] 완료 결과 캐시 저장 실패", exc_info=True)
+
+    @staticmethod
+    def _key(user_id: int, idempotency_key: str) -> str:
+        return REDIS_KEY.format(user_id=user_id, idempotency_key=idempotency_key)
+
+
+_completion_cache: CompletionResultCache | None = None
+
+
+def get_completion_result_cache() -> CompletionResultCache:
+    global _completion_cache
+    if _completion_cache is None:
+        _completion_cache = CompletionResultCache()
+    return _completion_cache
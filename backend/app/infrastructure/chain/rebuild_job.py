@@ -0,0 +1,144 @@
+"""
+[PRO-B-44] 전체 사용자 Chain 집계 재구축 작업.
+버그 수정·스티커 설정 변경 이후 모든 사용자의 DailyCompletion, users.current_chain_length,
+users.last_task_completed_at 을 Raw Event(TaskCompletionEvent)로부터 다시 계산한다.
+
+- users.id 를 고정 폭 구간(shard)으로 나눠 프로세스 풀에 분배한다.
+- 워커 프로세스마다 자체 엔진을 만들고, 샤드 하나를 한 트랜잭션·사용자 수와 무관한 문장 수로 처리해 커밋한다
+  (ChainManager.rebuild_aggregates — 사용자별 반복 쿼리 없음).
+- 완료된 샤드는 체크포인트 파일에 기록되어, 중단 후 같은 명령으로 다시 실행하면 남은 샤드만 처리한다.
+- 진행 중·완료 시 처리량(users/sec)을 출력한다.
+- SQLite 는 쓰기 트랜잭션이 직렬화되므로 --workers 1 이 가장 빠르다. 병렬 처리 이득은 PostgreSQL 에서 난다.
+- API 프로세스의 Principal L1 캐시는 최대 TTL 동안 이전 ChainLength 를 보일 수 있다 (Redis L2 는 샤드마다 무효화).
+  캘린더 캐시도 같다.
+
+실행 (backend/ 에서):
+    python -m app.infrastructure.chain.rebuild_job --workers 4 --shard-size 500
+    python -m app.infrastructure.chain.rebuild_job --reset   # 체크포인트 무시하고 처음부터
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+DEFAULT_CHECKPOINT_PATH = "chain_rebuild_checkpoint.json"
+
+# 워커 프로세스 전역: initializer 에서 프로세스마다 1회 생성
+_worker_session_factory: sessionmaker[Session] | None = None
+
+
+def _init_worker(database_url: str) -> None:
+    global _worker_session_factory
+    connect_args = {"timeout": 60} if database_url.startswith("sqlite") else {}
+    engine = create_engine(database_url, connect_args=connect_args, pool_size=1)
+    _worker_session_factory = sessionmaker(bind=engine, autoflush=False)
+
+
+def _rebuild_shard(shard: int, first_id: int, last_id: int) -> tuple[int, int]:
+    """users.id ∈ [first_id, last_id] 를 한 트랜잭션으로 재집계한다. (shard, 처리한 사용자 수)"""
+    from app.domains.auth.models import User
+    from app.domains.auth.principal_cache import get_principal_cache
+    from app.infrastructure.chain.calendar_cache import get_calendar_cache
+    from app.infrastructure.chain.chain_manager import ChainManager
+
+    with _worker_session_factory() as session:
+        user_ids = list(session.scalars(
+            select(User.id).where(User.id >= first_id, User.id <= last_id).order_by(User.id)
+        ))
+        ChainManager.rebuild_aggregates(session, user_ids)
+        session.commit()
+    get_principal_cache().invalidate_many(user_ids)
+    get_calendar_cache().invalidate_users(user_ids)
+    return shard, len(user_ids)
+
+
+class _Checkpoint:
+    """완료한 샤드 번호를 JSON 파일에 기록한다. shard_size 가 다르면 재사용하지 않는다."""
+
+    def __init__(self, path: Path, shard_size: int, reset: bool) -> None:
+        self._path = path
+        self._shard_size = shard_size
+        self.done: set[int] = set()
+        if path.is_file() and not reset:
+            data = json.loads(path.read_text())
+            if data.get("shard_size") != shard_size:
+                raise SystemExit(
+                    f"checkpoint {path} was written with shard_size={data.get('shard_size')}; "
+                    "use the same --shard-size or --reset"
+                )
+            self.done = set(data.get("done", []))
+
+    def mark(self, shard: int) -> None:
+        self.done.add(shard)
+        tmp = self._path.with_suffix(self._path.suffix + ".tmp")
+        tmp.write_text(json.dumps({"shard_size": self._shard_size, "done": sorted(self.done)}))
+        os.replace(tmp, self._path)
+
+
+def run(workers: int, shard_size: int, checkpoint_path: Path, reset: bool = False) -> None:
+    from app.core.database import get_engine, init_db
+    from app.domains.auth.models import User
+
+    init_db()
+    engine = get_engine()
+    database_url = engine.url.render_as_string(hide_password=False)
+    with Session(engine) as session:
+        min_id, max_id = session.execute(select(func.min(User.id), func.max(User.id))).one()
+    engine.dispose()
+    if min_id is None:
+        print("no users")
+        return
+
+    checkpoint = _Checkpoint(checkpoint_path, shard_size, reset)
+    first_shard, last_shard = (min_id - 1) // shard_size, (max_id - 1) // shard_size
+    pending = [s for s in range(first_shard, last_shard + 1) if s not in checkpoint.done]
+    total_shards = last_shard - first_shard + 1
+    print(f"users {min_id}..{max_id}: {total_shards} shards of {shard_size} ids, "
+          f"{total_shards - len(pending)} already done, {len(pending)} to go, {workers} workers")
+
+    started = time.perf_counter()
+    users = 0
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(database_url,),
+    ) as pool:
+        futures = [
+            pool.submit(_rebuild_shard, s, s * shard_size + 1, (s + 1) * shard_size)
+            for s in pending
+        ]
+        for future in as_completed(futures):
+            shard, count = future.result()
+            checkpoint.mark(shard)
+            users += count
+            elapsed = time.perf_counter() - started
+            print(f"shard {shard} done ({count} users) — "
+                  f"{len(checkpoint.done)}/{total_shards} shards, {users / elapsed:.1f} users/sec")
+
+    elapsed = time.perf_counter() - started
+    print(f"rebuilt {users} users in {elapsed:.1f}s ({users / elapsed if elapsed else 0:.1f} users/sec)")
+
+
+def main() -> None:
+    from app.config.env import load_env
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--shard-size", type=int, default=500, help="샤드 하나가 맡는 users.id 구간 폭")
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT_PATH)
+    parser.add_argument("--reset", action="store_true", help="체크포인트를 무시하고 처음부터 다시 실행")
+    args = parser.parse_args()
+
+    load_env()
+    run(args.workers, args.shard_size, Path(args.checkpoint), args.reset)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,15 @@
 앱 재시작 후 유지 목표를 지원한다.
 """
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 
-from app.core.database import get_session_factory
+from sqlalchemy import select
+
+from app.core.database import async_session_scope, session_scope
 from app.domains.auth.models import User
 from app.infrastructure.chain.constants import LONG_TERM_CHAIN_DAYS
+from app.infrastructure.chain.models import DailyCompletion
 
 
 @dataclass
@@ -36,8 +39,7 @@ class ChainRepository:
         단일 PK 조회로 지연 최소화 — 앱 재진입 시 로컬 데이터 표시 후 서버와 정합성 맞출 때 사용.
         (성공 기준: 종료 후 유지된 데이터를 효율적으로 반환.)
         """
-        session_factory = get_session_factory()
-        with session_factory() as session:
+        with session_scope() as session:
             user = session.query(User).filter(User.id == user_id).first()
             if not user:
                 return None
@@ -50,3 +52,44 @@ class ChainRepository:
                 last_task_completed_at=last_at,
                 is_long_term_chain=is_long,
             )
+
+
+class AsyncChainRepository:
+    """
+    ChainRepository의 AsyncSession 변형.
+    /chain/state·/chain/calendar 같은 async 라우터에서 스레드풀 없이 조회한다.
+    """
+
+    @staticmethod
+    async def get_chain_state(user_id: int) -> Optional[ChainStateDto]:
+        """[PRO-B-42] 사용자별 ChainLength 상태 조회 (단일 PK 조회)."""
+        async with async_session_scope() as session:
+            user = await session.get(User, user_id)
+            if not user:
+                return None
+            length = user.current_chain_length or 0
+            return ChainStateDto(
+                user_id=user.id,
+                chain_length=length,
+                last_task_completed_at=user.last_task_completed_at,
+                is_long_term_chain=length >= LONG_TERM_CHAIN_DAYS,
+            )
+
+    @staticmethod
+    async def get_daily_completions(
+        user_id: int, first_day: date, last_day: date
+    ) -> dict[date, tuple[int, Optional[int]]]:
+        """[PRO-B-44] [first_day, last_day] 구간 DailyCompletion → {date: (completed_count, sticker_grade_id)}."""
+        async with async_session_scope() as session:
+            rows = await session.execute(
+                select(
+                    DailyCompletion.date,
+                    DailyCompletion.completed_count,
+                    DailyCompletion.sticker_grade_id,
+                ).where(
+                    DailyCompletion.user_id == user_id,
+                    DailyCompletion.date >= first_day,
+                    DailyCompletion.date <= last_day,
+                )
+            )
+            return {r.date: (r.completed_count, r.sticker_grade_id) for r in rows}
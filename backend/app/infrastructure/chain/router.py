@@ -9,10 +9,12 @@ from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.domains.auth.models import User
 from app.domains.auth.security import get_current_user
+from app.infrastructure.chain.analytics_sink import get_analytics_sink
 from app.infrastructure.chain.chain_manager import ChainManager
 from app.infrastructure.chain.schemas import (
     CalendarDayEntry,
     CalendarMonthResponse,
+    CalendarYearResponse,
     ChainAnalyticsEventType,
     ChainStateResponse,
     ChainUpdateResult,
@@ -46,7 +48,7 @@ def _get_service() -> ChainServiceImpl:
     response_model=CalendarMonthResponse,
     summary="[PRO-B-44] 특정 달(Month) 기록 조회 — 날짜별 완료 수·스티커 등급 ID 배열",
 )
-def get_calendar_month(
+async def get_calendar_month(
     year: int,
     month: int,
     current_user: User = Depends(get_current_user),
@@ -54,7 +56,7 @@ def get_calendar_month(
     """[PRO-B-44] GET /calendar?year=2024&month=05 — 사용자 환경 간 데이터 정합성·정확한 기간 조회."""
     if not (1 <= month <= 12):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="month must be 1-12")
-    entries = ChainManager.get_month_calendar(current_user.id, year, month)
+    entries = await ChainManager.get_month_calendar_async(current_user.id, year, month)
     return CalendarMonthResponse(
         year=year,
         month=month,
@@ -62,6 +64,25 @@ def get_calendar_month(
     )
 
 
+@router.get(
+    "/calendar/year",
+    response_model=CalendarYearResponse,
+    summary="[PRO-B-44] 연간 기록 조회 — 히트맵용 날짜별 완료 수·스티커 등급 ID 배열 (월 12회 호출 대체)",
+)
+async def get_calendar_year(
+    year: int,
+    current_user: User = Depends(get_current_user),
+):
+    """[PRO-B-44] GET /calendar/year?year=2024 — 구간 조회 1회(또는 월 캐시)로 1년치를 반환."""
+    if not (1 <= year <= 9999):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="year must be 1-9999")
+    entries = await ChainManager.get_year_calendar_async(current_user.id, year)
+    return CalendarYearResponse(
+        year=year,
+        days=[CalendarDayEntry(date=e.date, completed_count=e.completed_count, sticker_grade_id=e.sticker_grade_id) for e in entries],
+    )
+
+
 @router.post(
     "/recompute",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -108,13 +129,13 @@ def record_completion_event(
     response_model=ChainStateResponse,
     summary="[PRO-B-42] ChainLength 상태 조회 (Revalidation — 로컬 우선 후 서버 정합성)",
 )
-def get_chain_state(current_user: User = Depends(get_current_user)):
+async def get_chain_state(current_user: User = Depends(get_current_user)):
     """
     [PRO-B-42] Revalidation — 0.5초 이내 업데이트·종료 후 유지.
     앱 재진입 시 클라이언트는 로컬 스토리지(SharedPreferences/UserDefaults/SQLite)의
     chain_length를 먼저 표시한 뒤, 이 API로 서버와 정합성을 맞춘다.
     """
-    state = _get_service().get_chain_state(current_user.id)
+    state = await _get_service().get_chain_state_async(current_user.id)
     if state is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -263,6 +284,12 @@ def record_app_lifecycle(
     )
 
 
+@router.get("/analytics/metrics")
+def analytics_metrics():
+    """분석 이벤트 write-behind 싱크 지표: 적재·기록·버림·실패 건수, 대기 수, 배치 기록 지연."""
+    return get_analytics_sink().stats()
+
+
 # ── 활성 사용자 세그먼트 ───────────────────────────────────────────────────────
 
 @router.get(
@@ -98,6 +98,13 @@ class CalendarMonthResponse(BaseModel):
     days: list[CalendarDayEntry] = Field(default_factory=list)
 
 
+class CalendarYearResponse(BaseModel):
+    """[PRO-B-44] GET /calendar/year — 연간 히트맵용 1/1~12/31 기록 배열."""
+
+    year: int
+    days: list[CalendarDayEntry] = Field(default_factory=list)
+
+
 class RecordCompletionResponse(BaseModel):
     """[PRO-B-44] 완료 기록 응답 — 동기화용 최신 집계 포함."""
 
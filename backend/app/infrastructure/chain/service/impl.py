@@ -5,18 +5,23 @@ ChainLength 산출(48h 유지/초기화), DailyCompletion·sticker_grade, 성공
 import json
 import logging
 from datetime import date, datetime, timedelta, timezone
+from typing import Any
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.core.database import get_session_factory
+from app.core.database import session_scope
 from app.domains.auth.models import User
+from app.domains.auth.principal_cache import get_principal_cache
+from app.infrastructure.chain.analytics_sink import get_analytics_sink
+from app.infrastructure.chain.calendar_cache import get_calendar_cache
 from app.infrastructure.chain.constants import (
     ACTIVE_USER_DAYS,
     CHAIN_WINDOW_HOURS,
     LONG_TERM_CHAIN_DAYS,
 )
 from app.infrastructure.chain.models import ChainAnalyticsLog, DailyCompletion
-from app.infrastructure.chain.repository import ChainRepository, ChainStateDto
+from app.infrastructure.chain.repository import AsyncChainRepository, ChainRepository, ChainStateDto
 from app.infrastructure.chain.schemas import (
     ChainAnalyticsEventType,
     ChainStateResponse,
@@ -26,6 +31,19 @@ from app.infrastructure.chain.sticker_grade import completed_count_to_sticker_gr
 
 logger = logging.getLogger(__name__)
 
+_DWELL_EVENT_TYPES = (ChainAnalyticsEventType.APP_PAUSED, ChainAnalyticsEventType.APP_TERMINATE)
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def _dwell_ms(last_completed_at: datetime | None, occurred: datetime) -> int | None:
+    """task_complete ~ occurred 체류 시간(ms). 완료 기록이 없으면 None."""
+    if last_completed_at is None:
+        return None
+    return int((_as_utc(occurred) - _as_utc(last_completed_at)).total_seconds() * 1000)
+
 
 class ChainServiceImpl:
     """ChainLength 및 성취 지표 서비스 구현 [PRO-B-41][PRO-B-42]."""
@@ -46,6 +64,18 @@ class ChainServiceImpl:
             is_long_term_chain=dto.is_long_term_chain,
         )
 
+    async def get_chain_state_async(self, user_id: int) -> ChainStateResponse | None:
+        """get_chain_state의 AsyncSession 변형 (async 라우터용)."""
+        dto = await AsyncChainRepository.get_chain_state(user_id)
+        if dto is None:
+            return None
+        return ChainStateResponse(
+            user_id=dto.user_id,
+            chain_length=dto.chain_length,
+            last_task_completed_at=dto.last_task_completed_at,
+            is_long_term_chain=dto.is_long_term_chain,
+        )
+
     def update_chain_on_task_complete(
         self, user_id: int, completed_at: datetime
     ) -> ChainUpdateResult:
@@ -57,8 +87,7 @@ class ChainServiceImpl:
         """
         if completed_at.tzinfo is None:
             completed_at = completed_at.replace(tzinfo=timezone.utc)
-        session_factory = get_session_factory()
-        with session_factory() as session:
+        with session_scope() as session:
             user = session.query(User).filter(User.id == user_id).first()
             if not user:
                 logger.warning("[PRO-B-41] update_chain_on_task_complete: user_id=%s not found", user_id)
@@ -90,6 +119,7 @@ class ChainServiceImpl:
             user.last_task_completed_at = completed_at
             session.commit()
             session.refresh(user)
+            get_principal_cache().invalidate(user_id)
             is_long = new_chain >= LONG_TERM_CHAIN_DAYS
             logger.info(
                 "[PRO-B-41] Chain 갱신 user_id=%s previous=%s new=%s is_long_term=%s",
@@ -108,8 +138,7 @@ class ChainServiceImpl:
         """
         성공 기준 검증: 날짜별 완료 수(0~5) 기록 및 [PRO-B-43] sticker_grade_id 매핑.
         """
-        session_factory = get_session_factory()
-        with session_factory() as session:
+        with session_scope() as session:
             row = (
                 session.query(DailyCompletion)
                 .filter(
@@ -123,6 +152,7 @@ class ChainServiceImpl:
                 row.completed_count = completed_count
                 row.sticker_grade_id = sticker_id
                 session.commit()
+                get_calendar_cache().invalidate_months([(user_id, completion_date.year, completion_date.month)])
                 session.refresh(row)
                 session.expunge(row)
                 return row
@@ -134,6 +164,7 @@ class ChainServiceImpl:
             )
             session.add(row)
             session.commit()
+            get_calendar_cache().invalidate_months([(user_id, completion_date.year, completion_date.month)])
             session.refresh(row)
             session.expunge(row)
             return row
@@ -141,19 +172,16 @@ class ChainServiceImpl:
     def record_calendar_view(self, user_id: int, chain_length: int) -> None:
         """
         성공 기준 검증: 캘린더 시각화 노출 시 ChainLength를 파라미터로 전송하는 로그.
+        기록은 write-behind 싱크가 배치로 한다.
         """
         now = datetime.now(timezone.utc)
         meta = {"chain_length": chain_length}
-        session_factory = get_session_factory()
-        with session_factory() as session:
-            log = ChainAnalyticsLog(
-                user_id=user_id,
-                event_type=ChainAnalyticsEventType.CALENDAR_VIEW,
-                event_at=now,
-                metadata_json=json.dumps(meta, ensure_ascii=False),
-            )
-            session.add(log)
-            session.commit()
+        get_analytics_sink().submit(
+            user_id,
+            ChainAnalyticsEventType.CALENDAR_VIEW,
+            now,
+            json.dumps(meta, ensure_ascii=False),
+        )
         logger.info(
             "[PRO-B-41] calendar_view user_id=%s chain_length=%s",
             user_id, chain_length,
@@ -165,30 +193,17 @@ class ChainServiceImpl:
         """
         성공 기준 검증: task_complete 시점 ~ app_paused/app_terminate 시점 간
         체류 시간(dwell_time_after_complete)을 밀리초로 계산해 로그 전송.
+        기록은 write-behind 싱크가 배치로 한다.
         """
         now = datetime.now(timezone.utc)
         occurred = occurred_at if occurred_at else now
         if occurred.tzinfo is None:
             occurred = occurred.replace(tzinfo=timezone.utc)
-        session_factory = get_session_factory()
-        with session_factory() as session:
-            user = session.query(User).filter(User.id == user_id).first()
-            dwell_ms = None
-            if user and user.last_task_completed_at:
-                last = user.last_task_completed_at
-                if last.tzinfo is None:
-                    last = last.replace(tzinfo=timezone.utc)
-                delta = occurred - last
-                dwell_ms = int(delta.total_seconds() * 1000)
-            meta = {"dwell_time_ms": dwell_ms}
-            log = ChainAnalyticsLog(
-                user_id=user_id,
-                event_type=event_type,
-                event_at=occurred,
-                metadata_json=json.dumps(meta, ensure_ascii=False),
-            )
-            session.add(log)
-            session.commit()
+        with session_scope() as session:
+            last = session.scalar(select(User.last_task_completed_at).where(User.id == user_id))
+        dwell_ms = _dwell_ms(last, occurred)
+        meta = {"dwell_time_ms": dwell_ms}
+        get_analytics_sink().submit(user_id, event_type, occurred, json.dumps(meta, ensure_ascii=False))
         logger.info(
             "[PRO-B-41] dwell_time_after_complete user_id=%s event=%s dwell_ms=%s",
             user_id, event_type, dwell_ms,
@@ -199,31 +214,53 @@ class ChainServiceImpl:
     ) -> None:
         """
         [PRO-B-43] sticker_exposed 이벤트 로그 — 결정된 등급 id를 포함하여 기록.
+        기록은 write-behind 싱크가 배치로 한다.
         """
         now = datetime.now(timezone.utc)
         meta = {"sticker_grade_id": sticker_grade_id}
         if metadata:
             meta.update(metadata)
-        session_factory = get_session_factory()
-        with session_factory() as session:
-            log = ChainAnalyticsLog(
-                user_id=user_id,
-                event_type=ChainAnalyticsEventType.STICKER_EXPOSED,
-                event_at=now,
-                metadata_json=json.dumps(meta, ensure_ascii=False),
-            )
-            session.add(log)
-            session.commit()
+        get_analytics_sink().submit(
+            user_id,
+            ChainAnalyticsEventType.STICKER_EXPOSED,
+            now,
+            json.dumps(meta, ensure_ascii=False),
+        )
         logger.info("[PRO-B-43] sticker_exposed user_id=%s sticker_grade_id=%s", user_id, sticker_grade_id)
 
+    def record_analytics_events(
+        self, user_id: int, events: list[tuple[str, datetime, dict[str, Any]]]
+    ) -> int:
+        """
+        분석 이벤트 (event_type, occurred_at, metadata) 여러 건을 싱크에 한 번에 넣는다 (텔레메트리 배치 수신용).
+        app_paused/app_terminate 는 단건 경로와 같이 dwell_time_ms 를 채우며, 사용자 조회는 배치당 1회.
+        싱크가 받은 건수를 반환한다.
+        """
+        last = None
+        if any(event_type in _DWELL_EVENT_TYPES for event_type, _, _ in events):
+            with session_scope() as session:
+                last = session.scalar(select(User.last_task_completed_at).where(User.id == user_id))
+        rows = []
+        for event_type, occurred, meta in events:
+            if event_type in _DWELL_EVENT_TYPES:
+                meta = {**meta, "dwell_time_ms": _dwell_ms(last, occurred)}
+            rows.append({
+                "user_id": user_id,
+                "event_type": event_type,
+                "event_at": _as_utc(occurred),
+                "metadata_json": json.dumps(meta, ensure_ascii=False),
+            })
+        accepted = get_analytics_sink().submit_many(rows)
+        logger.info("[PRO-B-41] analytics batch user_id=%s events=%s accepted=%s", user_id, len(rows), accepted)
+        return accepted
+
     def is_active_user(self, user_id: int, within_days: int | None = None) -> bool:
         """
         성공 기준: 활성 사용자(Active User) 세그먼트 — 최근 N일 내 앱 진입/이벤트 기록 여부.
         """
         days = within_days if within_days is not None else ACTIVE_USER_DAYS
         since = datetime.now(timezone.utc) - timedelta(days=days)
-        session_factory = get_session_factory()
-        with session_factory() as session:
+        with session_scope() as session:
             user = session.query(User).filter(User.id == user_id).first()
             if user and user.last_task_completed_at:
                 last = user.last_task_completed_at
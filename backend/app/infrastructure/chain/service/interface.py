@@ -3,7 +3,7 @@
 ChainLength 산출, DailyCompletion 관리, 성공 기준 검증용 로깅 계약을 정의한다.
 """
 from datetime import date, datetime
-from typing import Protocol
+from typing import Any, Protocol
 
 from app.infrastructure.chain.models import DailyCompletion
 from app.infrastructure.chain.schemas import ChainStateResponse, ChainUpdateResult
@@ -16,6 +16,10 @@ class ChainService(Protocol):
         """[PRO-B-42] 앱 재진입 시 로컬 우선 표시 후 서버와 재검증(Revalidation)용 상태 조회."""
         ...
 
+    async def get_chain_state_async(self, user_id: int) -> ChainStateResponse | None:
+        """get_chain_state의 비동기 변형 (AsyncSession)."""
+        ...
+
     def update_chain_on_task_complete(
         self, user_id: int, completed_at: datetime
     ) -> ChainUpdateResult:
@@ -44,6 +48,12 @@ class ChainService(Protocol):
         """[PRO-B-43] sticker_exposed 이벤트 로그(결정된 등급 id 포함)."""
         ...
 
+    def record_analytics_events(
+        self, user_id: int, events: list[tuple[str, datetime, dict[str, Any]]]
+    ) -> int:
+        """분석 이벤트 여러 건을 한 번에 기록하고 받은 건수를 반환한다 (app_paused/terminate 는 dwell 포함)."""
+        ...
+
     def is_active_user(self, user_id: int, within_days: int | None = None) -> bool:
         """최근 N일 내 앱 진입(또는 이벤트) 기록이 있으면 활성 사용자로 판별한다."""
         ...
@@ -0,0 +1 @@
+"""Tests for chain infrastructure."""
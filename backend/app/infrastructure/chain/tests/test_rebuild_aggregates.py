@@ -0,0 +1,126 @@
+"""ChainManager.rebuild_aggregates 집합 기반 재집계 테스트 (이벤트 단위 Python 집계와 결과 비교)."""
+
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import select
+
+from app.domains.auth.models import User
+from app.infrastructure.chain.chain_manager import ChainManager
+from app.infrastructure.chain.models import DailyCompletion, TaskCompletionEvent
+from app.infrastructure.chain.sticker_config import get_max_active_task_count
+from app.infrastructure.chain.sticker_grade import completed_count_to_sticker_grade_id
+
+import app.domains.task.models  # noqa: F401  users 관계 대상 테이블 등록
+
+KST = timezone(timedelta(hours=9))
+
+
+def _legacy_aggregates(session, user_id: int) -> tuple[dict[date, int], int, datetime | None]:
+    """기존 recompute_aggregates_from_events 의 이벤트 단위 집계 (일별 완료 수, ChainLength, 마지막 완료 시각)."""
+    events = session.scalars(
+        select(TaskCompletionEvent)
+        .where(TaskCompletionEvent.user_id == user_id)
+        .order_by(TaskCompletionEvent.completed_at.asc())
+    ).all()
+    daily_counts: dict[date, int] = defaultdict(int)
+    cap = get_max_active_task_count()
+    chain = 0
+    last_at: datetime | None = None
+    for e in events:
+        at = e.completed_at
+        if at.tzinfo is None:
+            at = at.replace(tzinfo=timezone.utc)
+        daily_counts[at.date()] = min(daily_counts[at.date()] + 1, cap)
+        chain = ChainManager._compute_new_chain(chain, last_at, at)
+        last_at = at
+    return dict(daily_counts), chain, last_at
+
+
+def _naive_utc(at: datetime | None) -> datetime | None:
+    if at is None or at.tzinfo is None:
+        return at
+    return at.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _seed(factory) -> list[int]:
+    cap = get_max_active_task_count()
+    base = datetime(2026, 3, 1, 9, 0)
+    with factory() as session:
+        users = [User(email=f"chain{i}@example.com", name=f"chain{i}", provider="email") for i in range(3)]
+        session.add_all(users)
+        session.flush()
+        streak, broken, idle = (u.id for u in users)
+
+        events: list[tuple[int, datetime]] = []
+        # 연속 5일, 매일 상한보다 많은 완료 — tz 포함(UTC·KST)과 naive 시각을 섞는다
+        for day in range(5):
+            for n in range(cap + 2):
+                at = base + timedelta(days=day, minutes=17 * n)
+                if n % 3 == 1:
+                    at = at.replace(tzinfo=timezone.utc)
+                elif n % 3 == 2:
+                    at = at.replace(tzinfo=timezone.utc).astimezone(KST)
+                events.append((streak, at))
+        # 48시간 넘게 끊긴 뒤 다시 이어지는 사용자, 자정 직전·직후 완료 포함
+        for offset in (
+            timedelta(0),
+            timedelta(hours=14, minutes=59),
+            timedelta(hours=15, minutes=1),
+            timedelta(days=4),
+            timedelta(days=5, hours=3),
+        ):
+            events.append((broken, (base + offset).replace(tzinfo=timezone.utc)))
+
+        session.add_all(
+            TaskCompletionEvent(task_id=i, user_id=uid, completed_at=at, idempotency_key=f"evt-{i}")
+            for i, (uid, at) in enumerate(events)
+        )
+        # 이벤트와 어긋난 기존 집계 행은 재집계로 덮어써져야 한다
+        session.add(DailyCompletion(user_id=streak, date=base.date(), completed_count=1, sticker_grade_id=None))
+        idle_user = session.get(User, idle)
+        idle_user.current_chain_length = 7
+        idle_user.last_task_completed_at = base
+        session.commit()
+        return [streak, broken, idle]
+
+
+def test_rebuild_aggregates_matches_per_event_aggregation(session_factory):
+    user_ids = _seed(session_factory)
+    with session_factory() as session:
+        expected = {uid: _legacy_aggregates(session, uid) for uid in user_ids}
+
+    with session_factory() as session:
+        days, chains = ChainManager.rebuild_aggregates(session, user_ids)
+        session.commit()
+
+    assert days == sum(len(counts) for counts, _, _ in expected.values())
+    assert chains == {uid: chain for uid, (_, chain, _) in expected.items()}
+    with session_factory() as session:
+        for uid, (counts, chain, last_at) in expected.items():
+            rows = session.execute(
+                select(DailyCompletion.date, DailyCompletion.completed_count, DailyCompletion.sticker_grade_id)
+                .where(DailyCompletion.user_id == uid)
+            ).all()
+            assert {d: (count, grade) for d, count, grade in rows} == {
+                d: (count, completed_count_to_sticker_grade_id(count)) for d, count in counts.items()
+            }
+            user = session.get(User, uid)
+            assert user.current_chain_length == chain
+            assert _naive_utc(user.last_task_completed_at) == _naive_utc(last_at)
+
+
+def test_rebuild_aggregates_caps_daily_count_and_counts_streak(session_factory):
+    streak, broken, idle = _seed(session_factory)
+    with session_factory() as session:
+        ChainManager.rebuild_aggregates(session, [streak, broken, idle])
+        session.commit()
+
+    cap = get_max_active_task_count()
+    with session_factory() as session:
+        counts = session.scalars(select(DailyCompletion.completed_count).where(DailyCompletion.user_id == streak)).all()
+        assert counts and max(counts) == cap
+        assert session.get(User, streak).current_chain_length == 5
+        assert session.get(User, broken).current_chain_length == 2
+        assert session.get(User, idle).current_chain_length == 0
+        assert session.get(User, idle).last_task_completed_at is None
@@ -8,12 +8,16 @@ import logging
 import time
 from datetime import datetime, timezone
 
-from app.core.database import get_session_factory
+from app.core.database import session_scope
 from app.core.redis import get_redis
-from app.domains.task.models import Task, TaskStatus
+from app.domains.task.daily_limit import move_daily_slot, release_daily_slots
+from app.domains.task.models import Task, TaskStatus, to_local_naive
+from app.domains.task.stats_cache import get_task_stats_cache
 from app.infrastructure.task_archive.models import TaskArchive, TaskStatusHistory
 from app.infrastructure.task_archive.repository import ArchiveRepository
 from app.infrastructure.task_archive.schemas import StrategyType, TransitionRequest, TransitionResponse
+from app.infrastructure.task_miss.miss_counter import apply_miss_deltas, miss_delta
+from app.infrastructure.task_miss.scheduler import get_due_timer
 
 logger = logging.getLogger(__name__)
 
@@ -33,10 +37,9 @@ class TaskArchiveServiceImpl:
     def apply_transition(self, task_id: int, request: TransitionRequest) -> TransitionResponse:
         start_ns = time.perf_counter_ns()
         now = datetime.now(timezone.utc)
-        session_factory = get_session_factory()
         repo = ArchiveRepository()
 
-        with session_factory() as session:
+        with session_scope() as session:
             task: Task | None = session.get(Task, task_id)
             if task is None:
                 raise ValueError(f"과업을 찾을 수 없습니다: task_id={task_id}")
@@ -45,6 +48,7 @@ class TaskArchiveServiceImpl:
             new_status = _TRANSITION_MAP[request.strategy_select]
             new_status_str = new_status.value
             user_id = task.user_id
+            stats_days = {task.due_date.date()}
             archived = False
 
             # [PRO-B-23] 상태 변경 이력 기록 (전환 전에 기록하여 Archive 삭제 후에도 보존)
@@ -60,6 +64,7 @@ class TaskArchiveServiceImpl:
             if request.strategy_select == StrategyType.ARCHIVE:
                 # [PRO-B-23] 보관함 테이블로 격리 (메인 테이블에서 삭제)
                 repo.move_to_archive(session, task, now)
+                release_daily_slots(session, user_id, {task.due_date.date(): 1})
                 archived = True
 
             elif request.strategy_select == StrategyType.MODIFY:
@@ -67,7 +72,10 @@ class TaskArchiveServiceImpl:
                 task.updated_at = now
                 task.is_archived = False
                 if request.new_due_date:
-                    task.due_date = request.new_due_date
+                    new_due_date = to_local_naive(request.new_due_date)
+                    move_daily_slot(session, user_id, task.due_date.date(), new_due_date.date())
+                    task.due_date = new_due_date
+                    stats_days.add(task.due_date.date())
 
             elif request.strategy_select == StrategyType.KEEP:
                 task.status = new_status
@@ -76,9 +84,17 @@ class TaskArchiveServiceImpl:
 
             session.flush()
             history_id = history.id
+            due_date = task.due_date
+            # Archive 는 tasks 에서 빠지므로 task_miss 에서 제외되는 것과 같다
+            apply_miss_deltas(session, {user_id: miss_delta(prev_status, None if archived else new_status)})
             session.commit()
 
         self._invalidate_miss_cache(user_id)
+        get_task_stats_cache().invalidate(user_id, *stats_days)
+        if request.strategy_select == StrategyType.MODIFY:
+            get_due_timer().schedule(task_id, user_id, due_date)
+        else:
+            get_due_timer().cancel(task_id)
 
         elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
         logger.info(
@@ -104,17 +120,13 @@ class TaskArchiveServiceImpl:
         )
 
     def get_user_archives(self, user_id: str) -> list[TaskArchive]:
-        session_factory = get_session_factory()
-        with session_factory() as session:
+        with session_scope() as session:
             archives = ArchiveRepository.get_user_archives(session, user_id)
-            session.expunge_all()
         return archives
 
     def get_task_history(self, task_id: int) -> list[TaskStatusHistory]:
-        session_factory = get_session_factory()
-        with session_factory() as session:
+        with session_scope() as session:
             history = ArchiveRepository.get_task_history(session, task_id)
-            session.expunge_all()
         return history
 
     @staticmethod
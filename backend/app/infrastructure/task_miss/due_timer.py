@@ -0,0 +1,164 @@
+"""
+[PRO-B-10] 기한(due_date) 타이머.
+다가오는 과업 기한을 프로세스 내 최소 힙에 두고, 백그라운드 스레드가 가장 이른 기한까지 잠들었다가
+기한이 지난 과업 id 들만 on_due 콜백으로 넘긴다 (task_miss 전환은 콜백이 id 로 수행).
+
+- 시각은 tasks.due_date 와 같은 naive 값으로 다루고, 기존 전환 조건(due_date < 현재 UTC 시각)과 같은 시계로 비교한다.
+  tz 포함 값은 저장 규칙(to_local_naive)대로 Asia/Seoul naive 로 맞춘다 — 호출자는 저장된 값을 넘기는 것이 원칙.
+- 갱신·취소는 지연 삭제: task_id → 최신 기한만 _due 에 남기고, 힙에서 꺼낸 항목이 최신이 아니면 버린다.
+- horizon 밖의 먼 기한은 받지 않는다 (주기적 재적재가 가까워질 때 넣는다) — 힙 크기를 제한하기 위함.
+- 콜백이 전환 조건을 다시 확인하므로, 다른 워커에서 완료·기한 변경된 과업이 남아 있어도 잘못 전환되지 않는다.
+- start() 전에는 schedule() 을 무시한다 (스케줄러가 없는 스크립트·테스트에서 힙이 쌓이지 않게).
+"""
+import heapq
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable
+
+from app.domains.task.models import to_local_naive
+
+logger = logging.getLogger(__name__)
+
+# (task_id, user_id, due_date)
+DueEntry = tuple[int, int, datetime]
+# 벽시계 변경 등에 대비해 한 번에 잠드는 최대 시간(초)
+_MAX_WAIT_SECONDS = 60.0
+
+
+def _utc_naive_now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class DueDateTimer:
+    """task_id 별 다음 기한을 최소 힙으로 관리하고, 기한이 지나면 on_due(task_ids) 를 호출한다."""
+
+    def __init__(
+        self,
+        on_due: Callable[[list[int]], int],
+        horizon_seconds: float,
+        batch_size: int,
+    ) -> None:
+        self._on_due = on_due
+        self._horizon = timedelta(seconds=horizon_seconds)
+        self._batch_size = batch_size
+        self._heap: list[tuple[datetime, int]] = []
+        self._due: dict[int, datetime] = {}
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self._scheduled = 0
+        self._fired = 0
+        self._transitioned = 0
+        self._runs = 0
+        self._lag_ms_total = 0.0
+        self._lag_ms_max = 0.0
+
+    def start(self, entries: Iterable[DueEntry] = ()) -> None:
+        """entries 로 힙을 채우고 타이머 스레드를 시작한다."""
+        with self._cond:
+            if self._thread is not None:
+                return
+            self._closed = False
+            self._thread = threading.Thread(target=self._run, name="task-miss-due-timer", daemon=True)
+        self.schedule_many(entries)
+        self._thread.start()
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        with self._cond:
+            self._closed = True
+            thread, self._thread = self._thread, None
+            self._heap.clear()
+            self._due.clear()
+            self._cond.notify()
+        if thread is not None:
+            thread.join(timeout)
+
+    def schedule(self, task_id: int, user_id: int, due_date: datetime) -> None:
+        """과업 생성·기한 변경·미완료 상태 복귀 후 호출. 커밋 이후에 불러야 한다."""
+        self.schedule_many([(task_id, user_id, due_date)])
+
+    def schedule_many(self, entries: Iterable[DueEntry]) -> None:
+        limit = _utc_naive_now() + self._horizon
+        with self._cond:
+            if self._thread is None:
+                return
+            earliest = self._heap[0][0] if self._heap else None
+            for task_id, _user_id, due_date in entries:
+                due = to_local_naive(due_date)
+                if due >= limit:
+                    # 이미 잡힌 더 이른 기한은 무효가 됐으므로 지운다
+                    self._due.pop(task_id, None)
+                    continue
+                if self._due.get(task_id) == due:
+                    continue
+                self._due[task_id] = due
+                heapq.heappush(self._heap, (due, task_id))
+                self._scheduled += 1
+            if self._heap and (earliest is None or self._heap[0][0] < earliest):
+                self._cond.notify()
+
+    def cancel(self, task_id: int) -> None:
+        """완료·삭제·보관 등으로 더 이상 기한을 볼 필요가 없는 과업. 힙 항목은 꺼낼 때 버려진다."""
+        with self._cond:
+            self._due.pop(task_id, None)
+
+    def stats(self) -> dict[str, float | int | bool]:
+        """대기 과업 수, 예약·발화·전환 건수, 기한 대비 발화 지연 평균·최대(ms)."""
+        with self._cond:
+            fired = self._fired or 1
+            return {
+                "running": self._thread is not None,
+                "pending": len(self._due),
+                "heap_size": len(self._heap),
+                "next_due_at": self._heap[0][0].isoformat() if self._heap else None,
+                "scheduled": self._scheduled,
+                "fired": self._fired,
+                "transitioned": self._transitioned,
+                "runs": self._runs,
+                "lag_ms_avg": round(self._lag_ms_total / fired, 2),
+                "lag_ms_max": round(self._lag_ms_max, 2),
+            }
+
+    def _take_due(self, now: datetime) -> list[tuple[datetime, int]]:
+        batch: list[tuple[datetime, int]] = []
+        while self._heap and self._heap[0][0] < now and len(batch) < self._batch_size:
+            due, task_id = heapq.heappop(self._heap)
+            if self._due.get(task_id) != due:
+                continue  # 기한 변경·취소된 항목
+            del self._due[task_id]
+            batch.append((due, task_id))
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed:
+                    now = _utc_naive_now()
+                    if self._heap and self._heap[0][0] < now:
+                        break
+                    wait = _MAX_WAIT_SECONDS
+                    if self._heap:
+                        # due_date < now 가 되도록 기한 직후에 깨어난다
+                        wait = min(wait, (self._heap[0][0] - now).total_seconds() + 0.001)
+                    self._cond.wait(wait)
+                if self._closed:
+                    return
+                batch = self._take_due(now)
+            if batch:
+                self._fire(now, batch)
+
+    def _fire(self, now: datetime, batch: list[tuple[datetime, int]]) -> None:
+        try:
+            transitioned = self._on_due([task_id for _, task_id in batch])
+        except Exception:
+            # 놓친 과업은 주기적 재조정 스윕이 전환한다
+            logger.warning("[PRO-B-10] 기한 타이머 전환 실패 tasks=%s", len(batch), exc_info=True)
+            transitioned = 0
+        lags = [(now - due).total_seconds() * 1000 for due, _ in batch]
+        with self._cond:
+            self._runs += 1
+            self._fired += len(batch)
+            self._transitioned += transitioned
+            self._lag_ms_total += sum(lags)
+            self._lag_ms_max = max(self._lag_ms_max, *lags)
@@ -0,0 +1,120 @@
+"""
+사용자별 누적 task_miss 카운터 [PRO-B-10].
+상태 전환 후 사용자별 COUNT 를 다시 돌리지 않도록 user_miss_counts 를 증감으로 유지한다.
+
+- 증감: 과업을 task_miss 로/에서 옮기는 쓰기 경로가 같은 트랜잭션에서 apply_miss_deltas 를 호출한다.
+  UPDATE ... SET miss_count = miss_count + CASE ... RETURNING user_id 1회로 행이 있는 사용자를 갱신하고,
+  행이 없던 사용자는 tasks 집계로 INSERT ... SELECT ... ON CONFLICT DO UPDATE (+delta) 한다.
+  집계는 이 트랜잭션의 변경을 이미 포함하므로 새로 넣을 때는 delta 를 더하지 않고, 그 사이 다른 트랜잭션이
+  행을 만들었으면(충돌) 그 집계에는 이 변경이 빠져 있으므로 delta 를 더한다. 증감을 건너뛰는 경로가 없어
+  동시에 초기화하는 조회가 오래된 스냅샷으로 행을 넣어도 카운터가 어긋나지 않는다.
+- 초기화: 행이 없는 사용자는 최초 조회 때 tasks 집계로 INSERT ... SELECT ... ON CONFLICT DO NOTHING.
+- 증감 규칙을 적용하기 어려운 경로(batch-action 보관 등)는 invalidate_miss_counts 로 행을 지워 다음 조회에서 재집계한다.
+모든 함수는 호출자 트랜잭션 안에서 실행되며 commit 은 호출자가 관리한다.
+"""
+from typing import Iterable
+
+from sqlalchemy import case, delete, func, select, update
+from sqlalchemy.orm import Session
+
+from app.core.database import dialect_insert
+from app.domains.auth.models import User
+from app.domains.task.models import Task, TaskStatus
+from app.infrastructure.task_miss.models import UserMissCount
+
+_counter = UserMissCount.__table__
+
+
+def miss_delta(previous, current) -> int:
+    """상태 변경 1건이 누적 task_miss 수에 주는 증감 (-1, 0, +1)."""
+    return int(current == TaskStatus.TASK_MISS) - int(previous == TaskStatus.TASK_MISS)
+
+
+def apply_miss_deltas(session: Session, deltas: dict[int, int]) -> None:
+    """사용자별 증감을 반영한다. 행이 없는 사용자는 이 트랜잭션에서 본 tasks 집계로 초기화한다."""
+    deltas = {user_id: delta for user_id, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    updated = set(
+        session.scalars(
+            update(_counter)
+            .where(_counter.c.user_id.in_(deltas))
+            .values(miss_count=_counter.c.miss_count + case(deltas, value=_counter.c.user_id, else_=0))
+            .returning(_counter.c.user_id)
+        )
+    )
+    for user_id in deltas.keys() - updated:
+        stmt = dialect_insert(session, _counter).from_select(
+            ["user_id", "miss_count"],
+            select(User.id, _count_misses(user_id)).where(User.id == user_id),
+        )
+        session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[_counter.c.user_id],
+                set_={"miss_count": _counter.c.miss_count + deltas[user_id], "updated_at": func.now()},
+            )
+        )
+
+
+def invalidate_miss_counts(session: Session, user_ids: Iterable[int]) -> None:
+    ids = set(user_ids)
+    if ids:
+        session.execute(delete(_counter).where(_counter.c.user_id.in_(ids)))
+
+
+def _count_misses(user_id: int):
+    return (
+        select(func.count(Task.id))
+        .where(Task.user_id == user_id, Task.status == TaskStatus.TASK_MISS)
+        .scalar_subquery()
+    )
+
+
+def load_miss_count(session: Session, user_id: int) -> int:
+    """카운터 행을 읽는다. 없으면 tasks 집계로 초기화한다 (없는 사용자는 행 없이 0)."""
+    return load_miss_counts(session, [user_id]).get(user_id, 0)
+
+
+def load_miss_counts(session: Session, user_ids: list[int]) -> dict[int, int]:
+    """
+    여러 사용자의 카운터를 IN 조회 1회로 읽는다. 행이 없는 사용자는
+    users LEFT JOIN tasks GROUP BY 한 번으로 초기화한 뒤 다시 읽는다. 없는 사용자는 결과에서 빠진다.
+    """
+    ids = set(user_ids)
+    if not ids:
+        return {}
+    counts = _select_counts(session, ids)
+    missing = ids - counts.keys()
+    if missing:
+        counted = (
+            select(User.id, func.count(Task.id))
+            .outerjoin(Task, (Task.user_id == User.id) & (Task.status == TaskStatus.TASK_MISS))
+            .where(User.id.in_(missing))
+            .group_by(User.id)
+        )
+        stmt = dialect_insert(session, _counter).from_select(["user_id", "miss_count"], counted)
+        session.execute(stmt.on_conflict_do_nothing(index_elements=[_counter.c.user_id]))
+        counts.update(_select_counts(session, missing))
+    return counts
+
+
+def _select_counts(session: Session, user_ids: set[int]) -> dict[int, int]:
+    rows = session.execute(
+        select(_counter.c.user_id, _counter.c.miss_count).where(_counter.c.user_id.in_(user_ids))
+    )
+    return {user_id: count for user_id, count in rows}
+
+
+def reset_miss_count(session: Session, user_id: int) -> int:
+    """tasks 집계로 카운터를 덮어쓴다 (수동 갱신용)."""
+    stmt = dialect_insert(session, _counter).from_select(
+        ["user_id", "miss_count"],
+        select(User.id, _count_misses(user_id)).where(User.id == user_id),
+    )
+    session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[_counter.c.user_id],
+            set_={"miss_count": stmt.excluded.miss_count, "updated_at": func.now()},
+        )
+    )
+    return session.scalar(select(_counter.c.miss_count).where(_counter.c.user_id == user_id)) or 0
@@ -0,0 +1,20 @@
+"""
+task_miss 누적 카운터 모델 [PRO-B-10].
+"""
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, func
+
+from app.core.database import Base
+
+
+class UserMissCount(Base):
+    """
+    사용자별 누적 task_miss 과업 수.
+    상태를 바꾸는 쓰기 경로가 같은 트랜잭션 안에서 증감하므로 조회는 PK 1건으로 끝난다.
+    행이 없는 사용자는 최초 조회 시 tasks 집계로 초기화된다 (miss_counter.load_miss_count).
+    """
+
+    __tablename__ = "user_miss_counts"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    miss_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
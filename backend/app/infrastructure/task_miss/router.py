@@ -1,14 +1,19 @@
 """
 task_miss 인프라 API 라우터 [PRO-B-10].
-사용자별 누적 miss count 조회 및 배치 수동 실행 엔드포인트를 제공한다.
+사용자별 누적 miss count 조회(단건·일괄) 및 배치 수동 실행 엔드포인트를 제공한다.
 """
 import time
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Path
 
-from app.domains.task.schemas import CumulativeMissCountResponse, TaskMissBatchResultResponse
-from app.infrastructure.task_miss.scheduler import TaskMissScheduler
+from app.domains.task.schemas import (
+    CumulativeMissCountResponse,
+    MissCountBatchRequest,
+    MissCountBatchResponse,
+    TaskMissBatchResultResponse,
+)
+from app.infrastructure.task_miss.scheduler import TaskMissScheduler, get_due_timer
 from app.infrastructure.task_miss.service import TaskMissServiceImpl
 
 router = APIRouter()
@@ -42,6 +47,27 @@ def get_cumulative_miss_count(
     )
 
 
+@router.post(
+    "/miss-counts:batch",
+    response_model=MissCountBatchResponse,
+    summary="여러 사용자의 누적 task_miss 카운트 일괄 조회",
+)
+def get_cumulative_miss_counts(body: MissCountBatchRequest) -> MissCountBatchResponse:
+    """Redis MGET 1회로 읽고, 캐시 미스 사용자만 DB에서 한 번에 읽어 파이프라인으로 캐시에 되써 넣는다."""
+    start_ns = time.perf_counter_ns()
+    results = _get_service().get_cumulative_miss_counts(body.user_ids)
+    now = datetime.now(timezone.utc)
+    elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+    return MissCountBatchResponse(
+        counts=[
+            CumulativeMissCountResponse(user_id=user_id, cumulative_miss_count=count, cached=cached, timestamp=now)
+            for user_id, (count, cached) in results.items()
+        ],
+        cache_hits=sum(cached for _, cached in results.values()),
+        execution_time_ms=round(elapsed_ms, 3),
+    )
+
+
 @router.post(
     "/users/{user_id}/miss-count/refresh",
     response_model=CumulativeMissCountResponse,
@@ -67,12 +93,20 @@ def refresh_miss_count_cache(
     summary="task_miss 상태 전환 배치 수동 실행",
 )
 def run_batch_now() -> TaskMissBatchResultResponse:
-    """기한 만료 과업을 즉시 task_miss로 전환하는 배치를 1회 실행한다."""
+    """기한 만료 과업을 청크 단위로 즉시 task_miss로 전환하는 배치를 1회 실행한다."""
     start_ns = time.perf_counter_ns()
-    transitioned = TaskMissScheduler.run_now()
+    run = TaskMissScheduler.run_now()
     elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
     return TaskMissBatchResultResponse(
-        transitioned_count=transitioned,
+        transitioned_count=run.transitioned,
         execution_time_ms=round(elapsed_ms, 3),
+        chunks=run.chunks,
+        max_lock_hold_ms=round(run.max_lock_hold_ms, 3),
         timestamp=datetime.now(timezone.utc),
     )
+
+
+@router.get("/timer/metrics", summary="기한 타이머 지표")
+def due_timer_metrics():
+    """기한 타이머 지표: 대기 과업 수, 다음 기한, 예약·발화·전환 건수, 기한 대비 전환 지연(ms)."""
+    return get_due_timer().stats()
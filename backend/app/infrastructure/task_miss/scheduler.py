@@ -1,102 +1,208 @@
 """
-기한 만료 과업 자동 감지 및 task_miss 상태 전환 배치 스케줄러 [PRO-B-10].
-APScheduler IntervalTrigger를 사용하여 주기적으로 미완료·기한 초과 과업을 탐색하고 상태를 전환한다.
-전환 시 해당 사용자의 Redis 캐시를 무효화하여 실시간 집계 정합성을 보장한다.
+기한 만료 과업 자동 감지 및 task_miss 상태 전환 스케줄러 [PRO-B-10].
+기한 타이머(DueDateTimer)가 다가오는 due_date 를 힙에 두고 기한 직후 해당 과업만 id 로 전환한다.
+타이머는 시작 시 DB 에서 horizon 안의 미완료 과업으로 채워지고, 과업 생성·수정 경로가 커밋 후 schedule() 로 넣는다.
+APScheduler 재조정 스윕이 MISS_RECONCILE_INTERVAL_SECONDS 마다 전체 조건으로 놓친 과업을 전환하고 타이머를 다시 채운다.
+전환 시 사용자별 전환 건수를 누적 miss 카운터(user_miss_counts)와 Redis 캐시에 더해 실시간 집계 정합성을 보장한다.
 """
 import logging
+import os
 import time
-from datetime import datetime, timezone
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 
 from apscheduler.schedulers.background import BackgroundScheduler
-from sqlalchemy import update
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
 
 from app.core.database import get_session_factory
-from app.core.redis import get_redis
 from app.domains.task.models import Task, TaskStatus
+from app.infrastructure.task_miss.due_timer import DueDateTimer, DueEntry
+from app.infrastructure.task_miss.miss_counter import apply_miss_deltas
+from app.infrastructure.task_miss.service import TaskMissServiceImpl
 
 logger = logging.getLogger(__name__)
 
-MISS_CHECK_INTERVAL_SECONDS = 60
-REDIS_KEY_PREFIX = "user:{user_id}:miss_count"
+# false 면 타이머 없이 재조정 스윕만 돈다 (이때는 주기를 60초 정도로 줄인다)
+MISS_DUE_TIMER_ENABLED = os.getenv("MISS_DUE_TIMER_ENABLED", "true").lower() in ("true", "1", "yes")
+MISS_RECONCILE_INTERVAL_SECONDS = int(os.getenv("MISS_RECONCILE_INTERVAL_SECONDS", "60"))
+# 타이머에 올리는 기한 범위(초). 재조정 주기보다 길어야 그 사이 기한이 빠지지 않는다
+MISS_DUE_TIMER_HORIZON_SECONDS = int(os.getenv("MISS_DUE_TIMER_HORIZON_SECONDS", "3600"))
+MISS_DUE_TIMER_BATCH_SIZE = int(os.getenv("MISS_DUE_TIMER_BATCH_SIZE", "500"))
+# 재조정 스윕: 한 트랜잭션에서 전환하는 최대 과업 수, 청크 커밋 사이 쉬는 시간(초)
+MISS_TRANSITION_CHUNK_SIZE = int(os.getenv("MISS_TRANSITION_CHUNK_SIZE", "500"))
+MISS_TRANSITION_CHUNK_SLEEP_SECONDS = float(os.getenv("MISS_TRANSITION_CHUNK_SLEEP_SECONDS", "0.01"))
 
+_PENDING_PREDICATE = Task.status.notin_([TaskStatus.COMPLETED, TaskStatus.TASK_MISS])
 
-def _transition_expired_tasks() -> int:
+
+_miss_service: TaskMissServiceImpl | None = None
+
+
+def _get_miss_service() -> TaskMissServiceImpl:
+    global _miss_service
+    if _miss_service is None:
+        _miss_service = TaskMissServiceImpl()
+    return _miss_service
+
+
+def _mark_missed(session: Session, task_ids: list[int], now: datetime) -> Counter[int]:
+    """
+    task_ids 중 여전히 기한이 지난 미완료 과업을 task_miss 로 전환하고,
+    RETURNING user_id 로 얻은 사용자별 전환 건수를 같은 트랜잭션에서 누적 카운터에 더한다.
+    """
+    deltas = Counter(
+        session.scalars(
+            update(Task)
+            .where(Task.id.in_(task_ids), Task.due_date < now, _PENDING_PREDICATE)
+            .values(status=TaskStatus.TASK_MISS, updated_at=now)
+            .returning(Task.user_id)
+            .execution_options(synchronize_session=False)
+        ).all()
+    )
+    apply_miss_deltas(session, deltas)
+    return deltas
+
+
+@dataclass
+class TransitionRun:
+    """재조정 스윕 1회 결과: 전환 건수·청크 수·청크별 최대 쓰기 잠금 보유 시간."""
+
+    transitioned: int = 0
+    chunks: int = 0
+    max_lock_hold_ms: float = 0.0
+    affected_user_ids: set[int] = field(default_factory=set)
+
+
+def _transition_expired_tasks(
+    chunk_size: int = MISS_TRANSITION_CHUNK_SIZE,
+    chunk_sleep_seconds: float = MISS_TRANSITION_CHUNK_SLEEP_SECONDS,
+) -> TransitionRun:
     """
     due_date < 현재시각 이면서 완료·task_miss가 아닌 과업을 task_miss로 전환한다.
-    전환된 행의 수를 반환하며, 영향받은 사용자의 Redis 캐시를 무효화한다.
+    id 키셋으로 chunk_size 건씩 읽어 UPDATE ... WHERE id IN (청크) 후 청크마다 커밋하고,
+    청크 사이에 chunk_sleep_seconds 만큼 쉬어 대기 중인 다른 쓰기(PATCH /tasks 등)가 잠금을 얻게 한다.
+    잠금 보유 시간은 UPDATE 부터 커밋까지로 잰다 (SQLite 는 첫 쓰기에서 쓰기 잠금을 잡는다).
+    청크마다 사용자별 누적 miss 카운터와 Redis 캐시를 전환 건수만큼 증가시킨다.
     """
     start_ns = time.perf_counter_ns()
     now = datetime.now(timezone.utc)
     session_factory = get_session_factory()
+    run = TransitionRun()
+    last_id = 0
+
+    while True:
+        with session_factory() as session:
+            ids = session.scalars(
+                select(Task.id)
+                .where(Task.id > last_id, Task.due_date < now, _PENDING_PREDICATE)
+                .order_by(Task.id)
+                .limit(chunk_size)
+            ).all()
+            if not ids:
+                break
+            hold_ns = time.perf_counter_ns()
+            deltas = _mark_missed(session, ids, now)
+            session.commit()
+            hold_ms = (time.perf_counter_ns() - hold_ns) / 1_000_000
+        _get_miss_service().apply_cache_deltas(deltas)
+
+        run.chunks += 1
+        run.transitioned += sum(deltas.values())
+        run.max_lock_hold_ms = max(run.max_lock_hold_ms, hold_ms)
+        run.affected_user_ids.update(deltas)
+        last_id = ids[-1]
+        if len(ids) < chunk_size:
+            break
+        if chunk_sleep_seconds > 0:
+            time.sleep(chunk_sleep_seconds)
 
-    with session_factory() as session:
-        affected_users = (
-            session.query(Task.user_id)
-            .filter(
-                Task.due_date < now,
-                Task.status.notin_([TaskStatus.COMPLETED, TaskStatus.TASK_MISS]),
-            )
-            .distinct()
-            .all()
-        )
-        affected_user_ids = [row[0] for row in affected_users]
-
-        if not affected_user_ids:
-            elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
-            logger.info(
-                "[%s] task_miss 전환 대상 없음 (%.3fms)",
-                now.isoformat(timespec="milliseconds"),
-                elapsed_ms,
-            )
-            return 0
+    elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+    logger.info(
+        "[%s] task_miss 전환 완료: %d건, 청크 %d개, 최대 잠금 %.3fms, 영향 사용자 %d명 (%.3fms)",
+        now.isoformat(timespec="milliseconds"),
+        run.transitioned,
+        run.chunks,
+        run.max_lock_hold_ms,
+        len(run.affected_user_ids),
+        elapsed_ms,
+    )
+    return run
 
-        result = session.execute(
-            update(Task)
-            .where(
-                Task.due_date < now,
-                Task.status.notin_([TaskStatus.COMPLETED, TaskStatus.TASK_MISS]),
-            )
-            .values(status=TaskStatus.TASK_MISS, updated_at=now)
-        )
-        transitioned = result.rowcount  # type: ignore[union-attr]
-        session.commit()
 
-    _invalidate_redis_cache(affected_user_ids)
+def _transition_due_tasks(task_ids: list[int]) -> int:
+    """
+    기한 타이머 콜백: task_ids 중 여전히 due_date < 현재시각 이고 미완료인 과업만 task_miss 로 전환한다.
+    조건을 다시 확인하므로 그 사이 완료·기한 연장된 과업은 건너뛴다.
+    """
+    start_ns = time.perf_counter_ns()
+    now = datetime.now(timezone.utc)
+    with get_session_factory()() as session:
+        deltas = _mark_missed(session, task_ids, now)
+        session.commit()
+    _get_miss_service().apply_cache_deltas(deltas)
+    transitioned = sum(deltas.values())
 
     elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
     logger.info(
-        "[%s] task_miss 전환 완료: %d건, 영향 사용자: %s (%.3fms)",
+        "[%s] 기한 타이머 task_miss 전환: %d/%d건 (%.3fms)",
         now.isoformat(timespec="milliseconds"),
         transitioned,
-        affected_user_ids,
+        len(task_ids),
         elapsed_ms,
     )
     return transitioned
 
 
-def _invalidate_redis_cache(user_ids: list[str]) -> None:
-    """전환된 사용자의 누적 miss_count 캐시를 삭제한다."""
-    client = get_redis()
-    if client is None:
-        return
-    keys = [REDIS_KEY_PREFIX.format(user_id=uid) for uid in user_ids]
-    try:
-        client.delete(*keys)
-        logger.debug("Redis 캐시 무효화: %s", keys)
-    except Exception:
-        logger.warning("Redis 캐시 무효화 실패", exc_info=True)
+def _load_upcoming_tasks(horizon_seconds: int) -> list[DueEntry]:
+    """현재시각부터 horizon 안에 기한이 오는 미완료 과업 (타이머 적재용)."""
+    now = datetime.now(timezone.utc)
+    with get_session_factory()() as session:
+        rows = session.execute(
+            select(Task.id, Task.user_id, Task.due_date).where(
+                Task.due_date >= now,
+                Task.due_date < now + timedelta(seconds=horizon_seconds),
+                _PENDING_PREDICATE,
+            )
+        ).all()
+    return [(task_id, user_id, due_date) for task_id, user_id, due_date in rows]
+
+
+_due_timer: DueDateTimer | None = None
+
+
+def get_due_timer() -> DueDateTimer:
+    global _due_timer
+    if _due_timer is None:
+        _due_timer = DueDateTimer(
+            on_due=_transition_due_tasks,
+            horizon_seconds=MISS_DUE_TIMER_HORIZON_SECONDS,
+            batch_size=MISS_DUE_TIMER_BATCH_SIZE,
+        )
+    return _due_timer
+
+
+def _reconcile() -> TransitionRun:
+    """안전망 스윕: 놓친 만료 과업을 전체 조건으로 전환하고, 타이머에 다음 horizon 의 기한을 채운다."""
+    run = _transition_expired_tasks()
+    if MISS_DUE_TIMER_ENABLED:
+        get_due_timer().schedule_many(_load_upcoming_tasks(MISS_DUE_TIMER_HORIZON_SECONDS))
+    return run
 
 
 class TaskMissScheduler:
-    """task_miss 상태 전환을 주기적으로 수행하는 스케줄러 래퍼."""
+    """기한 타이머와 주기적 재조정 스윕을 함께 구동하는 스케줄러 래퍼."""
 
-    def __init__(self, interval_seconds: int = MISS_CHECK_INTERVAL_SECONDS) -> None:
+    def __init__(self, interval_seconds: int = MISS_RECONCILE_INTERVAL_SECONDS) -> None:
         self._scheduler = BackgroundScheduler(daemon=True)
         self._interval = interval_seconds
 
     def start(self) -> None:
+        if MISS_DUE_TIMER_ENABLED:
+            get_due_timer().start()
         self._scheduler.add_job(
-            _transition_expired_tasks,
+            _reconcile,
             trigger="interval",
             seconds=self._interval,
             id="task_miss_transition",
@@ -104,13 +210,16 @@ class TaskMissScheduler:
             next_run_time=datetime.now(timezone.utc),
         )
         self._scheduler.start()
-        logger.info("TaskMissScheduler 시작 (주기: %ds)", self._interval)
+        logger.info(
+            "TaskMissScheduler 시작 (재조정 주기: %ds, 기한 타이머: %s)", self._interval, MISS_DUE_TIMER_ENABLED
+        )
 
     def shutdown(self) -> None:
         self._scheduler.shutdown(wait=False)
+        get_due_timer().shutdown()
         logger.info("TaskMissScheduler 종료")
 
     @staticmethod
-    def run_now() -> int:
-        """즉시 1회 실행하여 전환 건수를 반환한다. API 수동 트리거용."""
+    def run_now() -> TransitionRun:
+        """즉시 1회 실행하여 전환 건수·청크 수·최대 잠금 보유 시간을 반환한다. API 수동 트리거용."""
         return _transition_expired_tasks()
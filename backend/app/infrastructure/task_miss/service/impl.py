@@ -1,30 +1,45 @@
 """
 TaskMiss 서비스 구현체 [PRO-B-10].
-사용자별 task_miss 누적 횟수를 DB Aggregation으로 집계하고,
+사용자별 task_miss 누적 횟수를 user_miss_counts 카운터(miss_counter)에서 PK 1건으로 읽고,
 Redis에 user:{userId}:miss_count 키로 캐싱하여 성능을 최적화한다.
+상태 전환 배치는 키를 지우지 않고 apply_cache_deltas 로 파이프라인 INCRBY 한다 (Redis 미가용 시 카운터 테이블 조회).
+같은 사용자의 동시 캐시 미스는 single-flight 로 합쳐 DB 조회 1회만 실행한다.
 """
 import logging
 import time
 from datetime import datetime, timezone
 
-from sqlalchemy import func as sqlfunc
-
-from app.core.database import get_session_factory
+from app.core.database import session_scope
 from app.core.redis import get_redis
-from app.domains.task.models import Task, TaskStatus
+from app.core.singleflight import SingleFlight
+from app.infrastructure.task_miss.miss_counter import load_miss_count, load_miss_counts, reset_miss_count
 
 logger = logging.getLogger(__name__)
 
 REDIS_KEY_PREFIX = "user:{user_id}:miss_count"
 CACHE_TTL_SECONDS = 300
 
+# 서비스 인스턴스가 여러 곳에서 만들어지므로 모듈 단위로 공유한다
+_miss_count_flight = SingleFlight()
+
+# 키가 존재할 때만 증감 (없으면 다음 조회 때 카운터 테이블에서 채워짐)
+_INCR_IF_EXISTS_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('INCRBY', KEYS[1], ARGV[1])
+end
+return nil
+"""
+
 
 class TaskMissServiceImpl:
     """사용자별 task_miss 누적 횟수 조회 구현체."""
 
+    def __init__(self) -> None:
+        self._incr_script = None
+
     def get_cumulative_miss_count(self, user_id: str) -> tuple[int, bool]:
         """
-        Redis 캐시를 먼저 확인하고, 미스 시 DB에서 집계하여 캐시에 저장한다.
+        Redis 캐시를 먼저 확인하고, 미스 시 카운터 테이블에서 읽어 캐시에 저장한다.
         Returns: (count, cached)
         """
         start_ns = time.perf_counter_ns()
@@ -42,12 +57,11 @@ class TaskMissServiceImpl:
             )
             return cached_value, True
 
-        count = self._aggregate_from_db(user_id)
-        self._set_cache(user_id, count)
+        count = _miss_count_flight.do(user_id, self._load_and_cache, user_id)
 
         elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
         logger.info(
-            "[%s] miss_count DB 집계 user=%s count=%d (%.3fms)",
+            "[%s] miss_count DB 조회 user=%s count=%d (%.3fms)",
             now.isoformat(timespec="milliseconds"),
             user_id,
             count,
@@ -55,22 +69,123 @@ class TaskMissServiceImpl:
         )
         return count, False
 
+    def get_cumulative_miss_counts(self, user_ids: list[str]) -> dict[str, tuple[int, bool]]:
+        """
+        여러 사용자의 누적 횟수를 Redis MGET 1회로 읽고, 미스만 카운터 테이블에서 한 번에 읽어
+        파이프라인 1회로 캐시에 되써 넣는다. 입력 순서를 유지하며 중복 id 는 한 번만 조회한다.
+        Returns: {user_id: (count, cached)}
+        """
+        start_ns = time.perf_counter_ns()
+        ids = list(dict.fromkeys(user_ids))
+        cached = self._get_many_from_cache(ids)
+        missing = [user_id for user_id in ids if user_id not in cached]
+        loaded = self._load_many_from_db(missing)
+        self._set_many_cache(loaded)
+
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        logger.info(
+            "miss_count 일괄 조회 users=%d 캐시 HIT=%d DB=%d (%.3fms)",
+            len(ids), len(cached), len(loaded), elapsed_ms,
+        )
+        return {
+            user_id: (cached[user_id], True) if user_id in cached else (loaded[user_id], False)
+            for user_id in ids
+        }
+
     def refresh_cache(self, user_id: str) -> int:
-        """DB에서 최신 카운트를 조회 후 캐시를 갱신한다."""
-        count = self._aggregate_from_db(user_id)
+        """tasks 를 재집계해 카운터 테이블과 캐시를 덮어쓴다."""
+        if not user_id.isdigit():
+            return 0
+        with session_scope() as session:
+            count = reset_miss_count(session, int(user_id))
+            session.commit()
         self._set_cache(user_id, count)
         return count
 
+    def apply_cache_deltas(self, deltas: dict[int, int]) -> None:
+        """
+        커밋된 사용자별 증감을 파이프라인 1회로 캐시에 반영한다 (키가 있을 때만 INCRBY).
+        실패하면 해당 키를 지워 다음 조회에서 카운터 테이블 값을 읽게 한다.
+        """
+        deltas = {user_id: delta for user_id, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        client = get_redis()
+        if client is None:
+            return
+        try:
+            if self._incr_script is None:
+                self._incr_script = client.register_script(_INCR_IF_EXISTS_LUA)
+            pipe = client.pipeline()
+            for user_id, delta in deltas.items():
+                self._incr_script(keys=[REDIS_KEY_PREFIX.format(user_id=user_id)], args=[delta], client=pipe)
+            pipe.execute()
+        except Exception:
+            logger.warning("Redis 캐시 증감 실패 users=%d — 무효화로 대체", len(deltas), exc_info=True)
+            try:
+                client.delete(*(REDIS_KEY_PREFIX.format(user_id=user_id) for user_id in deltas))
+            except Exception:
+                logger.warning("Redis 캐시 무효화 실패", exc_info=True)
+
+    def invalidate_cache(self, user_id: str) -> None:
+        """과업 상태가 일괄 변경된 경우 캐시를 삭제해 다음 조회에서 재집계되게 한다."""
+        client = get_redis()
+        if client is None:
+            return
+        try:
+            client.delete(REDIS_KEY_PREFIX.format(user_id=user_id))
+        except Exception:
+            logger.warning("Redis 캐시 무효화 실패 user=%s", user_id, exc_info=True)
+
+    @classmethod
+    def _load_and_cache(cls, user_id: str) -> int:
+        count = cls._load_from_db(user_id)
+        cls._set_cache(user_id, count)
+        return count
+
     @staticmethod
-    def _aggregate_from_db(user_id: str) -> int:
-        session_factory = get_session_factory()
-        with session_factory() as session:
-            result = (
-                session.query(sqlfunc.count(Task.id))
-                .filter(Task.user_id == user_id, Task.status == TaskStatus.TASK_MISS)
-                .scalar()
-            )
-        return result or 0
+    def _load_from_db(user_id: str) -> int:
+        if not user_id.isdigit():
+            return 0
+        with session_scope() as session:
+            count = load_miss_count(session, int(user_id))
+            session.commit()
+        return count
+
+    @staticmethod
+    def _load_many_from_db(user_ids: list[str]) -> dict[str, int]:
+        numeric = [int(user_id) for user_id in user_ids if user_id.isdigit()]
+        counts: dict[int, int] = {}
+        if numeric:
+            with session_scope() as session:
+                counts = load_miss_counts(session, numeric)
+                session.commit()
+        return {user_id: counts.get(int(user_id), 0) if user_id.isdigit() else 0 for user_id in user_ids}
+
+    @staticmethod
+    def _get_many_from_cache(user_ids: list[str]) -> dict[str, int]:
+        client = get_redis()
+        if client is None or not user_ids:
+            return {}
+        try:
+            values = client.mget([REDIS_KEY_PREFIX.format(user_id=user_id) for user_id in user_ids])
+        except Exception:
+            logger.warning("Redis 캐시 일괄 조회 실패 users=%d", len(user_ids), exc_info=True)
+            return {}
+        return {user_id: int(value) for user_id, value in zip(user_ids, values) if value is not None}
+
+    @staticmethod
+    def _set_many_cache(counts: dict[str, int]) -> None:
+        client = get_redis()
+        if client is None or not counts:
+            return
+        try:
+            pipe = client.pipeline(transaction=False)
+            for user_id, count in counts.items():
+                pipe.setex(REDIS_KEY_PREFIX.format(user_id=user_id), CACHE_TTL_SECONDS, str(count))
+            pipe.execute()
+        except Exception:
+            logger.warning("Redis 캐시 일괄 저장 실패 users=%d", len(counts), exc_info=True)
 
     @staticmethod
     def _get_from_cache(user_id: str) -> int | None:
@@ -17,6 +17,19 @@ class TaskMissService(Protocol):
         """
         ...
 
+    def get_cumulative_miss_counts(self, user_ids: list[str]) -> dict[str, tuple[int, bool]]:
+        """
+        여러 사용자의 누적 task_miss 횟수를 한 번에 반환한다 (Redis MGET 1회 + 미스분 DB 일괄 조회).
+
+        Returns:
+            {user_id: (count, cached)}
+        """
+        ...
+
     def refresh_cache(self, user_id: str) -> int:
-        """DB에서 최신 카운트를 조회하여 Redis 캐시를 갱신하고 카운트를 반환한다."""
+        """tasks 를 재집계해 카운터 테이블과 Redis 캐시를 갱신하고 카운트를 반환한다."""
+        ...
+
+    def apply_cache_deltas(self, deltas: dict[int, int]) -> None:
+        """커밋된 사용자별 task_miss 증감을 Redis 캐시에 반영한다 (키가 있을 때만)."""
         ...
@@ -2,13 +2,15 @@
 파라미터 레지스트리 싱글톤 [PRO-B-16].
 DB의 system_parameters 테이블을 인메모리에 캐싱하고,
 TTL 경과 시 자동으로 DB에서 재조회하여 앱 재시작 없이 변경사항을 반영한다.
+만료 직후 동시에 들어온 조회들은 single-flight 로 합쳐 DB 재조회를 1회만 실행한다.
 """
 import logging
 import threading
 import time
 from typing import Any
 
-from app.core.database import get_session_factory
+from app.core.database import session_scope
+from app.core.singleflight import SingleFlight
 from app.infrastructure.task_params.defaults import PARAM_DEFAULTS
 from app.infrastructure.task_params.models import SystemParameter
 
@@ -16,6 +18,8 @@ logger = logging.getLogger(__name__)
 
 CACHE_TTL_SECONDS = 30
 
+_refresh_flight = SingleFlight()
+
 
 def _cast_value(raw: str, value_type: str) -> Any:
     """문자열 값을 지정된 타입으로 변환한다."""
@@ -85,14 +89,20 @@ class ParameterRegistry:
         return self._load_from_db()
 
     def _refresh_if_stale(self) -> None:
-        now = time.monotonic()
-        if now - self._last_refresh > self._ttl:
+        if self._is_stale():
+            _refresh_flight.do("system_parameters", self._reload_if_stale)
+
+    def _is_stale(self) -> bool:
+        return time.monotonic() - self._last_refresh > self._ttl
+
+    def _reload_if_stale(self) -> None:
+        # 만료를 확인한 뒤 앞선 갱신이 끝났을 수 있으므로 다시 확인한다
+        if self._is_stale():
             self._load_from_db()
 
     def _load_from_db(self) -> int:
         try:
-            session_factory = get_session_factory()
-            with session_factory() as session:
+            with session_scope() as session:
                 rows = session.query(SystemParameter).all()
                 new_cache: dict[str, tuple[Any, str]] = {}
                 for row in rows:
@@ -9,9 +9,13 @@ from datetime import datetime, timezone
 
 from sqlalchemy import and_
 
-from app.core.database import get_session_factory
+from app.core.database import session_scope
 from app.core.redis import get_redis
-from app.domains.task.models import Task, TaskStatus
+from app.domains.task.daily_limit import move_daily_slot
+from app.domains.task.models import Task, TaskStatus, to_local_naive
+from app.domains.task.stats_cache import get_task_stats_cache
+from app.infrastructure.task_miss.miss_counter import apply_miss_deltas, miss_delta
+from app.infrastructure.task_miss.scheduler import get_due_timer
 from app.infrastructure.task_strategy.schemas import (
     ApplyStrategyRequest,
     ApplyStrategyResponse,
@@ -36,15 +40,15 @@ class TaskStrategyServiceImpl:
     def apply_strategy(self, task_id: int, request: ApplyStrategyRequest) -> ApplyStrategyResponse:
         start_ns = time.perf_counter_ns()
         now = datetime.now(timezone.utc)
-        session_factory = get_session_factory()
-
-        with session_factory() as session:
+        with session_scope() as session:
             task: Task | None = session.get(Task, task_id)
             if task is None:
                 raise ValueError(f"과업을 찾을 수 없습니다: task_id={task_id}")
 
             previous_status = task.status.value if isinstance(task.status, TaskStatus) else str(task.status)
             new_status = _STRATEGY_STATUS_MAP[request.strategy_select]
+            apply_miss_deltas(session, {task.user_id: miss_delta(task.status, new_status)})
+            stats_days = {task.due_date.date()}
 
             task.status = new_status
             task.updated_at = now
@@ -53,7 +57,10 @@ class TaskStrategyServiceImpl:
                 task.is_archived = True
 
             if request.strategy_select == StrategySelect.MODIFY and request.new_due_date:
-                task.due_date = request.new_due_date
+                new_due_date = to_local_naive(request.new_due_date)
+                move_daily_slot(session, task.user_id, task.due_date.date(), new_due_date.date())
+                task.due_date = new_due_date
+                stats_days.add(task.due_date.date())
                 task.is_archived = False
 
             if request.strategy_select == StrategySelect.KEEP:
@@ -65,8 +72,15 @@ class TaskStrategyServiceImpl:
             is_archived = task.is_archived
             current_status = task.status.value if isinstance(task.status, TaskStatus) else str(task.status)
             user_id = task.user_id
+            due_date = task.due_date
 
         self._invalidate_miss_cache(user_id)
+        get_task_stats_cache().invalidate(user_id, *stats_days)
+        # MODIFY 는 대기 상태로 되돌리므로 (새) 기한을 타이머에 올리고, 나머지는 task_miss 라 뺀다
+        if new_status == TaskStatus.PENDING:
+            get_due_timer().schedule(task_id, user_id, due_date)
+        else:
+            get_due_timer().cancel(task_id)
 
         elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
         logger.info(
@@ -91,15 +105,13 @@ class TaskStrategyServiceImpl:
 
     def get_active_tasks(self, user_id: str) -> list[Task]:
         """is_archived=False인 과업만 반환하여 보관 과업을 활성 리스트에서 제외한다."""
-        session_factory = get_session_factory()
-        with session_factory() as session:
+        with session_scope() as session:
             tasks = (
                 session.query(Task)
                 .filter(and_(Task.user_id == user_id, Task.is_archived == False))  # noqa: E712
                 .order_by(Task.due_date.asc())
                 .all()
             )
-            session.expunge_all()
         return tasks
 
     @staticmethod
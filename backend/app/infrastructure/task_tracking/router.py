@@ -6,7 +6,7 @@ from datetime import datetime, timezone
 
 from fastapi import APIRouter, Path
 
-from app.core.database import get_session_factory
+from app.core.database import session_scope
 from app.infrastructure.task_tracking.experiment import PersistentExperimentAssigner
 from app.infrastructure.task_tracking.schemas import (
     BehaviorChainResponse,
@@ -88,8 +88,7 @@ def get_experiment_assignment(
     user_id: str = Path(..., description="사용자 식별자"),
 ) -> ExperimentInfoResponse:
     """사용자의 실험군 할당 정보를 반환한다. 미할당 시 해시 기반으로 신규 할당한다."""
-    session_factory = get_session_factory()
-    with session_factory() as session:
+    with session_scope() as session:
         result = PersistentExperimentAssigner.get_or_assign(session, user_id)
         session.commit()
     return ExperimentInfoResponse(
@@ -116,8 +115,7 @@ def get_branched_response(
     실험군(treatment)과 대조군(control)에 서로 다른 응답 payload를 반환한다.
     Feature Flag에 따른 Response Branching 처리의 참조 구현.
     """
-    session_factory = get_session_factory()
-    with session_factory() as session:
+    with session_scope() as session:
         result = PersistentExperimentAssigner.get_or_assign(session, user_id)
         session.commit()
 
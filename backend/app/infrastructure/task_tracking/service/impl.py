@@ -10,8 +10,10 @@ import time
 from datetime import datetime, timezone
 
 from sqlalchemy import func as sqlfunc
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
 
-from app.core.database import get_session_factory
+from app.core.database import session_scope
 from app.infrastructure.task_tracking.experiment import PersistentExperimentAssigner
 from app.infrastructure.task_tracking.models import BehaviorLog
 from app.infrastructure.task_tracking.schemas import RecordEventRequest
@@ -19,6 +21,11 @@ from app.infrastructure.task_tracking.schemas import RecordEventRequest
 logger = logging.getLogger(__name__)
 
 
+def _as_utc(value: datetime) -> datetime:
+    """DB(SQLite 등)에서 읽은 naive datetime 은 UTC 로 간주한다."""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
 class BehaviorTrackingServiceImpl:
     """행동 체인 트래킹 + 실험 결합 구현체 [PRO-B-24]."""
 
@@ -30,9 +37,7 @@ class BehaviorTrackingServiceImpl:
         """
         start_ns = time.perf_counter_ns()
         now = datetime.now(timezone.utc)
-        session_factory = get_session_factory()
-
-        with session_factory() as session:
+        with session_scope() as session:
             # [PRO-B-24] 실험군 할당 조회/생성 (모든 로그에 experiment_id 결합)
             assignment = PersistentExperimentAssigner.get_or_assign(session, request.user_id)
 
@@ -85,23 +90,65 @@ class BehaviorTrackingServiceImpl:
 
         return log_entry
 
+    def record_events(self, events: list[tuple[RecordEventRequest, datetime]], db: Session) -> int:
+        """
+        (요청, 발생 시각) 여러 건을 기록한다 (텔레메트리 배치 수신용). record_event 와 같은 규칙으로
+        experiment_id 를 결합하고 latency_ms 를 계산하되, 직전 이벤트는 task_id 별 MAX(event_at) 1회 조회 +
+        배치 안의 시간순으로 구하고, 기록은 INSERT 1회로 한다. commit 은 호출자가 한다.
+        """
+        if not events:
+            return 0
+        assignments = {
+            user_id: PersistentExperimentAssigner.get_or_assign(db, user_id)
+            for user_id in {request.user_id for request, _ in events}
+        }
+        task_ids = {request.task_id for request, _ in events}
+        last_at: dict[int, datetime] = {
+            task_id: _as_utc(at)
+            for task_id, at in db.execute(
+                select(BehaviorLog.task_id, sqlfunc.max(BehaviorLog.event_at))
+                .where(BehaviorLog.task_id.in_(task_ids))
+                .group_by(BehaviorLog.task_id)
+            )
+        }
+        rows = []
+        for request, event_at in sorted(events, key=lambda e: _as_utc(e[1])):
+            event_at = _as_utc(event_at)
+            previous_event_at = last_at.get(request.task_id)
+            latency_ms = None
+            if previous_event_at is not None:
+                latency_ms = round((event_at - previous_event_at).total_seconds() * 1000, 3)
+            last_at[request.task_id] = event_at
+            assignment = assignments[request.user_id]
+            rows.append({
+                "task_id": request.task_id,
+                "user_id": request.user_id,
+                "event_type": request.event_type.value,
+                "experiment_id": assignment.experiment_id,
+                "experiment_group": assignment.group,
+                "event_at": event_at,
+                "previous_event_at": previous_event_at,
+                "latency_ms": latency_ms,
+                "metadata_json": json.dumps(request.metadata, ensure_ascii=False) if request.metadata else None,
+            })
+        db.execute(insert(BehaviorLog), rows)
+        logger.info("[PRO-B-24] 이벤트 배치 기록 events=%d tasks=%d", len(rows), len(task_ids))
+        return len(rows)
+
     def get_behavior_chain(self, task_id: int) -> list[BehaviorLog]:
         """task_id 기준으로 시간순 행동 체인을 반환한다."""
-        session_factory = get_session_factory()
-        with session_factory() as session:
+        with session_scope() as session:
             logs = (
                 session.query(BehaviorLog)
                 .filter(BehaviorLog.task_id == task_id)
                 .order_by(BehaviorLog.event_at.asc())
                 .all()
             )
-            session.expunge_all()
         return logs
 
     def get_user_summary(self, user_id: str) -> dict:
         """사용자별 이벤트 유형 카운트, 평균 latency, 실험 정보 요약."""
-        session_factory = get_session_factory()
-        with session_factory() as session:
+        with session_scope() as session:
             assignment = PersistentExperimentAssigner.get_or_assign(session, user_id)
 
             rows = (
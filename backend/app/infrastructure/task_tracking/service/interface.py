@@ -2,8 +2,11 @@
 행동 트래킹 서비스 인터페이스 [PRO-B-24].
 이벤트 기록, 행동 체인 조회, 사용자 요약 계약을 정의한다.
 """
+from datetime import datetime
 from typing import Protocol
 
+from sqlalchemy.orm import Session
+
 from app.infrastructure.task_tracking.models import BehaviorLog
 from app.infrastructure.task_tracking.schemas import RecordEventRequest
 
@@ -15,6 +18,10 @@ class BehaviorTrackingService(Protocol):
         """이벤트를 기록하고 experiment_id를 자동 결합한다."""
         ...
 
+    def record_events(self, events: list[tuple[RecordEventRequest, datetime]], db: Session) -> int:
+        """(요청, 발생 시각) 여러 건을 한 번의 INSERT 로 기록한다. commit 은 호출자가 한다."""
+        ...
+
     def get_behavior_chain(self, task_id: int) -> list[BehaviorLog]:
         """task_id 기준 행동 체인을 시간순으로 반환한다."""
         ...
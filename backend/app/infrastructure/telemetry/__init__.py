@@ -0,0 +1,7 @@
+"""
+telemetry 인프라 패키지.
+클라이언트 분석·행동·세션 이벤트 배치 수신 (POST /telemetry/batch).
+"""
+from app.infrastructure.telemetry.router import router
+
+__all__ = ["router"]
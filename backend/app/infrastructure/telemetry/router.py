@@ -0,0 +1,50 @@
+"""
+텔레메트리 배치 수신 API.
+클라이언트가 세션 동안 쌓은 분석·행동·세션 이벤트를 한 번의 요청으로 보낸다 (개별 엔드포인트 호출 대체).
+"""
+from fastapi import APIRouter, Depends, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+
+from app.domains.auth.models import User
+from app.domains.auth.security import get_current_user
+from app.infrastructure.telemetry.schemas import (
+    TELEMETRY_BATCH_MAX_EVENTS,
+    TelemetryBatchAdapter,
+    TelemetryBatchResponse,
+)
+from app.infrastructure.telemetry.service import TelemetryServiceImpl
+
+router = APIRouter()
+
+_service: TelemetryServiceImpl | None = None
+
+
+def _get_service() -> TelemetryServiceImpl:
+    global _service
+    if _service is None:
+        _service = TelemetryServiceImpl()
+    return _service
+
+
+@router.post(
+    "/batch",
+    response_model=TelemetryBatchResponse,
+    summary=f"이벤트 배치 수신 — type 별 이종 이벤트 배열 (최대 {TELEMETRY_BATCH_MAX_EVENTS}건)",
+)
+async def ingest_batch(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+) -> TelemetryBatchResponse:
+    """
+    본문: [{"type": "calendar_view", "chain_length": 3}, {"type": "session_action", "session_id": "..."}, ...]
+    type: calendar_view | sticker_exposed | app_lifecycle | task_event | session_action (schemas 참고).
+    occurred_at 을 보내면 이벤트 시각으로 쓰고, 없으면 서버 수신 시각을 쓴다.
+    하나라도 검증에 실패하면 배치 전체를 422 로 거절한다.
+    """
+    try:
+        events = TelemetryBatchAdapter.validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors(include_url=False))
+    return await run_in_threadpool(_get_service().ingest, current_user.id, events)
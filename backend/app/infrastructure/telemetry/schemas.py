@@ -0,0 +1,82 @@
+"""
+텔레메트리 배치 수신 요청/응답 스키마.
+클라이언트가 개별 엔드포인트로 보내던 분석·행동·세션 이벤트를 type 판별자(discriminator)로 구분해 한 배열로 받는다.
+
+| type             | 기존 엔드포인트                        |
+|------------------|----------------------------------------|
+| calendar_view    | POST /chain/analytics/calendar-view    |
+| sticker_exposed  | POST /chain/analytics/sticker-exposed  |
+| app_lifecycle    | POST /chain/analytics/app-lifecycle    |
+| task_event       | POST /task-tracking/events             |
+| session_action   | POST /session/action                   |
+"""
+import os
+from datetime import datetime
+from typing import Annotated, Any, Literal, Optional, Union
+
+from pydantic import BaseModel, Field, TypeAdapter
+
+from app.infrastructure.task_tracking.schemas import EventType
+
+TELEMETRY_BATCH_MAX_EVENTS = int(os.getenv("TELEMETRY_BATCH_MAX_EVENTS", "500"))
+
+
+class _TelemetryEventBase(BaseModel):
+    occurred_at: Optional[datetime] = Field(None, description="클라이언트 발생 시각 (없으면 서버 수신 시각)")
+
+
+class CalendarViewEvent(_TelemetryEventBase):
+    """[PRO-B-41] 캘린더 노출 — 현재 ChainLength."""
+
+    type: Literal["calendar_view"]
+    chain_length: int = Field(..., ge=0)
+
+
+class StickerExposedEvent(_TelemetryEventBase):
+    """[PRO-B-43] 스티커 노출 — 결정된 등급 id."""
+
+    type: Literal["sticker_exposed"]
+    sticker_grade_id: int = Field(..., ge=0)
+
+
+class AppLifecycleEvent(_TelemetryEventBase):
+    """[PRO-B-41] 앱 백그라운드/종료 — dwell_time_after_complete 계산."""
+
+    type: Literal["app_lifecycle"]
+    event_type: Literal["app_paused", "app_terminate"]
+
+
+class TaskEvent(_TelemetryEventBase):
+    """[PRO-B-24] 과업 행동 이벤트. user_id 생략 시 인증 사용자."""
+
+    type: Literal["task_event"]
+    task_id: int
+    user_id: Optional[str] = None
+    event_type: EventType
+    metadata: Optional[dict[str, Any]] = None
+
+
+class SessionActionEvent(_TelemetryEventBase):
+    """[PM-TF-INF-02] 세션 내 액션."""
+
+    type: Literal["session_action"]
+    session_id: str
+
+
+TelemetryEvent = Annotated[
+    Union[CalendarViewEvent, StickerExposedEvent, AppLifecycleEvent, TaskEvent, SessionActionEvent],
+    Field(discriminator="type"),
+]
+
+# 요청 본문(JSON 배열)을 바이트에서 바로 한 번에 검증한다 — 이벤트별 모델 검증을 반복하지 않는다.
+TelemetryBatchAdapter = TypeAdapter(
+    Annotated[list[TelemetryEvent], Field(min_length=1, max_length=TELEMETRY_BATCH_MAX_EVENTS)]
+)
+
+
+class TelemetryBatchResponse(BaseModel):
+    """배치 처리 결과. accepted: 기록(또는 큐 적재)된 이벤트 수, counts: type 별 수신 수."""
+
+    received: int
+    accepted: int
+    counts: dict[str, int] = Field(default_factory=dict)
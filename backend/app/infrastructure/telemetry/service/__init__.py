@@ -0,0 +1,4 @@
+"""텔레메트리 배치 수신 서비스 패키지."""
+from app.infrastructure.telemetry.service.impl import TelemetryServiceImpl
+
+__all__ = ["TelemetryServiceImpl"]
@@ -0,0 +1,87 @@
+"""
+텔레메트리 배치 수신 서비스 구현체.
+검증된 이벤트 배열을 type 별로 묶어 기존 서비스의 배치 메서드로 넘긴다 (이벤트 규칙은 각 서비스가 소유).
+
+- calendar_view / sticker_exposed / app_lifecycle → ChainServiceImpl.record_analytics_events (write-behind 싱크)
+- task_event → BehaviorTrackingServiceImpl.record_events (behavior_logs INSERT 1회)
+- session_action → TodayFocusServiceImpl.record_actions (session_log IN 조회 1회)
+behavior_logs·session_log 변경은 요청 범위 세션의 한 트랜잭션으로 커밋한다.
+"""
+import logging
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any
+
+from app.core.database import session_scope
+from app.domains.TodayFocus.today_focus.service import TodayFocusServiceImpl
+from app.infrastructure.chain.schemas import ChainAnalyticsEventType
+from app.infrastructure.chain.service import ChainServiceImpl
+from app.infrastructure.task_tracking.schemas import RecordEventRequest
+from app.infrastructure.task_tracking.service import BehaviorTrackingServiceImpl
+from app.infrastructure.telemetry.schemas import (
+    AppLifecycleEvent,
+    CalendarViewEvent,
+    SessionActionEvent,
+    StickerExposedEvent,
+    TaskEvent,
+    TelemetryBatchResponse,
+    TelemetryEvent,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class TelemetryServiceImpl:
+    """이종 이벤트 배열 → 기존 서비스 배치 기록."""
+
+    def __init__(self) -> None:
+        self._chain_service = ChainServiceImpl()
+        self._tracking_service = BehaviorTrackingServiceImpl()
+        self._today_focus_service = TodayFocusServiceImpl()
+
+    def ingest(self, user_id: int, events: list[TelemetryEvent]) -> TelemetryBatchResponse:
+        received_at = datetime.now(timezone.utc)
+        analytics: list[tuple[str, datetime, dict[str, Any]]] = []
+        task_events: list[tuple[RecordEventRequest, datetime]] = []
+        actions: list[tuple[str, datetime]] = []
+        for event in events:
+            occurred = event.occurred_at or received_at
+            if occurred.tzinfo is None:
+                occurred = occurred.replace(tzinfo=timezone.utc)
+            if isinstance(event, CalendarViewEvent):
+                analytics.append(
+                    (ChainAnalyticsEventType.CALENDAR_VIEW, occurred, {"chain_length": event.chain_length})
+                )
+            elif isinstance(event, StickerExposedEvent):
+                analytics.append(
+                    (ChainAnalyticsEventType.STICKER_EXPOSED, occurred, {"sticker_grade_id": event.sticker_grade_id})
+                )
+            elif isinstance(event, AppLifecycleEvent):
+                analytics.append((event.event_type, occurred, {}))
+            elif isinstance(event, TaskEvent):
+                request = RecordEventRequest(
+                    task_id=event.task_id,
+                    user_id=event.user_id or str(user_id),
+                    event_type=event.event_type,
+                    metadata=event.metadata,
+                )
+                task_events.append((request, occurred))
+            elif isinstance(event, SessionActionEvent):
+                # session_log 시각은 naive UTC 로 저장한다 (/session/action 과 동일)
+                actions.append((event.session_id, occurred.astimezone(timezone.utc).replace(tzinfo=None)))
+
+        accepted = 0
+        if task_events or actions:
+            with session_scope() as db:
+                accepted += self._tracking_service.record_events(task_events, db)
+                accepted += self._today_focus_service.record_actions(actions, db)
+                db.commit()
+        if analytics:
+            accepted += self._chain_service.record_analytics_events(user_id, analytics)
+
+        counts = Counter(event.type for event in events)
+        logger.info(
+            "[telemetry] batch user_id=%s received=%d accepted=%d counts=%s",
+            user_id, len(events), accepted, dict(counts),
+        )
+        return TelemetryBatchResponse(received=len(events), accepted=accepted, counts=dict(counts))
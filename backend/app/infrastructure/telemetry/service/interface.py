@@ -0,0 +1,14 @@
+"""
+텔레메트리 배치 수신 서비스 인터페이스.
+"""
+from typing import Protocol
+
+from app.infrastructure.telemetry.schemas import TelemetryBatchResponse, TelemetryEvent
+
+
+class TelemetryService(Protocol):
+    """이종 이벤트 배열을 기존 서비스로 분배하는 서비스."""
+
+    def ingest(self, user_id: int, events: list[TelemetryEvent]) -> TelemetryBatchResponse:
+        """이벤트를 type 별로 묶어 테이블마다 일괄 기록하고 처리 결과를 반환한다."""
+        ...
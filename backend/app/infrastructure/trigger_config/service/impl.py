@@ -9,7 +9,7 @@ from datetime import datetime, timezone
 
 from sqlalchemy import func as sqlfunc
 
-from app.core.database import get_session_factory
+from app.core.database import session_scope
 from app.infrastructure.task_archive.models import TaskArchive
 from app.infrastructure.task_miss.service import TaskMissServiceImpl
 from app.infrastructure.task_params.models import SystemParameter
@@ -70,8 +70,7 @@ class TriggerConfigServiceImpl:
     def check_archive_capacity(self, user_id: str) -> dict:
         """[PRO-B-25] 보관함 적재 가능 여부를 MAX_ARCHIVE_LIMIT 기준으로 검증한다."""
         limit = TriggerSettings.max_archive_limit()
-        session_factory = get_session_factory()
-        with session_factory() as session:
+        with session_scope() as session:
             count = (
                 session.query(sqlfunc.count(TaskArchive.id))
                 .filter(TaskArchive.user_id == user_id)
@@ -96,9 +95,7 @@ class TriggerConfigServiceImpl:
             raise ValueError(f"[PRO-B-25] 변경 불가 파라미터: {key} (허용: {_ALLOWED_KEYS})")
 
         now = datetime.now(timezone.utc)
-        session_factory = get_session_factory()
-
-        with session_factory() as session:
+        with session_scope() as session:
             param = session.query(SystemParameter).filter(SystemParameter.key == key).first()
             if param is None:
                 raise ValueError(f"파라미터를 찾을 수 없습니다: {key}")
@@ -2,6 +2,7 @@
 FastAPI 애플리케이션 진입점.
 시작 시 환경 변수 로드, DB 초기화, 스케줄러 시작을 수행한다.
 """
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
@@ -9,6 +10,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config.env import load_env
+from app.core.middleware import RequestDBMiddleware
 
 load_env()
 logging.basicConfig(
@@ -20,9 +22,12 @@ logging.basicConfig(
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """앱 시작 시 DB 초기화 → 스케줄러 시작. 종료 시 스케줄러·Redis 정리."""
-    from app.core.database import init_db
+    """앱 시작 시 DB 초기화 → 스케줄러·공유 HTTP 클라이언트 시작. 종료 시 스케줄러·분석 이벤트 싱크·bcrypt 풀·Redis·HTTP 클라이언트·비동기 엔진 정리."""
+    from app.core.database import dispose_async_engine, init_db
+    from app.core.http import close_http_client, get_http_client
     from app.core.redis import close_redis
+    from app.domains.auth.password_pool import shutdown_password_pool
+    from app.infrastructure.chain.analytics_sink import shutdown_analytics_sink
     from app.infrastructure.task_miss import TaskMissScheduler
 
     init_db()
@@ -38,11 +43,16 @@ async def lifespan(app: FastAPI):
 
     scheduler = TaskMissScheduler()
     scheduler.start()
+    get_http_client()
 
     yield
 
     scheduler.shutdown()
+    await asyncio.to_thread(shutdown_analytics_sink)  # 남은 분석 이벤트 기록
+    shutdown_password_pool()
     close_redis()
+    await close_http_client()
+    await dispose_async_engine()
 
 
 app = FastAPI(
@@ -58,7 +68,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-DB-Checkouts"],  # 목록 API 키셋 커서, 요청당 DB 커넥션 체크아웃 수
 )
+app.add_middleware(RequestDBMiddleware)  # 요청 범위 DB 세션 (unit-of-work)
 
 
 
@@ -73,6 +85,7 @@ from app.infrastructure.experiment_config import router as experiment_config_rou
 from app.infrastructure.trigger_config import router as trigger_config_router  # noqa: E402 [PRO-B-25]
 from app.domains.TodayFocus.today_focus import router as today_focus_router  # noqa: E402
 from app.infrastructure.chain import router as chain_router  # noqa: E402 [PRO-B-41]
+from app.infrastructure.telemetry import router as telemetry_router  # noqa: E402
 
 app.include_router(
     auth_router,
@@ -138,3 +151,9 @@ app.include_router(
     prefix="/chain",
     tags=["Chain [PRO-B-41]"],
 )
+
+app.include_router(
+    telemetry_router,
+    prefix="/telemetry",
+    tags=["telemetry"],
+)
@@ -0,0 +1,107 @@
+"""
+인증 의존성 동시 처리량 벤치마크.
+
+기존(동기 Session을 async def 안에서 조회 → 이벤트 루프 블로킹)과
+현재(AsyncSession 조회) get_current_user 를 같은 조건에서 비교한다.
+DATABASE_URL 미지정 시 임시 SQLite를 쓰며, 네트워크 왕복이 있는 실제 효과는
+DATABASE_URL 을 Postgres로 지정해 측정한다 (스키마는 init_db 로 생성).
+
+주의: before 경로는 동시 요청 수가 동기 풀 크기(기본 5+10)를 넘으면 루프 위에서
+커넥션 체크아웃을 기다리다 반납까지 막혀 pool timeout(30s)까지 정지한다.
+기본 concurrency 를 풀 크기 이하로 둔 이유이며, 그 자체가 기존 구현의 문제다.
+
+실행 (backend/ 에서):
+    python -m scripts.bench_auth_throughput --requests 400 --concurrency 10
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+os.environ.setdefault("JWT_SECRET_KEY", "bench-secret")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/bench.db")
+
+import httpx  # noqa: E402
+from fastapi import Depends, FastAPI, HTTPException  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.core.database import get_db, get_session_factory, init_db  # noqa: E402
+from app.domains.auth import security  # noqa: E402
+from app.domains.auth.models import User  # noqa: E402
+
+
+async def _legacy_get_current_user(
+    token: str = Depends(security.oauth2_scheme),
+    db: Session = Depends(get_db),
+) -> User:
+    """기존 구현: async def 안에서 동기 db.query 실행."""
+    user_id = security._decode_user_id(token)
+    if user_id is None:
+        raise HTTPException(status_code=401)
+    user = db.query(User).filter(User.id == user_id).first()
+    if user is None:
+        raise HTTPException(status_code=401)
+    return user
+
+
+def _build_app(dependency) -> FastAPI:
+    probe = FastAPI()
+
+    @probe.get("/whoami")
+    async def whoami(user: User = Depends(dependency)):
+        return {"id": user.id}
+
+    return probe
+
+
+def _seed_user() -> str:
+    with get_session_factory()() as session:
+        user = User(email=f"bench-{time.time_ns()}@example.com", name="bench", provider="email")
+        session.add(user)
+        session.commit()
+        return security.create_access_token(data={"sub": str(user.id)})
+
+
+async def _run(app: FastAPI, token: str, total: int, concurrency: int) -> tuple[float, list[float]]:
+    headers = {"Authorization": f"Bearer {token}"}
+    latencies: list[float] = []
+    sem = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one() -> None:
+            async with sem:
+                t0 = time.perf_counter()
+                resp = await client.get("/whoami", headers=headers)
+                resp.raise_for_status()
+                latencies.append((time.perf_counter() - t0) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(total)))
+        elapsed = time.perf_counter() - started
+    return total / elapsed, latencies
+
+
+def _report(label: str, rps: float, latencies: list[float]) -> None:
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(f"{label:<10} {rps:10.1f} req/s   p50={statistics.median(latencies):7.2f}ms   p99={p99:7.2f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+
+    init_db()
+    token = _seed_user()
+
+    for label, dependency in (("before", _legacy_get_current_user), ("after", security.get_current_user)):
+        rps, latencies = asyncio.run(_run(_build_app(dependency), token, args.requests, args.concurrency))
+        _report(label, rps, latencies)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Chain 분석 이벤트 엔드포인트 지연 벤치마크.
+
+/chain/analytics/calendar-view, /sticker-exposed, /app-lifecycle 을 동시 요청으로 호출해
+요청 안에서 1건씩 커밋하던 방식(CHAIN_ANALYTICS_WRITE_BEHIND=false 와 동일)과
+write-behind 싱크(배치 INSERT)의 엔드포인트별 p50/p99 지연을 비교한다.
+DATABASE_URL 미지정 시 임시 SQLite를 사용한다 (커밋마다 fsync 가 있어 차이가 크게 보인다).
+
+실행 (backend/ 에서):
+    python -m scripts.bench_chain_analytics --requests 600 --concurrency 8
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+os.environ.setdefault("JWT_SECRET_KEY", "bench-secret")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/bench.db")
+
+import httpx  # noqa: E402
+from sqlalchemy import func, select  # noqa: E402
+
+from app.core.database import get_session_factory, init_db  # noqa: E402
+from app.domains.auth import security  # noqa: E402
+from app.domains.auth.models import User  # noqa: E402
+from app.infrastructure.chain import analytics_sink  # noqa: E402
+from app.infrastructure.chain.models import ChainAnalyticsLog  # noqa: E402
+from app.main import app  # noqa: E402
+
+_ENDPOINTS = [
+    ("calendar-view", "/chain/analytics/calendar-view", {"chain_length": 3}),
+    ("sticker-exposed", "/chain/analytics/sticker-exposed", {"sticker_grade_id": 2}),
+    ("app-lifecycle", "/chain/analytics/app-lifecycle", {"event_type": "app_paused"}),
+]
+
+
+def _seed_user() -> str:
+    with get_session_factory()() as session:
+        user = User(email=f"bench-{time.time_ns()}@example.com", name="bench", provider="email")
+        session.add(user)
+        session.commit()
+        return security.create_access_token(data={"sub": str(user.id)})
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * q))]
+
+
+async def _run(token: str, total: int, concurrency: int) -> dict[str, list[float]]:
+    headers = {"Authorization": f"Bearer {token}"}
+    latencies: dict[str, list[float]] = {name: [] for name, _, _ in _ENDPOINTS}
+    sem = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one(i: int) -> None:
+            name, path, body = _ENDPOINTS[i % len(_ENDPOINTS)]
+            async with sem:
+                t0 = time.perf_counter()
+                resp = await client.post(path, json=body, headers=headers)
+                resp.raise_for_status()
+                latencies[name].append((time.perf_counter() - t0) * 1000)
+
+        await asyncio.gather(*(one(i) for i in range(total)))
+    return latencies
+
+
+def _report(label: str, latencies: dict[str, list[float]]) -> None:
+    for name, samples in latencies.items():
+        print(f"  {label:<14} {name:<16} p50={_percentile(samples, 0.5):7.2f}ms   p99={_percentile(samples, 0.99):7.2f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=600)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    init_db()
+    token = _seed_user()
+    for label, write_behind in (("before: sync", False), ("after: batched", True)):
+        sink = analytics_sink._sink = analytics_sink.ChainAnalyticsSink(write_behind=write_behind)
+        asyncio.run(_run(token, len(_ENDPOINTS) * 5, args.concurrency))  # 워밍업
+        _report(label, asyncio.run(_run(token, args.requests, args.concurrency)))
+        analytics_sink.shutdown_analytics_sink()
+        stats = sink.stats()
+        print(f"  {label:<14} written={stats['written']} dropped={stats['dropped']} "
+              f"batches={stats['batches']} flush_ms_avg={stats['flush_ms_avg']}")
+
+    with get_session_factory()() as session:
+        rows = session.scalar(select(func.count(ChainAnalyticsLog.id)))
+    print(f"chain_analytics_logs rows: {rows} (expected {2 * (args.requests + len(_ENDPOINTS) * 5)})")
+
+
+if __name__ == "__main__":
+    main()
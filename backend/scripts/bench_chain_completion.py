@@ -0,0 +1,117 @@
+"""
+완료 1건당 일별 집계 비용 벤치마크.
+
+완료 이벤트가 N건(기본 10,000 / 50,000) 쌓인 사용자에게 완료를 반복 기록하며
+기존 방식(해당 날짜 이벤트 COUNT + DailyCompletion SELECT 후 갱신)과
+증분 upsert(INSERT ... ON CONFLICT DO UPDATE) 방식의 완료 1건당 지연을 비교한다.
+DATABASE_URL 미지정 시 임시 SQLite를 사용한다.
+
+실행 (backend/ 에서):
+    python -m scripts.bench_chain_completion --events 10000 50000 --repeat 200
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault("JWT_SECRET_KEY", "bench-secret")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/bench.db")
+
+from sqlalchemy import func, insert  # noqa: E402
+
+from app.core.database import get_session_factory, init_db  # noqa: E402
+from app.domains.auth.models import User  # noqa: E402
+from app.infrastructure.chain.chain_manager import ChainManager  # noqa: E402
+from app.infrastructure.chain.models import DailyCompletion, TaskCompletionEvent  # noqa: E402
+from app.infrastructure.chain.sticker_config import get_max_active_task_count  # noqa: E402
+from app.infrastructure.chain.sticker_grade import completed_count_to_sticker_grade_id  # noqa: E402
+
+
+def _seed(events: int, day: datetime) -> int:
+    """오늘 완료 이벤트 events 건을 가진 사용자를 만든다 (하루 이벤트가 많을수록 기존 방식의 COUNT가 커진다)."""
+    with get_session_factory()() as session:
+        user = User(email=f"bench-{time.time_ns()}@example.com", name="bench", provider="email")
+        session.add(user)
+        session.flush()
+        rows = [
+            {
+                "task_id": i,
+                "user_id": user.id,
+                "completed_at": day + timedelta(microseconds=i),
+                "idempotency_key": f"seed:{user.id}:{i}",
+            }
+            for i in range(events)
+        ]
+        for offset in range(0, events, 10_000):
+            session.execute(insert(TaskCompletionEvent), rows[offset:offset + 10_000])
+        session.commit()
+        return user.id
+
+
+def _legacy_record(user_id: int, completed_at: datetime, key: str) -> int:
+    """기존 방식: 이벤트 기록 후 해당 날짜 이벤트 전체 COUNT + DailyCompletion SELECT → 갱신."""
+    with get_session_factory()() as session:
+        session.add(TaskCompletionEvent(task_id=0, user_id=user_id, completed_at=completed_at, idempotency_key=key))
+        session.flush()
+        user = session.get(User, user_id)
+        user.last_task_completed_at = completed_at
+        start = datetime.combine(completed_at.date(), datetime.min.time(), tzinfo=timezone.utc)
+        count = session.query(func.count(TaskCompletionEvent.id)).filter(
+            TaskCompletionEvent.user_id == user_id,
+            TaskCompletionEvent.completed_at >= start,
+            TaskCompletionEvent.completed_at < start + timedelta(days=1),
+        ).scalar() or 0
+        daily_count = min(int(count), get_max_active_task_count())
+        dc = session.query(DailyCompletion).filter(
+            DailyCompletion.user_id == user_id, DailyCompletion.date == completed_at.date()
+        ).first()
+        if dc:
+            dc.completed_count = daily_count
+            dc.sticker_grade_id = completed_count_to_sticker_grade_id(daily_count)
+        else:
+            session.add(DailyCompletion(
+                user_id=user_id,
+                date=completed_at.date(),
+                completed_count=daily_count,
+                sticker_grade_id=completed_count_to_sticker_grade_id(daily_count),
+            ))
+        session.commit()
+        return daily_count
+
+
+def _timed(label: str, repeat: int, fn) -> None:
+    samples = []
+    for i in range(repeat):
+        t0 = time.perf_counter()
+        fn(i)
+        samples.append((time.perf_counter() - t0) * 1000)
+    samples.sort()
+    print(f"  {label:<28} median={samples[len(samples) // 2]:8.3f}ms   p95={samples[int(len(samples) * 0.95)]:8.3f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, nargs="+", default=[10_000, 50_000])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    init_db()
+    day = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    for events in args.events:
+        print(f"user with {events} completion events")
+        legacy_user = _seed(events, day)
+        _timed("before: recount per completion", args.repeat, lambda i: _legacy_record(
+            legacy_user, day + timedelta(hours=12, microseconds=i), f"legacy:{legacy_user}:{i}"
+        ))
+        user = _seed(events, day)
+        _timed("after: incremental upsert", args.repeat, lambda i: ChainManager.record_completion(
+            task_id=0,
+            user_id=user,
+            completed_at=day + timedelta(hours=12, microseconds=i),
+            idempotency_key=f"bench:{user}:{i}",
+        ))
+
+
+if __name__ == "__main__":
+    main()
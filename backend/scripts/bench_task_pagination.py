@@ -0,0 +1,121 @@
+"""
+할 일 목록 페이지네이션 벤치마크.
+
+사용자 1명에게 할 일 N건(기본 100,000)을 만들고, GET /tasks 한 번에 드는 비용을
+기존 방식(전체 .all() + 직렬화)과 키셋 첫 페이지 / 깊은 페이지 조회로 비교한다.
+DATABASE_URL 미지정 시 임시 SQLite를 사용한다.
+
+실행 (backend/ 에서):
+    python -m scripts.bench_task_pagination --tasks 100000 --limit 100
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+os.environ.setdefault("JWT_SECRET_KEY", "bench-secret")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/bench.db")
+
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy import insert, select  # noqa: E402
+
+from app.core.database import dispose_async_engine, get_async_session_factory, get_session_factory, init_db  # noqa: E402
+from app.domains.auth.models import User  # noqa: E402
+from app.domains.task.models import Task, TaskStatus  # noqa: E402
+from app.domains.task.repository import AsyncTaskRepository  # noqa: E402
+from app.domains.task.schemas import TaskResponse  # noqa: E402
+
+_serializer = TypeAdapter(list[TaskResponse])
+
+
+def _seed(total: int) -> int:
+    with get_session_factory()() as session:
+        user = User(email=f"bench-{time.time_ns()}@example.com", name="bench", provider="email")
+        session.add(user)
+        session.flush()
+        start = datetime.now() - timedelta(days=total // 5)
+        rows = [
+            {
+                "title": f"task {i}",
+                "user_id": user.id,
+                "status": TaskStatus.COMPLETED if i % 3 else TaskStatus.PENDING,
+                "due_date": start + timedelta(hours=(i // 5) * 24, minutes=i % 5),
+                "is_archived": False,
+            }
+            for i in range(total)
+        ]
+        for offset in range(0, total, 10_000):
+            session.execute(insert(Task), rows[offset:offset + 10_000])
+        session.commit()
+        return user.id
+
+
+async def _legacy_list(user_id: int) -> int:
+    """기존 방식: 활성 할 일 전체 조회 후 직렬화."""
+    async with get_async_session_factory()() as session:
+        stmt = (
+            select(Task)
+            .where(Task.user_id == user_id, Task.is_archived == False)  # noqa: E712
+            .order_by(Task.due_date.asc())
+        )
+        rows = list((await session.scalars(stmt)).all())
+        return len(_serializer.dump_json(rows))
+
+
+async def _page(user_id: int, limit: int, after=None) -> int:
+    """키셋 페이지 1개 조회 후 직렬화."""
+    async with get_async_session_factory()() as session:
+        page = await AsyncTaskRepository.list_active(session, user_id, limit, after)
+        return len(_serializer.dump_json(page.items))
+
+
+async def _timed(label: str, repeat: int, fn) -> None:
+    samples = []
+    size = 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        size = await fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    samples.sort()
+    print(f"{label:<32} median={samples[len(samples) // 2]:9.2f}ms   payload={size / 1024:9.1f}KiB")
+
+
+async def _run(user_id: int, limit: int, repeat: int) -> None:
+    await _timed("before: full list", max(1, repeat // 5), lambda: _legacy_list(user_id))
+    await _timed(f"after: first page (limit={limit})", repeat, lambda: _page(user_id, limit))
+
+    # 깊은 페이지: 중간 지점의 키를 커서로 사용 (OFFSET과 달리 앞선 행을 건너뛰며 읽지 않는다)
+    async with get_async_session_factory()() as session:
+        middle = (await session.execute(
+            select(Task.due_date, Task.id)
+            .where(Task.user_id == user_id)
+            .order_by(Task.due_date, Task.id)
+            .offset(await _count(session, user_id) // 2)
+            .limit(1)
+        )).one()
+    await _timed("after: middle page", repeat, lambda: _page(user_id, limit, tuple(middle)))
+    await dispose_async_engine()
+
+
+async def _count(session, user_id: int) -> int:
+    return await AsyncTaskRepository.count_for_day(session, user_id, datetime.min, datetime.max)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    init_db()
+    t0 = time.perf_counter()
+    user_id = _seed(args.tasks)
+    print(f"seeded {args.tasks} tasks in {time.perf_counter() - t0:.1f}s")
+    asyncio.run(_run(user_id, args.limit, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+로컬 Kakao OAuth 목 서버.
+/auth/kakao 흐름(토큰 교환 → 사용자 조회)을 실제 Kakao 없이 확인할 때 사용한다.
+토큰·사용자 API를 한 서버에서 제공하므로 두 base URL을 같은 주소로 지정한다.
+
+실행 (backend/ 에서):
+    python -m scripts.mock_kakao_server --port 8089
+    KAKAO_AUTH_BASE=http://127.0.0.1:8089 KAKAO_API_BASE=http://127.0.0.1:8089 \\
+    KAKAO_CLIENT_ID=mock KAKAO_REDIRECT_URI=http://localhost/cb uvicorn app.main:app
+
+--fail-first N 을 주면 처음 N번의 사용자 조회에 503을 돌려 재시도 동작을 확인할 수 있다.
+--fail-token-first N 은 처음 N번의 토큰 교환에 503을 돌린다 (1회성 POST 라 재시도되지 않고 그대로 실패해야 한다).
+"""
+import argparse
+import itertools
+import zlib
+from urllib.parse import parse_qs
+
+import uvicorn
+from fastapi import FastAPI, Header, Request, Response
+
+
+def build_app(fail_first: int = 0, fail_token_first: int = 0) -> FastAPI:
+    mock = FastAPI(title="Mock Kakao")
+    calls = itertools.count()
+    token_calls = itertools.count()
+
+    @mock.post("/oauth/token")
+    async def token(request: Request, response: Response):
+        if next(token_calls) < fail_token_first:
+            response.status_code = 503
+            return {"error": "mock_unavailable"}
+        form = parse_qs((await request.body()).decode())
+        code = form.get("code", [""])[0]
+        return {
+            "access_token": f"mock-access-{code}",
+            "token_type": "bearer",
+            "expires_in": 21599,
+            "refresh_token": f"mock-refresh-{code}",
+            "refresh_token_expires_in": 5183999,
+        }
+
+    @mock.get("/v2/user/me")
+    def me(response: Response, authorization: str = Header("")):
+        if next(calls) < fail_first:
+            response.status_code = 503
+            return {"msg": "mock unavailable"}
+        code = authorization.removeprefix("Bearer mock-access-")
+        return {
+            "id": zlib.crc32(code.encode()),
+            "kakao_account": {"email": f"{code}@kakao.mock", "profile": {"nickname": f"mock-{code}"}},
+            "properties": {"nickname": f"mock-{code}"},
+        }
+
+    return mock
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--fail-first", type=int, default=0)
+    parser.add_argument("--fail-token-first", type=int, default=0)
+    args = parser.parse_args()
+    uvicorn.run(build_app(args.fail_first, args.fail_token_first), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()